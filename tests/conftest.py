@@ -1,5 +1,6 @@
 """Shared pytest fixtures."""
 
+import copy
 from collections.abc import Callable
 from pathlib import Path
 from unittest.mock import Mock, PropertyMock, patch
@@ -10,19 +11,19 @@ import pytest
 # === Path Fixtures ===
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def fixtures_path() -> Path:
     """Path to test fixtures directory."""
     return Path(__file__).parent / "fixtures"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def config_fixtures_path(fixtures_path: Path) -> Path:
     """Path to config fixtures."""
     return fixtures_path / "config"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_plan_fixtures_path(fixtures_path: Path) -> Path:
     """Path to test plan fixtures."""
     return fixtures_path / "test_plans"
@@ -31,10 +32,27 @@ def test_plan_fixtures_path(fixtures_path: Path) -> Path:
 # === Mock Fixtures ===
 
 
+@pytest.fixture(scope="module")
+def _module_visa_resource() -> Mock:
+    """PyVISA resource mock built once per test module.
+
+    Spec'd against MessageBasedResource so instrument code cannot call
+    methods a real resource does not have.
+    """
+    from pyvisa.resources import MessageBasedResource
+
+    return Mock(spec=MessageBasedResource)
+
+
 @pytest.fixture
-def mock_visa_resource() -> Mock:
-    """Mock PyVISA resource."""
-    resource = Mock()
+def mock_visa_resource(_module_visa_resource: Mock) -> Mock:
+    """Mock PyVISA resource.
+
+    Shared across the module; call history, return values and side
+    effects are reset and the defaults below re-applied for every test.
+    """
+    resource = _module_visa_resource
+    resource.reset_mock(return_value=True, side_effect=True)
     resource.query.return_value = "Manufacturer,Model,Serial,1.0.0"
     resource.read.return_value = "response"
     resource.timeout = 5000
@@ -134,52 +152,79 @@ def equipment_model(mock_visa_connection: Mock):
 # === Test Plan Fixtures ===
 
 
-@pytest.fixture
+def _unmodified_for_session(plan):
+    """Yield a session-shared plan and fail teardown if a test mutated it."""
+    snapshot = copy.deepcopy(plan)
+    yield plan
+    assert plan == snapshot, f"Session-scoped test plan {plan.name!r} was mutated"
+
+
+@pytest.fixture(scope="session")
 def sample_power_supply_plan():
-    """Sample PowerSupply test plan."""
+    """Sample PowerSupply test plan (session-scoped; treat as read-only)."""
     from visa_vulture.model.test_plan import (
         PLAN_TYPE_POWER_SUPPLY,
         PowerSupplyTestStep,
         TestPlan,
     )
 
-    return TestPlan(
-        name="Test Plan",
-        plan_type=PLAN_TYPE_POWER_SUPPLY,
-        steps=[
-            PowerSupplyTestStep(
-                step_number=1, duration_seconds=1.0, voltage=5.0, current=1.0
-            ),
-            PowerSupplyTestStep(
-                step_number=2, duration_seconds=1.0, voltage=10.0, current=2.0
-            ),
-        ],
+    yield from _unmodified_for_session(
+        TestPlan(
+            name="Test Plan",
+            plan_type=PLAN_TYPE_POWER_SUPPLY,
+            steps=[
+                PowerSupplyTestStep(
+                    step_number=1, duration_seconds=1.0, voltage=5.0, current=1.0
+                ),
+                PowerSupplyTestStep(
+                    step_number=2, duration_seconds=1.0, voltage=10.0, current=2.0
+                ),
+            ],
+        )
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_signal_generator_plan():
-    """Sample SignalGenerator test plan."""
+    """Sample SignalGenerator test plan (session-scoped; treat as read-only)."""
     from visa_vulture.model.test_plan import (
         PLAN_TYPE_SIGNAL_GENERATOR,
         SignalGeneratorTestStep,
         TestPlan,
     )
 
-    return TestPlan(
-        name="SG Test Plan",
-        plan_type=PLAN_TYPE_SIGNAL_GENERATOR,
-        steps=[
-            SignalGeneratorTestStep(
-                step_number=1, duration_seconds=1.0, frequency=1e6, power=0
-            ),
-            SignalGeneratorTestStep(
-                step_number=2, duration_seconds=1.0, frequency=2e6, power=-10
-            ),
-        ],
+    yield from _unmodified_for_session(
+        TestPlan(
+            name="SG Test Plan",
+            plan_type=PLAN_TYPE_SIGNAL_GENERATOR,
+            steps=[
+                SignalGeneratorTestStep(
+                    step_number=1, duration_seconds=1.0, frequency=1e6, power=0
+                ),
+                SignalGeneratorTestStep(
+                    step_number=2, duration_seconds=1.0, frequency=2e6, power=-10
+                ),
+            ],
+        )
     )
 
 
+@pytest.fixture(scope="session")
+def valid_power_supply_result(test_plan_fixtures_path: Path):
+    """valid_power_supply.csv parsed once per session; treat as read-only."""
+    from visa_vulture.file_io.test_plan_reader import read_test_plan
+
+    return read_test_plan(test_plan_fixtures_path / "valid_power_supply.csv")
+
+
+@pytest.fixture(scope="session")
+def valid_signal_generator_result(test_plan_fixtures_path: Path):
+    """valid_signal_generator.csv parsed once per session; treat as read-only."""
+    from visa_vulture.file_io.test_plan_reader import read_test_plan
+
+    return read_test_plan(test_plan_fixtures_path / "valid_signal_generator.csv")
+
+
 # === Integration Test Fixtures ===
 
 
@@ -208,11 +253,8 @@ def visa_connection_sim(simulation_yaml_path: Path):
 # === Presenter Test Fixtures ===
 
 
-@pytest.fixture
-def mock_view() -> Mock:
-    """Mock MainWindow with callback capture and method tracking."""
-    view = Mock()
-
+def _configure_mock_view(view: Mock) -> None:
+    """Install callback capture, timer tracking and defaults on a view mock."""
     # Storage for callbacks (presenter sets these)
     view._callbacks = {
         "on_connect": None,
@@ -246,7 +288,11 @@ def mock_view() -> Mock:
     def mock_schedule(delay_ms: int, callback: Callable) -> str:
         view._timer_counter += 1
         timer_id = f"timer_{view._timer_counter}"
-        view._scheduled_callbacks[timer_id] = callback
+        if delay_ms == 0:
+            # Immediate hand-offs to the main thread run inline
+            callback()
+        else:
+            view._scheduled_callbacks[timer_id] = callback
         return timer_id
 
     def mock_cancel_schedule(timer_id: str) -> None:
@@ -255,31 +301,70 @@ def mock_view() -> Mock:
     view.schedule.side_effect = mock_schedule
     view.cancel_schedule.side_effect = mock_cancel_schedule
 
-    # Mock panel objects
-    view.power_supply_plot_panel = Mock()
-    view.signal_gen_plot_panel = Mock()
-    view.ps_table = Mock()
-    view.sg_table = Mock()
-    view.plot_notebook = Mock()
-
     # Default tab index (0 = Power Supply)
     view.get_selected_tab_index.return_value = 0
 
     # Defaults for start-from feature
     view.get_active_table_selected_step.return_value = None
     view.show_confirmation.return_value = True
-    view.set_start_from_enabled = Mock()
-    view.set_start_from_button_text = Mock()
+
+
+@pytest.fixture(scope="module")
+def _module_mock_view() -> Mock:
+    """MainWindow mock tree built once per test module.
+
+    The view and its panels are spec'd against the real widget classes so
+    a misspelt view method fails the test instead of silently recording.
+    """
+    from visa_vulture.view import MainWindow
+    from visa_vulture.view.plot_panel import (
+        PowerSupplyPlotPanel,
+        SignalGeneratorPlotPanel,
+    )
+    from visa_vulture.view.test_points_table import TestPointsTable
+
+    view = Mock(spec=MainWindow)
+    view._root = Mock()
+
+    # Mock panel objects. Named mocks are not attached as children, so
+    # panel calls are not also recorded in view.mock_calls (no test reads
+    # it); mock_view resets them separately.
+    view.power_supply_plot_panel = Mock(
+        spec=PowerSupplyPlotPanel, name="power_supply_plot_panel"
+    )
+    view.signal_gen_plot_panel = Mock(
+        spec=SignalGeneratorPlotPanel, name="signal_gen_plot_panel"
+    )
+    view.ps_table = Mock(spec=TestPointsTable, name="ps_table")
+    view.sg_table = Mock(spec=TestPointsTable, name="sg_table")
 
     return view
 
 
 @pytest.fixture
-def mock_model_for_presenter() -> Mock:
-    """Mock EquipmentModel with callback registration and state tracking."""
-    from visa_vulture.model import EquipmentState
+def mock_view(_module_mock_view: Mock) -> Mock:
+    """Mock MainWindow with callback capture and method tracking.
+
+    The mock tree is shared across the module; every test gets it back
+    with call history, return values and side effects reset and the
+    defaults below re-installed.
+    """
+    view = _module_mock_view
+    for mock in (
+        view,
+        view.power_supply_plot_panel,
+        view.signal_gen_plot_panel,
+        view.ps_table,
+        view.sg_table,
+    ):
+        mock.reset_mock(return_value=True, side_effect=True)
+    _configure_mock_view(view)
+    return view
 
-    model = Mock()
+
+def _configure_mock_model(model: Mock) -> None:
+    """Install state tracking and callback registration on a model mock."""
+    from visa_vulture.model import EquipmentState
 
     # State tracking via property
     model._current_state = EquipmentState.UNKNOWN
@@ -335,12 +420,39 @@ def mock_model_for_presenter() -> Mock:
 
     model.is_plan_type_compatible.side_effect = is_plan_type_compatible
 
-    return model
+
+@pytest.fixture(scope="module")
+def _module_mock_model() -> Mock:
+    """EquipmentModel mock built once per test module.
+
+    Spec'd against EquipmentModel so calls to methods the model does not
+    have fail the test.
+    """
+    from visa_vulture.model import EquipmentModel
+
+    return Mock(spec=EquipmentModel)
+
+
+@pytest.fixture
+def mock_model_for_presenter(_module_mock_model: Mock) -> Mock:
+    """Mock EquipmentModel with callback registration and state tracking.
+
+    Shared across the module like mock_view and reset the same way, so
+    callbacks registered by a previous test's presenter are dropped.
+    """
+    _module_mock_model.reset_mock(return_value=True, side_effect=True)
+    _configure_mock_model(_module_mock_model)
+    return _module_mock_model
 
 
 @pytest.fixture
 def presenter(mock_model_for_presenter: Mock, mock_view: Mock):
-    """Create presenter with mocked dependencies and synchronous task runner."""
+    """Create presenter with mocked dependencies and synchronous task runner.
+
+    Built per test, unlike the view/model mocks it wires into: its timer
+    and start-from state always start empty, so no test depends on
+    another having run first on the same pytest-xdist worker.
+    """
     from tests.unit.presenter_test_helpers import SynchronousTaskRunner
     from visa_vulture.presenter import EquipmentPresenter
 
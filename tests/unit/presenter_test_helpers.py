@@ -7,6 +7,26 @@ from visa_vulture.model import EquipmentState, TestStep
 from visa_vulture.utils.threading_helpers import TaskResult
 
 
+class FakeClock:
+    """
+    Manually advanced stand-in for time.monotonic().
+
+    Tests patch TimerManager's clock with now() so elapsed-time
+    assertions can be exact instead of tolerance windows.
+    """
+
+    def __init__(self, start: float = 1000.0) -> None:
+        self._now = start
+
+    def now(self) -> float:
+        """Return the current fake time in seconds."""
+        return self._now
+
+    def advance(self, seconds: float) -> None:
+        """Move the fake time forward by the given number of seconds."""
+        self._now += seconds
+
+
 class SynchronousTaskRunner:
     """
     Synchronous replacement for BackgroundTaskRunner.
@@ -54,6 +74,34 @@ def trigger_view_callback(view: Mock, callback_name: str, *args: Any) -> None:
         callback(*args)
 
 
+def get_view_callback(view: Mock, callback_name: str) -> Callable[..., None]:
+    """
+    Return a callback the presenter registered on the view.
+
+    For tests that fire the same view callback repeatedly.
+
+    Args:
+        view: Mock view with _callbacks dictionary
+        callback_name: Name of the callback (e.g., "on_run")
+    """
+    callback = view._callbacks[callback_name]
+    assert callback is not None, f"{callback_name} was never registered"
+    return callback
+
+
+def status_messages(target: Mock) -> str:
+    """
+    Join every message passed to target.set_status into one string.
+
+    Lets a test check whether any status update contained some text
+    with a single substring search.
+
+    Args:
+        target: Mock view or dialog whose set_status calls to collect
+    """
+    return "\x00".join(c.args[0] for c in target.set_status.call_args_list if c.args)
+
+
 def set_model_state(model: Mock, state: EquipmentState) -> None:
     """
     Set model state directly for test setup.
@@ -116,7 +164,7 @@ def setup_timer_running(presenter: Any, elapsed_seconds: float) -> None:
     """
     import time
 
-    presenter._timer._run_start_time = time.time() - elapsed_seconds
+    presenter._timer._run_start_time = time.monotonic() - elapsed_seconds
     presenter._timer._runtime_timer_id = "timer_active"
 
 
@@ -130,11 +178,16 @@ def execute_scheduled_callbacks(view: Mock) -> None:
     Execute all pending scheduled callbacks on the mock view.
 
     This simulates what would happen when Tkinter's after() fires.
-    Clears the scheduled callbacks after execution.
+    Clears the scheduled callbacks after execution. Zero-delay schedules
+    already ran inline, so only delayed callbacks (timer ticks, the
+    start-from hand-off) are pending here.
 
     Args:
         view: Mock view with _scheduled_callbacks dictionary
     """
+    if not view._scheduled_callbacks:
+        return
+
     # Copy to avoid modification during iteration
     callbacks = list(view._scheduled_callbacks.values())
     view._scheduled_callbacks.clear()
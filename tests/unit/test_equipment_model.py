@@ -1,20 +1,45 @@
 """Tests for the equipment model module."""
 
+import itertools
 import threading
 from unittest.mock import Mock, call, patch
 
 import pytest
 
+from visa_vulture.model import equipment as equipment_module
 from visa_vulture.model.equipment import EquipmentModel
 from visa_vulture.model.state_machine import EquipmentState
 from visa_vulture.model.test_plan import (
     PLAN_TYPE_POWER_SUPPLY,
     PLAN_TYPE_SIGNAL_GENERATOR,
+    AMModulationConfig,
+    FMModulationConfig,
+    ModulationType,
     PowerSupplyTestStep,
     SignalGeneratorTestStep,
     TestPlan,
 )
 
+IDLE, RUNNING, PAUSED, ERROR = (
+    EquipmentState.IDLE,
+    EquipmentState.RUNNING,
+    EquipmentState.PAUSED,
+    EquipmentState.ERROR,
+)
+
+# Expected (old, new) transitions for state-change assertions
+_IDLE_TO_RUNNING = (IDLE, RUNNING)
+_RUNNING_TO_IDLE = (RUNNING, IDLE)
+_RUNNING_TO_PAUSED = (RUNNING, PAUSED)
+_RUNNING_TO_ERROR = (RUNNING, ERROR)
+_PAUSED_TO_IDLE = (PAUSED, IDLE)
+_PAUSED_TO_RUNNING = (PAUSED, RUNNING)
+_PAUSED_TO_ERROR = (PAUSED, ERROR)
+_ERROR_TO_IDLE = (ERROR, IDLE)
+
+# Keep this module's tests on one worker under `pytest -n auto --dist loadgroup`
+pytestmark = pytest.mark.xdist_group(name="equipment_model")
+
 
 # --- Shared helpers for execution tests ---
 
@@ -64,6 +89,51 @@ def _make_model_with_signal_generator(
     return model, mock_sg
 
 
+class _StateChangeLog:
+    """Recorded state transitions, kept in order and as a set for membership checks."""
+
+    def __init__(self) -> None:
+        self.ordered: list[tuple[EquipmentState, EquipmentState]] = []
+        self.seen: set[tuple[EquipmentState, EquipmentState]] = set()
+
+    def record(self, old: EquipmentState, new: EquipmentState) -> None:
+        """State callback that records the (old, new) transition."""
+        self.ordered.append((old, new))
+        self.seen.add((old, new))
+
+
+def _sg_steps(
+    rows: list[tuple[int, float, float, bool]],
+) -> list[SignalGeneratorTestStep]:
+    """Build zero-duration signal generator steps.
+
+    Each row is (step_number, frequency, power, modulation_enabled).
+    """
+    return [
+        SignalGeneratorTestStep(
+            step_number=n,
+            duration_seconds=0.0,
+            frequency=f,
+            power=p,
+            modulation_enabled=m,
+        )
+        for n, f, p, m in rows
+    ]
+
+
+class _Collector:
+    """Accumulates completion callback results via a bound method."""
+
+    __slots__ = ("items",)
+
+    def __init__(self) -> None:
+        self.items: list[tuple[bool, str]] = []
+
+    def complete(self, success: bool, message: str) -> None:
+        """Completion callback that records (success, message)."""
+        self.items.append((success, message))
+
+
 def _make_zero_duration_power_supply_plan() -> TestPlan:
     """Create a power supply plan with zero-duration steps for fast tests."""
     return TestPlan(
@@ -90,6 +160,20 @@ def _make_zero_duration_signal_generator_plan() -> TestPlan:
     )
 
 
+@pytest.fixture(autouse=True)
+def _clear_model_callbacks(request: pytest.FixtureRequest):
+    """Drop callbacks registered on the equipment_model fixture after each test.
+
+    Releases the callback closures (and the mocks they capture) as soon as
+    the test finishes rather than when the failing frame is collected.
+    """
+    yield
+    model = request.node.funcargs.get("equipment_model")
+    if model is not None:
+        model._progress_callbacks.clear()
+        model._complete_callbacks.clear()
+
+
 class TestEquipmentModelInitialization:
     """Tests for EquipmentModel initialization."""
 
@@ -133,19 +217,23 @@ class TestEquipmentModelCallbacks:
         assert callback_calls[0] == (EquipmentState.UNKNOWN, EquipmentState.IDLE)
 
     def test_register_progress_callback(self, equipment_model: EquipmentModel) -> None:
-        """Progress callback can be registered."""
+        """Registered progress callback is called on progress notification."""
         callback = Mock()
         equipment_model.register_progress_callback(callback)
+        step = PowerSupplyTestStep(step_number=1, duration_seconds=0.0)
+
+        equipment_model._notify_progress(1, 1, step)
 
-        # Callback is stored (we can't easily verify without running a test)
-        assert callback in equipment_model._progress_callbacks
+        callback.assert_called_once_with(1, 1, step)
 
     def test_register_complete_callback(self, equipment_model: EquipmentModel) -> None:
-        """Complete callback can be registered."""
+        """Registered complete callback is called on completion notification."""
         callback = Mock()
         equipment_model.register_complete_callback(callback)
 
-        assert callback in equipment_model._complete_callbacks
+        equipment_model._notify_complete(True, "Test completed")
+
+        callback.assert_called_once_with(True, "Test completed")
 
 
 class TestEquipmentModelTestPlan:
@@ -718,7 +806,7 @@ class TestEquipmentModelRunTestExecution:
         from visa_vulture.instruments import PowerSupply
 
         model = EquipmentModel(mock_visa_connection)
-        _force_model_state(model, EquipmentState.IDLE)
+        _force_model_state(model, IDLE)
         model._test_plan = sample_power_supply_plan
         # Set up mock power supply instrument
         mock_ps = Mock(spec=PowerSupply)
@@ -727,16 +815,10 @@ class TestEquipmentModelRunTestExecution:
         model._instrument_type = "power_supply"
         return model
 
-    def _track_state_changes(
-        self, model: EquipmentModel
-    ) -> list[tuple[EquipmentState, EquipmentState]]:
+    def _track_state_changes(self, model: EquipmentModel) -> _StateChangeLog:
         """Register a callback that records state transitions."""
-        changes: list[tuple[EquipmentState, EquipmentState]] = []
-
-        def track(old: EquipmentState, new: EquipmentState) -> None:
-            changes.append((old, new))
-
-        model.register_state_callback(track)
+        changes = _StateChangeLog()
+        model.register_state_callback(changes.record)
         return changes
 
     def test_successful_execution_transitions(
@@ -746,10 +828,8 @@ class TestEquipmentModelRunTestExecution:
         model = self._make_model_at_idle(mock_visa_connection, sample_power_supply_plan)
         state_changes = self._track_state_changes(model)
 
-        complete_results: list[tuple[bool, str]] = []
-        model.register_complete_callback(
-            lambda success, msg: complete_results.append((success, msg))
-        )
+        collector = _Collector()
+        model.register_complete_callback(collector.complete)
 
         def mock_execute(start_step: int = 1) -> None:
             # Simulate successful execution (no exceptions, no stop)
@@ -758,11 +838,11 @@ class TestEquipmentModelRunTestExecution:
         with patch.object(model, "_execute_power_supply_plan", mock_execute):
             model.run_test()
 
-        assert model.state == EquipmentState.IDLE
-        assert (EquipmentState.IDLE, EquipmentState.RUNNING) in state_changes
-        assert (EquipmentState.RUNNING, EquipmentState.IDLE) in state_changes
-        assert len(complete_results) == 1
-        assert complete_results[0][0] is True
+        assert model.state == IDLE
+        assert _IDLE_TO_RUNNING in state_changes.seen
+        assert _RUNNING_TO_IDLE in state_changes.seen
+        assert len(collector.items) == 1
+        assert collector.items[0][0] is True
 
     def test_exception_during_execution_transitions_to_error(
         self, mock_visa_connection: Mock, sample_power_supply_plan: TestPlan
@@ -771,10 +851,8 @@ class TestEquipmentModelRunTestExecution:
         model = self._make_model_at_idle(mock_visa_connection, sample_power_supply_plan)
         state_changes = self._track_state_changes(model)
 
-        complete_results: list[tuple[bool, str]] = []
-        model.register_complete_callback(
-            lambda success, msg: complete_results.append((success, msg))
-        )
+        collector = _Collector()
+        model.register_complete_callback(collector.complete)
 
         def mock_execute(start_step: int = 1) -> None:
             raise RuntimeError("Instrument communication error")
@@ -783,13 +861,13 @@ class TestEquipmentModelRunTestExecution:
             with pytest.raises(RuntimeError, match="Instrument communication error"):
                 model.run_test()
 
-        assert model.state == EquipmentState.ERROR
-        assert (EquipmentState.IDLE, EquipmentState.RUNNING) in state_changes
-        assert (EquipmentState.RUNNING, EquipmentState.ERROR) in state_changes
+        assert model.state == ERROR
+        assert _IDLE_TO_RUNNING in state_changes.seen
+        assert _RUNNING_TO_ERROR in state_changes.seen
         # Finally block should NOT also transition (already in ERROR)
-        assert (EquipmentState.ERROR, EquipmentState.IDLE) not in state_changes
-        assert len(complete_results) == 1
-        assert complete_results[0][0] is False
+        assert _ERROR_TO_IDLE not in state_changes.seen
+        assert len(collector.items) == 1
+        assert collector.items[0][0] is False
 
     def test_stop_while_running_transitions_to_idle(
         self, mock_visa_connection: Mock, sample_power_supply_plan: TestPlan
@@ -798,10 +876,8 @@ class TestEquipmentModelRunTestExecution:
         model = self._make_model_at_idle(mock_visa_connection, sample_power_supply_plan)
         state_changes = self._track_state_changes(model)
 
-        complete_results: list[tuple[bool, str]] = []
-        model.register_complete_callback(
-            lambda success, msg: complete_results.append((success, msg))
-        )
+        collector = _Collector()
+        model.register_complete_callback(collector.complete)
 
         def mock_execute(start_step: int = 1) -> None:
             # Simulate stop requested during execution
@@ -810,11 +886,11 @@ class TestEquipmentModelRunTestExecution:
         with patch.object(model, "_execute_power_supply_plan", mock_execute):
             model.run_test()
 
-        assert model.state == EquipmentState.IDLE
-        assert (EquipmentState.IDLE, EquipmentState.RUNNING) in state_changes
-        assert (EquipmentState.RUNNING, EquipmentState.IDLE) in state_changes
-        assert len(complete_results) == 1
-        assert complete_results[0][0] is False  # Stopped, not successful
+        assert model.state == IDLE
+        assert _IDLE_TO_RUNNING in state_changes.seen
+        assert _RUNNING_TO_IDLE in state_changes.seen
+        assert len(collector.items) == 1
+        assert collector.items[0][0] is False  # Stopped, not successful
 
     def test_pause_transitions_to_paused(
         self, mock_visa_connection: Mock, sample_power_supply_plan: TestPlan
@@ -834,10 +910,10 @@ class TestEquipmentModelRunTestExecution:
         with patch.object(model, "_execute_power_supply_plan", mock_execute):
             model.run_test()
 
-        assert model.state == EquipmentState.IDLE
-        assert (EquipmentState.IDLE, EquipmentState.RUNNING) in state_changes
-        assert (EquipmentState.RUNNING, EquipmentState.PAUSED) in state_changes
-        assert (EquipmentState.PAUSED, EquipmentState.IDLE) in state_changes
+        assert model.state == IDLE
+        assert _IDLE_TO_RUNNING in state_changes.seen
+        assert _RUNNING_TO_PAUSED in state_changes.seen
+        assert _PAUSED_TO_IDLE in state_changes.seen
 
     def test_resume_from_paused_continues_execution(
         self, mock_visa_connection: Mock, sample_power_supply_plan: TestPlan
@@ -846,10 +922,8 @@ class TestEquipmentModelRunTestExecution:
         model = self._make_model_at_idle(mock_visa_connection, sample_power_supply_plan)
         state_changes = self._track_state_changes(model)
 
-        complete_results: list[tuple[bool, str]] = []
-        model.register_complete_callback(
-            lambda success, msg: complete_results.append((success, msg))
-        )
+        collector = _Collector()
+        model.register_complete_callback(collector.complete)
 
         def mock_execute(start_step: int = 1) -> None:
             # Simulate: pause, then resume, then complete
@@ -862,14 +936,14 @@ class TestEquipmentModelRunTestExecution:
         with patch.object(model, "_execute_power_supply_plan", mock_execute):
             model.run_test()
 
-        assert model.state == EquipmentState.IDLE
-        assert (EquipmentState.IDLE, EquipmentState.RUNNING) in state_changes
-        assert (EquipmentState.RUNNING, EquipmentState.PAUSED) in state_changes
-        assert (EquipmentState.PAUSED, EquipmentState.RUNNING) in state_changes
-        assert (EquipmentState.RUNNING, EquipmentState.IDLE) in state_changes
+        assert model.state == IDLE
+        assert _IDLE_TO_RUNNING in state_changes.seen
+        assert _RUNNING_TO_PAUSED in state_changes.seen
+        assert _PAUSED_TO_RUNNING in state_changes.seen
+        assert _RUNNING_TO_IDLE in state_changes.seen
         # Completed successfully after resume
-        assert len(complete_results) == 1
-        assert complete_results[0][0] is True
+        assert len(collector.items) == 1
+        assert collector.items[0][0] is True
 
     def test_exception_while_paused_transitions_to_error(
         self, mock_visa_connection: Mock, sample_power_supply_plan: TestPlan
@@ -878,10 +952,8 @@ class TestEquipmentModelRunTestExecution:
         model = self._make_model_at_idle(mock_visa_connection, sample_power_supply_plan)
         state_changes = self._track_state_changes(model)
 
-        complete_results: list[tuple[bool, str]] = []
-        model.register_complete_callback(
-            lambda success, msg: complete_results.append((success, msg))
-        )
+        collector = _Collector()
+        model.register_complete_callback(collector.complete)
 
         def mock_execute(start_step: int = 1) -> None:
             # Simulate: pause, then error
@@ -893,13 +965,13 @@ class TestEquipmentModelRunTestExecution:
             with pytest.raises(RuntimeError, match="Instrument lost connection"):
                 model.run_test()
 
-        assert model.state == EquipmentState.ERROR
-        assert (EquipmentState.RUNNING, EquipmentState.PAUSED) in state_changes
-        assert (EquipmentState.PAUSED, EquipmentState.ERROR) in state_changes
+        assert model.state == ERROR
+        assert _RUNNING_TO_PAUSED in state_changes.seen
+        assert _PAUSED_TO_ERROR in state_changes.seen
         # Finally block should NOT also transition (already in ERROR)
-        assert (EquipmentState.ERROR, EquipmentState.IDLE) not in state_changes
-        assert len(complete_results) == 1
-        assert complete_results[0][0] is False
+        assert _ERROR_TO_IDLE not in state_changes.seen
+        assert len(collector.items) == 1
+        assert collector.items[0][0] is False
 
 
 class TestEquipmentModelIdentification:
@@ -1069,6 +1141,8 @@ class TestOutputDisabledOnStopAndPause:
             if model._pause_requested:
                 model._stop_requested = True
                 model._pause_requested = False
+            if model._stop_requested:
+                return
             original_sleep(duration)
 
         with patch.object(model, "_interruptible_sleep", patched_sleep):
@@ -1145,6 +1219,8 @@ class TestOutputDisabledOnStopAndPause:
             if model._pause_requested:
                 model._stop_requested = True
                 model._pause_requested = False
+            if model._stop_requested:
+                return
             original_sleep(duration)
 
         with patch.object(model, "_interruptible_sleep", patched_sleep):
@@ -1156,8 +1232,6 @@ class TestOutputDisabledOnStopAndPause:
         self, mock_visa_connection: Mock
     ) -> None:
         """Stopping disables modulation when modulation was configured (safety test)."""
-        from visa_vulture.model.test_plan import AMModulationConfig, ModulationType
-
         # Create a plan with AM modulation configured
         plan_with_modulation = TestPlan(
             name="Modulated SG Plan",
@@ -1200,8 +1274,6 @@ class TestOutputDisabledOnStopAndPause:
         self, mock_visa_connection: Mock
     ) -> None:
         """Completing all steps disables both output and modulation."""
-        from visa_vulture.model.test_plan import FMModulationConfig, ModulationType
-
         # Create a plan with FM modulation configured
         plan_with_modulation = TestPlan(
             name="Modulated SG Plan",
@@ -1232,11 +1304,23 @@ class TestOutputDisabledOnStopAndPause:
         mock_sg.disable_output.assert_called_once()
 
 
+@pytest.fixture(scope="class")
+def _shared_enable_output() -> Mock:
+    """enable_output stand-in built once per test class."""
+    return Mock(spec=callable)
+
+
 class TestExecutePlanLoop:
     """Tests for the extracted _execute_plan_loop helper method."""
 
+    @pytest.fixture
+    def enable_output(self, _shared_enable_output: Mock):
+        """Shared enable_output mock, reset after each test."""
+        yield _shared_enable_output
+        _shared_enable_output.reset_mock()
+
     def test_sorts_steps_by_step_number(
-        self, mock_visa_connection: Mock
+        self, mock_visa_connection: Mock, enable_output: Mock
     ) -> None:
         """Steps are executed in step_number order regardless of input order."""
         model = EquipmentModel(mock_visa_connection)
@@ -1249,13 +1333,13 @@ class TestExecutePlanLoop:
         ]
 
         model._execute_plan_loop(
-            steps, 3, 1, lambda s: executed.append(s.step_number), Mock()
+            steps, 3, 1, lambda s: executed.append(s.step_number), enable_output
         )
 
         assert executed == [1, 2, 3]
 
     def test_skips_steps_before_start_step(
-        self, mock_visa_connection: Mock
+        self, mock_visa_connection: Mock, enable_output: Mock
     ) -> None:
         """Steps before start_step are not executed."""
         model = EquipmentModel(mock_visa_connection)
@@ -1268,12 +1352,14 @@ class TestExecutePlanLoop:
         ]
 
         model._execute_plan_loop(
-            steps, 3, 2, lambda s: executed.append(s.step_number), Mock()
+            steps, 3, 2, lambda s: executed.append(s.step_number), enable_output
         )
 
         assert executed == [2, 3]
 
-    def test_stops_on_stop_requested(self, mock_visa_connection: Mock) -> None:
+    def test_stops_on_stop_requested(
+        self, mock_visa_connection: Mock, enable_output: Mock
+    ) -> None:
         """Loop breaks when _stop_requested is set."""
         model = EquipmentModel(mock_visa_connection)
         executed: list[int] = []
@@ -1289,28 +1375,26 @@ class TestExecutePlanLoop:
             PowerSupplyTestStep(step_number=3, duration_seconds=0.0),
         ]
 
-        model._execute_plan_loop(steps, 3, 1, apply_step, Mock())
+        model._execute_plan_loop(steps, 3, 1, apply_step, enable_output)
 
         assert executed == [1, 2]
 
     def test_enables_output_on_start_step(
-        self, mock_visa_connection: Mock
+        self, mock_visa_connection: Mock, enable_output: Mock
     ) -> None:
         """enable_output is called exactly once, on the start_step."""
         model = EquipmentModel(mock_visa_connection)
-        enable_mock = Mock()
-
         steps = [
             PowerSupplyTestStep(step_number=1, duration_seconds=0.0),
             PowerSupplyTestStep(step_number=2, duration_seconds=0.0),
         ]
 
-        model._execute_plan_loop(steps, 2, 2, lambda s: None, enable_mock)
+        model._execute_plan_loop(steps, 2, 2, lambda s: None, enable_output)
 
-        enable_mock.assert_called_once()
+        enable_output.assert_called_once()
 
     def test_notifies_progress_for_each_step(
-        self, mock_visa_connection: Mock
+        self, mock_visa_connection: Mock, enable_output: Mock
     ) -> None:
         """_notify_progress is called for each executed step."""
         model = EquipmentModel(mock_visa_connection)
@@ -1324,7 +1408,7 @@ class TestExecutePlanLoop:
             PowerSupplyTestStep(step_number=2, duration_seconds=0.0),
         ]
 
-        model._execute_plan_loop(steps, 2, 1, lambda s: None, Mock())
+        model._execute_plan_loop(steps, 2, 1, lambda s: None, enable_output)
 
         assert progress_steps == [1, 2]
 
@@ -1440,8 +1524,6 @@ class TestSignalGeneratorExecutionPath:
         self, mock_visa_connection: Mock
     ) -> None:
         """Modulation is configured once at start and initially disabled."""
-        from visa_vulture.model.test_plan import AMModulationConfig, ModulationType
-
         am_config = AMModulationConfig(
             modulation_type=ModulationType.AM,
             modulation_frequency=1000.0,
@@ -1482,8 +1564,6 @@ class TestSignalGeneratorExecutionPath:
         self, mock_visa_connection: Mock
     ) -> None:
         """set_modulation_enabled is only called when state changes between steps."""
-        from visa_vulture.model.test_plan import AMModulationConfig, ModulationType
-
         am_config = AMModulationConfig(
             modulation_type=ModulationType.AM,
             modulation_frequency=1000.0,
@@ -1495,36 +1575,14 @@ class TestSignalGeneratorExecutionPath:
         plan = TestPlan(
             name="SG toggle test",
             plan_type=PLAN_TYPE_SIGNAL_GENERATOR,
-            steps=[
-                SignalGeneratorTestStep(
-                    step_number=1,
-                    duration_seconds=0.0,
-                    frequency=1e6,
-                    power=0.0,
-                    modulation_enabled=True,
-                ),
-                SignalGeneratorTestStep(
-                    step_number=2,
-                    duration_seconds=0.0,
-                    frequency=2e6,
-                    power=-5.0,
-                    modulation_enabled=True,
-                ),
-                SignalGeneratorTestStep(
-                    step_number=3,
-                    duration_seconds=0.0,
-                    frequency=3e6,
-                    power=-10.0,
-                    modulation_enabled=False,
-                ),
-                SignalGeneratorTestStep(
-                    step_number=4,
-                    duration_seconds=0.0,
-                    frequency=4e6,
-                    power=-15.0,
-                    modulation_enabled=False,
-                ),
-            ],
+            steps=_sg_steps(
+                [
+                    (1, 1e6, 0.0, True),
+                    (2, 2e6, -5.0, True),
+                    (3, 3e6, -10.0, False),
+                    (4, 4e6, -15.0, False),
+                ]
+            ),
             modulation_config=am_config,
         )
         model, mock_sg = _make_model_with_signal_generator(mock_visa_connection, plan)
@@ -1541,8 +1599,6 @@ class TestSignalGeneratorExecutionPath:
         self, mock_visa_connection: Mock
     ) -> None:
         """Every step triggers set_modulation_enabled when state alternates."""
-        from visa_vulture.model.test_plan import AMModulationConfig, ModulationType
-
         am_config = AMModulationConfig(
             modulation_type=ModulationType.AM,
             modulation_frequency=1000.0,
@@ -1552,29 +1608,13 @@ class TestSignalGeneratorExecutionPath:
         plan = TestPlan(
             name="SG alternating",
             plan_type=PLAN_TYPE_SIGNAL_GENERATOR,
-            steps=[
-                SignalGeneratorTestStep(
-                    step_number=1,
-                    duration_seconds=0.0,
-                    frequency=1e6,
-                    power=0.0,
-                    modulation_enabled=True,
-                ),
-                SignalGeneratorTestStep(
-                    step_number=2,
-                    duration_seconds=0.0,
-                    frequency=2e6,
-                    power=-5.0,
-                    modulation_enabled=False,
-                ),
-                SignalGeneratorTestStep(
-                    step_number=3,
-                    duration_seconds=0.0,
-                    frequency=3e6,
-                    power=-10.0,
-                    modulation_enabled=True,
-                ),
-            ],
+            steps=_sg_steps(
+                [
+                    (1, 1e6, 0.0, True),
+                    (2, 2e6, -5.0, False),
+                    (3, 3e6, -10.0, True),
+                ]
+            ),
             modulation_config=am_config,
         )
         model, mock_sg = _make_model_with_signal_generator(mock_visa_connection, plan)
@@ -1589,141 +1629,135 @@ class TestSignalGeneratorExecutionPath:
         ]
 
 
+@pytest.fixture
+def pause_test_ctx(
+    mock_visa_connection: Mock,
+) -> tuple[EquipmentModel, _StateChangeLog]:
+    """Model with a short timed power supply step that pauses when applied.
+
+    Tests register a state callback that runs the resume/stop action on
+    entering PAUSED and then call run_test().
+    """
+    plan = TestPlan(
+        name="Timed PS",
+        plan_type=PLAN_TYPE_POWER_SUPPLY,
+        steps=[
+            PowerSupplyTestStep(
+                step_number=1, duration_seconds=0.05, voltage=5.0, current=1.0
+            ),
+        ],
+    )
+    model, mock_ps = _make_model_with_power_supply(mock_visa_connection, plan)
+    mock_ps.set_voltage.side_effect = lambda voltage: model.pause_test()
+
+    state_changes = _StateChangeLog()
+    model.register_state_callback(state_changes.record)
+
+    return model, state_changes
+
+
 class TestInterruptibleSleep:
     """Tests for _interruptible_sleep() with actual timing.
 
     These test the pause/resume/stop logic within the sleep loop itself,
-    which is not exercised by zero-duration plan tests.
+    which is not exercised by zero-duration plan tests. The pause is
+    requested when the step is applied, and the follow-up action runs
+    synchronously on the execution thread from a state callback on entering
+    PAUSED, so no timer threads or fixed delays are needed. The cross-thread
+    test instead resumes or stops from the test thread while the runner is
+    blocked in the paused wait.
     """
 
+    @pytest.mark.parametrize(
+        ("action", "resumed"),
+        [("resume_test", True), ("stop_test", False)],
+        ids=["resume", "stop"],
+    )
+    def test_request_from_other_thread_wakes_paused_wait(
+        self,
+        pause_test_ctx: tuple[EquipmentModel, _StateChangeLog],
+        action: str,
+        resumed: bool,
+    ) -> None:
+        """A resume/stop from another thread wakes the runner's untimed wait."""
+        model, state_changes = pause_test_ctx
+        blocked = threading.Event()
+        real_wait = model._wake_event.wait
+
+        def signalling_wait(timeout: float | None = None) -> bool:
+            if timeout is None:
+                # Only the paused loop waits without a timeout
+                blocked.set()
+            return real_wait(timeout)
+
+        with patch.object(model._wake_event, "wait", side_effect=signalling_wait):
+            runner = threading.Thread(target=model.run_test, daemon=True)
+            runner.start()
+            assert blocked.wait(timeout=5.0), "runner never blocked while paused"
+            getattr(model, action)()
+            runner.join(timeout=5.0)
+
+        assert not runner.is_alive()
+        assert _RUNNING_TO_PAUSED in state_changes.seen
+        assert (_PAUSED_TO_RUNNING in state_changes.seen) is resumed
+        assert model.state == EquipmentState.IDLE
+
     def test_pause_during_sleep_transitions_to_paused(
-        self, mock_visa_connection: Mock
+        self, pause_test_ctx: tuple[EquipmentModel, _StateChangeLog]
     ) -> None:
         """Setting _pause_requested during a timed sleep transitions to PAUSED."""
-        plan = TestPlan(
-            name="Timed PS",
-            plan_type=PLAN_TYPE_POWER_SUPPLY,
-            steps=[
-                PowerSupplyTestStep(
-                    step_number=1, duration_seconds=2.0, voltage=5.0, current=1.0
-                ),
-            ],
+        model, state_changes = pause_test_ctx
+        model.register_state_callback(
+            lambda old, new: model.resume_test() if new is PAUSED else None
         )
-        model, mock_ps = _make_model_with_power_supply(mock_visa_connection, plan)
-
-        state_changes: list[tuple[EquipmentState, EquipmentState]] = []
-        model.register_state_callback(lambda old, new: state_changes.append((old, new)))
-
-        paused_event = threading.Event()
-
-        original_to_paused = model._state_machine.to_paused
-
-        def track_paused() -> None:
-            original_to_paused()
-            paused_event.set()
-
-        model._state_machine.to_paused = track_paused
-
-        def pause_then_resume() -> None:
-            model._pause_requested = True
-            # Wait until the model actually enters PAUSED
-            paused_event.wait(timeout=2.0)
-            # Then resume after a short delay
-            model._pause_requested = False
-
-        timer = threading.Timer(0.15, pause_then_resume)
-        timer.start()
 
         model.run_test()
-        timer.join()
 
-        assert (EquipmentState.RUNNING, EquipmentState.PAUSED) in state_changes
-        assert (EquipmentState.PAUSED, EquipmentState.RUNNING) in state_changes
+        assert _RUNNING_TO_PAUSED in state_changes.seen
+        assert _PAUSED_TO_RUNNING in state_changes.seen
 
     def test_stop_while_paused_during_sleep_exits(
-        self, mock_visa_connection: Mock
+        self, pause_test_ctx: tuple[EquipmentModel, _StateChangeLog]
     ) -> None:
         """Setting _stop_requested while paused during sleep exits the loop."""
-        plan = TestPlan(
-            name="Timed PS",
-            plan_type=PLAN_TYPE_POWER_SUPPLY,
-            steps=[
-                PowerSupplyTestStep(
-                    step_number=1, duration_seconds=5.0, voltage=5.0, current=1.0
-                ),
-            ],
+        model, state_changes = pause_test_ctx
+        # Stop while paused
+        model.register_state_callback(
+            lambda old, new: model.stop_test() if new is PAUSED else None
         )
-        model, mock_ps = _make_model_with_power_supply(mock_visa_connection, plan)
-
-        state_changes: list[tuple[EquipmentState, EquipmentState]] = []
-        model.register_state_callback(lambda old, new: state_changes.append((old, new)))
-
-        paused_event = threading.Event()
-
-        original_to_paused = model._state_machine.to_paused
-
-        def track_paused() -> None:
-            original_to_paused()
-            paused_event.set()
-
-        model._state_machine.to_paused = track_paused
-
-        def pause_then_stop() -> None:
-            model._pause_requested = True
-            paused_event.wait(timeout=2.0)
-            # Stop while paused
-            model._stop_requested = True
-            model._pause_requested = False
-
-        timer = threading.Timer(0.15, pause_then_stop)
-        timer.start()
+        collector = _Collector()
+        model.register_complete_callback(collector.complete)
 
         model.run_test()
-        timer.join()
 
-        assert (EquipmentState.RUNNING, EquipmentState.PAUSED) in state_changes
+        assert _RUNNING_TO_PAUSED in state_changes.seen
+        # Stop must not wake the loop as a resume would
+        assert _PAUSED_TO_RUNNING not in state_changes.seen
+        assert _PAUSED_TO_IDLE in state_changes.seen
         # Should end in IDLE (finally block) not stay PAUSED
         assert model.state == EquipmentState.IDLE
+        assert collector.items == [(False, "Test stopped by user")]
+        # The step was cut short: a resumed step clears the remaining time
+        assert model._time_remaining_in_step is not None
+        assert model._time_remaining_in_step > 0
 
     def test_remaining_time_tracked_during_pause(
-        self, mock_visa_connection: Mock
+        self, pause_test_ctx: tuple[EquipmentModel, _StateChangeLog]
     ) -> None:
         """_time_remaining_in_step is set when paused and cleared after resume."""
-        plan = TestPlan(
-            name="Timed PS",
-            plan_type=PLAN_TYPE_POWER_SUPPLY,
-            steps=[
-                PowerSupplyTestStep(
-                    step_number=1, duration_seconds=2.0, voltage=5.0, current=1.0
-                ),
-            ],
-        )
-        model, mock_ps = _make_model_with_power_supply(mock_visa_connection, plan)
-
+        model, _ = pause_test_ctx
         remaining_captured: list[float | None] = []
-        paused_event = threading.Event()
-
-        original_to_paused = model._state_machine.to_paused
-
-        def track_paused() -> None:
-            original_to_paused()
-            paused_event.set()
-
-        model._state_machine.to_paused = track_paused
 
-        def pause_capture_resume() -> None:
-            model._pause_requested = True
-            paused_event.wait(timeout=2.0)
+        def capture_then_resume(old: EquipmentState, new: EquipmentState) -> None:
+            if new is not PAUSED:
+                return
             # Capture remaining time while paused
             remaining_captured.append(model._time_remaining_in_step)
-            # Resume
-            model._pause_requested = False
+            model.resume_test()
 
-        timer = threading.Timer(0.15, pause_capture_resume)
-        timer.start()
+        model.register_state_callback(capture_then_resume)
 
         model.run_test()
-        timer.join()
 
         # Should have captured a remaining time value > 0 during pause
         assert len(remaining_captured) == 1
@@ -1733,102 +1767,186 @@ class TestInterruptibleSleep:
         assert model._time_remaining_in_step is None
 
 
+@pytest.fixture
+def running_model(mock_visa_connection: Mock) -> EquipmentModel:
+    """EquipmentModel forced into RUNNING state, fresh for each test."""
+    model = EquipmentModel(mock_visa_connection)
+    _force_model_state(model, EquipmentState.RUNNING)
+    return model
+
+
 class TestInterruptibleSleepDirect:
-    """Tests for _interruptible_sleep() with mocked time.sleep.
+    """Tests for _interruptible_sleep() with a mocked wake event and clock.
 
-    These complement the threading-based TestInterruptibleSleep tests above
+    These complement the timed TestInterruptibleSleep tests above
     by testing loop termination logic directly, without real timing delays.
-    A safeguard side_effect prevents infinite loops from hanging the test suite.
+    Each mocked wait advances a fake monotonic clock by its timeout, and a
+    safeguard stops the model after a fixed number of waits so that an
+    infinite loop cannot hang the test suite.
     """
 
     @staticmethod
-    def _make_safeguard(model: EquipmentModel, limit: int = 20):
-        """Return a side_effect that stops the model after *limit* sleep calls."""
-        call_count = 0
-
-        def safeguard(duration: float) -> None:
-            nonlocal call_count
-            call_count += 1
-            if call_count >= limit:
+    def _make_safeguard(model: EquipmentModel, clock: list[float], limit: int = 20):
+        """Return a wait side_effect that advances *clock*, stopping after *limit*."""
+        counter = itertools.count(1)
+
+        def safeguard(timeout: float | None = None) -> bool:
+            if timeout is not None:
+                clock[0] += timeout
+            if next(counter) >= limit:
                 model._stop_requested = True
+            return True
 
         return safeguard
 
     def test_stop_requested_before_entry_returns_immediately(
-        self, mock_visa_connection: Mock
+        self, running_model: EquipmentModel
     ) -> None:
         """Loop body never executes when _stop_requested is already True."""
-        model = EquipmentModel(mock_visa_connection)
-        _force_model_state(model, EquipmentState.RUNNING)
+        model = running_model
         model._stop_requested = True
+        clock = [0.0]
 
-        with patch("visa_vulture.model.equipment.time.sleep") as mock_sleep:
-            mock_sleep.side_effect = self._make_safeguard(model)
+        with (
+            patch.object(equipment_module.time, "monotonic", lambda: clock[0]),
+            patch.object(model._wake_event, "wait") as mock_wait,
+        ):
+            mock_wait.side_effect = self._make_safeguard(model, clock)
             model._interruptible_sleep(1.0)
 
-        assert mock_sleep.call_count == 0
+        assert mock_wait.call_count == 0
 
-    def test_remaining_decreases_each_iteration(
-        self, mock_visa_connection: Mock
-    ) -> None:
-        """Loop terminates after expected number of 0.1s chunks."""
-        model = EquipmentModel(mock_visa_connection)
-        _force_model_state(model, EquipmentState.RUNNING)
+    def test_waits_once_for_full_duration(self, running_model: EquipmentModel) -> None:
+        """An uninterrupted sleep is a single wait until the deadline."""
+        model = running_model
+        clock = [0.0]
 
-        with patch("visa_vulture.model.equipment.time.sleep") as mock_sleep:
-            mock_sleep.side_effect = self._make_safeguard(model)
+        with (
+            patch.object(equipment_module.time, "monotonic", lambda: clock[0]),
+            patch.object(model._wake_event, "wait") as mock_wait,
+        ):
+            mock_wait.side_effect = self._make_safeguard(model, clock)
             model._interruptible_sleep(0.3)
 
-        # 0.3s / 0.1 chunk = ~3 iterations (float rounding may give 3 or 4)
-        assert mock_sleep.call_count <= 5
+        mock_wait.assert_called_once_with(pytest.approx(0.3))
 
-    def test_zero_remaining_exits_loop(self, mock_visa_connection: Mock) -> None:
-        """duration=0.0 means the loop body never executes."""
-        model = EquipmentModel(mock_visa_connection)
-        _force_model_state(model, EquipmentState.RUNNING)
+    def test_short_step_waits_only_its_duration(
+        self, running_model: EquipmentModel
+    ) -> None:
+        """A step shorter than the old 0.1s poll interval is not rounded up."""
+        model = running_model
+        clock = [0.0]
+
+        with (
+            patch.object(equipment_module.time, "monotonic", lambda: clock[0]),
+            patch.object(model._wake_event, "wait") as mock_wait,
+        ):
+            mock_wait.side_effect = self._make_safeguard(model, clock)
+            model._interruptible_sleep(0.03)
+
+        mock_wait.assert_called_once_with(pytest.approx(0.03))
+        assert clock[0] == pytest.approx(0.03)
 
-        with patch("visa_vulture.model.equipment.time.sleep") as mock_sleep:
-            mock_sleep.side_effect = self._make_safeguard(model)
+    def test_zero_remaining_exits_loop(self, running_model: EquipmentModel) -> None:
+        """duration=0.0 means the loop never waits."""
+        model = running_model
+        clock = [0.0]
+
+        with (
+            patch.object(equipment_module.time, "monotonic", lambda: clock[0]),
+            patch.object(model._wake_event, "wait") as mock_wait,
+        ):
+            mock_wait.side_effect = self._make_safeguard(model, clock)
             model._interruptible_sleep(0.0)
 
-        assert mock_sleep.call_count == 0
+        assert mock_wait.call_count == 0
 
     def test_resume_from_pause_exits_inner_loop(
-        self, mock_visa_connection: Mock
+        self, running_model: EquipmentModel
     ) -> None:
         """Clearing _pause_requested exits the inner wait loop."""
-        model = EquipmentModel(mock_visa_connection)
-        _force_model_state(model, EquipmentState.RUNNING)
+        model = running_model
         model._pause_requested = True
+        clock = [0.0]
+        safeguard = self._make_safeguard(model, clock)
 
-        with patch("visa_vulture.model.equipment.time.sleep") as mock_sleep:
-            call_count = 0
-
-            def resume_then_safeguard(duration: float) -> None:
-                nonlocal call_count
-                call_count += 1
-                if call_count == 1:
-                    # First sleep is in the inner pause loop; simulate resume
-                    model._pause_requested = False
-                if call_count >= 20:
-                    model._stop_requested = True
+        def resume_then_safeguard(timeout: float | None = None) -> bool:
+            if timeout is None:
+                # Untimed wait is the inner pause loop; simulate resume
+                model._pause_requested = False
+            return safeguard(timeout)
 
-            mock_sleep.side_effect = resume_then_safeguard
+        with (
+            patch.object(equipment_module.time, "monotonic", lambda: clock[0]),
+            patch.object(model._wake_event, "wait") as mock_wait,
+        ):
+            mock_wait.side_effect = resume_then_safeguard
             model._interruptible_sleep(0.15)
 
-        # Inner loop: 1 call (then resumed), outer loop: ~2 calls for 0.15s
-        assert mock_sleep.call_count < 10
+        # Inner loop: 1 untimed wait, then one timed wait for the remaining 0.15s
+        assert mock_wait.call_count == 2
+        assert model.state == EquipmentState.RUNNING
+        assert model._time_remaining_in_step is None
+
+    def test_time_spent_paused_does_not_shorten_step(
+        self, running_model: EquipmentModel
+    ) -> None:
+        """After resume the step waits only for the time left when it paused."""
+        model = running_model
+        clock = [0.0]
+        timed_waits: list[float] = []
+
+        def wait(timeout: float | None = None) -> bool:
+            if timeout is None:
+                # Paused for a long time, then resumed
+                clock[0] += 10.0
+                model._pause_requested = False
+            else:
+                timed_waits.append(timeout)
+                if len(timed_waits) == 1:
+                    # Pause arrives 0.1s into the 0.3s step
+                    clock[0] += 0.1
+                    model._pause_requested = True
+                else:
+                    clock[0] += timeout
+            return True
+
+        with (
+            patch.object(equipment_module.time, "monotonic", lambda: clock[0]),
+            patch.object(model._wake_event, "wait", side_effect=wait),
+        ):
+            model._interruptible_sleep(0.3)
+
+        assert timed_waits == [pytest.approx(0.3), pytest.approx(0.2)]
+        assert clock[0] == pytest.approx(10.3)
+
+
+@pytest.fixture(scope="module")
+def _module_visa_connection() -> Mock:
+    """VISAConnection mock built once per module for read-only use."""
+    return Mock()
+
+
+@pytest.fixture
+def shared_visa_connection(_module_visa_connection: Mock) -> Mock:
+    """Module-wide VISAConnection mock with call history reset for each test.
+
+    Only for tests that never open/close the connection or set attributes
+    on it; those use the per-test mock_visa_connection fixture instead.
+    """
+    _module_visa_connection.reset_mock()
+    return _module_visa_connection
 
 
 class TestCallbackExceptionHandling:
     """Tests verifying callback exceptions are caught and don't propagate."""
 
     def test_progress_callback_exception_does_not_propagate(
-        self, mock_visa_connection: Mock
+        self, shared_visa_connection: Mock
     ) -> None:
         """Exception in progress callback is caught; execution still completes."""
         plan = _make_zero_duration_power_supply_plan()
-        model, mock_ps = _make_model_with_power_supply(mock_visa_connection, plan)
+        model, mock_ps = _make_model_with_power_supply(shared_visa_connection, plan)
 
         def bad_callback(current: int, total: int, step: object) -> None:
             raise RuntimeError("Callback exploded")
@@ -1846,11 +1964,11 @@ class TestCallbackExceptionHandling:
         assert complete_results[0][0] is True
 
     def test_complete_callback_exception_does_not_propagate(
-        self, mock_visa_connection: Mock
+        self, shared_visa_connection: Mock
     ) -> None:
         """Exception in complete callback is caught; run_test returns normally."""
         plan = _make_zero_duration_power_supply_plan()
-        model, mock_ps = _make_model_with_power_supply(mock_visa_connection, plan)
+        model, mock_ps = _make_model_with_power_supply(shared_visa_connection, plan)
 
         def bad_callback(success: bool, message: str) -> None:
             raise RuntimeError("Completion callback exploded")
@@ -1927,10 +2045,11 @@ class TestPlanTypeCompatibilityUnknownType:
     """Tests for is_plan_type_compatible with unknown plan types."""
 
     def test_unknown_plan_type_compatible_when_no_instrument(
-        self, equipment_model: EquipmentModel
+        self, shared_visa_connection: Mock
     ) -> None:
         """Unknown plan type is compatible when no instrument is connected."""
-        assert equipment_model.is_plan_type_compatible("some_future_type") is True
+        model = EquipmentModel(shared_visa_connection)
+        assert model.is_plan_type_compatible("some_future_type") is True
 
     def test_unknown_plan_type_compatible_with_connected_instrument(
         self, equipment_model: EquipmentModel, mock_visa_connection: Mock
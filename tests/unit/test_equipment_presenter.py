@@ -1,9 +1,11 @@
 """Tests for EquipmentPresenter."""
 
+from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
 
+from visa_vulture.file_io import TestPlanResult, read_test_plan
 from visa_vulture.model import (
     PLAN_TYPE_POWER_SUPPLY,
     PLAN_TYPE_SIGNAL_GENERATOR,
@@ -11,14 +13,20 @@ from visa_vulture.model import (
     PowerSupplyTestStep,
     SignalGeneratorTestStep,
     TestPlan,
+    TestStep,
 )
 from visa_vulture.presenter import EquipmentPresenter
+from visa_vulture.presenter import equipment_presenter as equipment_presenter_module
+from visa_vulture.presenter import timer_manager as timer_manager_module
 
 from .presenter_test_helpers import (
+    FakeClock,
     execute_scheduled_callbacks,
+    get_view_callback,
     set_model_state,
     setup_timer_paused,
     setup_timer_running,
+    status_messages,
     trigger_complete,
     trigger_progress,
     trigger_state_change,
@@ -26,6 +34,55 @@ from .presenter_test_helpers import (
 )
 
 
+@pytest.fixture
+def fake_clock():
+    """Replace the timer manager's monotonic clock with a FakeClock."""
+    clock = FakeClock()
+    with patch.object(timer_manager_module.time, "monotonic", clock.now):
+        yield clock
+
+
+@pytest.fixture(scope="session")
+def invalid_csv_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """CSV with an unrecognised header, written once per session."""
+    path = tmp_path_factory.mktemp("invalid_plan") / "invalid.csv"
+    path.write_text("invalid,header,only\n")
+    return path
+
+
+@pytest.fixture
+def cached_plan_reader(
+    monkeypatch: pytest.MonkeyPatch,
+    test_plan_fixtures_path: Path,
+    valid_power_supply_result: TestPlanResult,
+    valid_signal_generator_result: TestPlanResult,
+) -> None:
+    """Serve the valid fixture plans to the presenter from the session cache.
+
+    Any other path, or a load with soft limits, goes through the real reader.
+    """
+    cached = {
+        test_plan_fixtures_path / "valid_power_supply.csv": valid_power_supply_result,
+        test_plan_fixtures_path
+        / "valid_signal_generator.csv": valid_signal_generator_result,
+    }
+
+    def read_cached(file_path, soft_limits=None) -> TestPlanResult:
+        result = cached.get(Path(file_path))
+        if result is None or soft_limits is not None:
+            return read_test_plan(file_path, soft_limits=soft_limits)
+        return result
+
+    monkeypatch.setattr(equipment_presenter_module, "read_test_plan", read_cached)
+
+
+@pytest.fixture
+def idle_model(mock_model_for_presenter: Mock) -> Mock:
+    """Presenter model mock put in IDLE; tests may still override the state."""
+    set_model_state(mock_model_for_presenter, EquipmentState.IDLE)
+    return mock_model_for_presenter
+
+
 class TestPresenterInitialization:
     """Tests for presenter initialization and wiring."""
 
@@ -59,43 +116,44 @@ class TestPresenterInitialization:
 class TestStateTransitionHandling:
     """Tests for state change callbacks and view updates."""
 
-    def test_unknown_to_idle_updates_view(
-        self,
-        presenter: EquipmentPresenter,
-        mock_model_for_presenter: Mock,
-        mock_view: Mock,
-    ) -> None:
-        """State transition to IDLE updates displays and connection indicator."""
-        trigger_state_change(
-            mock_model_for_presenter, EquipmentState.UNKNOWN, EquipmentState.IDLE
-        )
-        execute_scheduled_callbacks(mock_view)
-
-        mock_view.set_state_display.assert_called_with("IDLE")
-        mock_view.set_buttons_for_state.assert_called_with("IDLE")
-        mock_view.set_connection_status.assert_called_with(True)
-
-    def test_idle_to_running_updates_view(
+    @pytest.mark.parametrize(
+        "old_state, new_state, connected",
+        [
+            (EquipmentState.UNKNOWN, EquipmentState.IDLE, True),
+            (EquipmentState.IDLE, EquipmentState.RUNNING, True),
+            (EquipmentState.RUNNING, EquipmentState.PAUSED, True),
+            (EquipmentState.IDLE, EquipmentState.ERROR, False),
+        ],
+        ids=[
+            "unknown_to_idle",
+            "idle_to_running",
+            "running_to_paused",
+            "idle_to_error",
+        ],
+    )
+    def test_state_change_updates_view(
         self,
         presenter: EquipmentPresenter,
         mock_model_for_presenter: Mock,
         mock_view: Mock,
+        old_state: EquipmentState,
+        new_state: EquipmentState,
+        connected: bool,
     ) -> None:
-        """State transition to RUNNING updates displays."""
-        set_model_state(mock_model_for_presenter, EquipmentState.IDLE)
-        trigger_state_change(
-            mock_model_for_presenter, EquipmentState.IDLE, EquipmentState.RUNNING
-        )
-        execute_scheduled_callbacks(mock_view)
+        """State transition updates displays and connection indicator."""
+        set_model_state(mock_model_for_presenter, old_state)
+        trigger_state_change(mock_model_for_presenter, old_state, new_state)
 
-        mock_view.set_state_display.assert_called_with("RUNNING")
-        mock_view.set_buttons_for_state.assert_called_with("RUNNING")
+        mock_view.set_state_display.assert_called_with(new_state.name)
+        mock_view.set_buttons_for_state.assert_called_with(new_state.name)
+        mock_view.set_connection_status.assert_called_with(connected)
 
     def test_running_to_paused_saves_elapsed(
         self,
         presenter: EquipmentPresenter,
         mock_model_for_presenter: Mock,
         mock_view: Mock,
+        fake_clock: FakeClock,
     ) -> None:
         """Transitioning to PAUSED saves elapsed time."""
         # Setup: simulate running with timer
@@ -105,65 +163,36 @@ class TestStateTransitionHandling:
         trigger_state_change(
             mock_model_for_presenter, EquipmentState.RUNNING, EquipmentState.PAUSED
         )
-        execute_scheduled_callbacks(mock_view)
 
         # Elapsed time should be saved
-        assert presenter._timer.elapsed_at_pause is not None
-        assert 29.0 <= presenter._timer.elapsed_at_pause <= 31.0
+        assert presenter._timer.elapsed_at_pause == 30.0
 
-    def test_running_to_idle_clears_timer(
+    @pytest.mark.parametrize(
+        "old_state, setup_timer, elapsed_seconds",
+        [
+            (EquipmentState.RUNNING, setup_timer_running, 10.0),
+            (EquipmentState.PAUSED, setup_timer_paused, 45.0),
+        ],
+        ids=["running_to_idle", "paused_to_idle"],
+    )
+    def test_stop_clears_timer_state(
         self,
         presenter: EquipmentPresenter,
         mock_model_for_presenter: Mock,
         mock_view: Mock,
+        old_state: EquipmentState,
+        setup_timer,
+        elapsed_seconds: float,
     ) -> None:
-        """Transitioning from RUNNING to IDLE clears timer state."""
-        # Setup: simulate running with timer
-        set_model_state(mock_model_for_presenter, EquipmentState.RUNNING)
-        setup_timer_running(presenter, elapsed_seconds=10.0)
+        """Transitioning to IDLE from RUNNING or PAUSED clears timer state."""
+        set_model_state(mock_model_for_presenter, old_state)
+        setup_timer(presenter, elapsed_seconds=elapsed_seconds)
 
-        trigger_state_change(
-            mock_model_for_presenter, EquipmentState.RUNNING, EquipmentState.IDLE
-        )
-        execute_scheduled_callbacks(mock_view)
+        trigger_state_change(mock_model_for_presenter, old_state, EquipmentState.IDLE)
 
-        # Timer state should be cleared
         assert presenter._timer.run_start_time is None
         assert presenter._timer.elapsed_at_pause is None
 
-    def test_paused_to_idle_clears_pause_state(
-        self,
-        presenter: EquipmentPresenter,
-        mock_model_for_presenter: Mock,
-        mock_view: Mock,
-    ) -> None:
-        """Stop while paused clears elapsed_at_pause."""
-        set_model_state(mock_model_for_presenter, EquipmentState.PAUSED)
-        setup_timer_paused(presenter, elapsed_seconds=45.0)
-
-        trigger_state_change(
-            mock_model_for_presenter, EquipmentState.PAUSED, EquipmentState.IDLE
-        )
-        execute_scheduled_callbacks(mock_view)
-
-        assert presenter._timer.elapsed_at_pause is None
-
-    def test_error_state_updates_view(
-        self,
-        presenter: EquipmentPresenter,
-        mock_model_for_presenter: Mock,
-        mock_view: Mock,
-    ) -> None:
-        """Transition to ERROR state updates displays."""
-        trigger_state_change(
-            mock_model_for_presenter, EquipmentState.IDLE, EquipmentState.ERROR
-        )
-        execute_scheduled_callbacks(mock_view)
-
-        mock_view.set_state_display.assert_called_with("ERROR")
-        mock_view.set_buttons_for_state.assert_called_with("ERROR")
-        mock_view.set_connection_status.assert_called_with(False)
-
 
 class TestResourceManagerDialogFlow:
     """Tests for resource manager dialog-based connection flow.
@@ -215,8 +244,7 @@ class TestResourceManagerDialogFlow:
         assert dialog._on_scan is not None
         dialog._on_scan()
 
-        calls = dialog.set_status.call_args_list
-        assert any("failed" in str(call).lower() for call in calls)
+        assert "failed" in status_messages(dialog).lower()
 
     def test_identify_calls_model_for_each_resource(
         self,
@@ -364,8 +392,7 @@ class TestResourceManagerDialogFlow:
         trigger_view_callback(mock_view, "on_connect")
 
         mock_view.set_connection_status.assert_called_with(True)
-        calls = mock_view.set_status.call_args_list
-        assert any("Connected" in str(call) for call in calls)
+        assert "Connected" in status_messages(mock_view)
 
     def test_connect_failure_shows_error(
         self,
@@ -432,6 +459,7 @@ class TestDisconnectHandler:
         mock_view.set_instrument_display.assert_called_with(None, None)
 
 
+@pytest.mark.usefixtures("cached_plan_reader")
 class TestLoadTestPlanInstrumentTypeValidation:
     """Tests for instrument type validation during test plan loading."""
 
@@ -515,6 +543,7 @@ class TestLoadTestPlanInstrumentTypeValidation:
         mock_model_for_presenter.load_test_plan.assert_called_once()
 
 
+@pytest.mark.usefixtures("cached_plan_reader")
 class TestLoadTestPlanHandler:
     """Tests for load test plan button handling."""
 
@@ -557,14 +586,10 @@ class TestLoadTestPlanHandler:
         presenter: EquipmentPresenter,
         mock_model_for_presenter: Mock,
         mock_view: Mock,
-        tmp_path,
+        invalid_csv_path: Path,
     ) -> None:
         """Loading invalid plan shows error dialog."""
-        # Create an invalid CSV file
-        invalid_file = tmp_path / "invalid.csv"
-        invalid_file.write_text("invalid,header,only\n")
-
-        trigger_view_callback(mock_view, "on_load_test_plan", str(invalid_file))
+        trigger_view_callback(mock_view, "on_load_test_plan", str(invalid_csv_path))
 
         mock_view.show_error.assert_called()
         mock_model_for_presenter.load_test_plan.assert_not_called()
@@ -625,8 +650,9 @@ class TestRunHandler:
     ) -> None:
         """Run with loaded plan calls model.run_test()."""
         set_model_state(mock_model_for_presenter, EquipmentState.IDLE)
-        mock_model_for_presenter._test_plan = sample_power_supply_plan
-        mock_model_for_presenter._instrument_type = "power_supply"
+        mock_model_for_presenter.configure_mock(
+            _test_plan=sample_power_supply_plan, _instrument_type="power_supply"
+        )
 
         trigger_view_callback(mock_view, "on_run")
 
@@ -641,8 +667,9 @@ class TestRunHandler:
     ) -> None:
         """Run starts runtime timer."""
         set_model_state(mock_model_for_presenter, EquipmentState.IDLE)
-        mock_model_for_presenter._test_plan = sample_power_supply_plan
-        mock_model_for_presenter._instrument_type = "power_supply"
+        mock_model_for_presenter.configure_mock(
+            _test_plan=sample_power_supply_plan, _instrument_type="power_supply"
+        )
 
         trigger_view_callback(mock_view, "on_run")
 
@@ -657,8 +684,9 @@ class TestRunHandler:
     ) -> None:
         """Run clears position indicator on pwoer supply plot for PS plan."""
         set_model_state(mock_model_for_presenter, EquipmentState.IDLE)
-        mock_model_for_presenter._test_plan = sample_power_supply_plan
-        mock_model_for_presenter._instrument_type = "power_supply"
+        mock_model_for_presenter.configure_mock(
+            _test_plan=sample_power_supply_plan, _instrument_type="power_supply"
+        )
 
         trigger_view_callback(mock_view, "on_run")
 
@@ -673,8 +701,9 @@ class TestRunHandler:
     ) -> None:
         """Run clears position on signal generator plot for SG plan."""
         set_model_state(mock_model_for_presenter, EquipmentState.IDLE)
-        mock_model_for_presenter._test_plan = sample_signal_generator_plan
-        mock_model_for_presenter._instrument_type = "signal_generator"
+        mock_model_for_presenter.configure_mock(
+            _test_plan=sample_signal_generator_plan, _instrument_type="signal_generator"
+        )
 
         trigger_view_callback(mock_view, "on_run")
 
@@ -704,8 +733,7 @@ class TestPauseHandler:
         """Pause button updates status."""
         trigger_view_callback(mock_view, "on_pause")
 
-        calls = mock_view.set_status.call_args_list
-        assert any("Paus" in str(call) for call in calls)
+        assert "Paus" in status_messages(mock_view)
 
 
 class TestStopHandler:
@@ -761,6 +789,7 @@ class TestResumeHandler:
         mock_model_for_presenter: Mock,
         mock_view: Mock,
         sample_power_supply_plan,
+        fake_clock: FakeClock,
     ) -> None:
         """Resume restores timer accounting for elapsed time."""
         set_model_state(mock_model_for_presenter, EquipmentState.PAUSED)
@@ -770,7 +799,7 @@ class TestResumeHandler:
         trigger_view_callback(mock_view, "on_run")
 
         # Start time should be set to account for 45 seconds already elapsed
-        assert presenter._timer.run_start_time is not None
+        assert presenter._timer.run_start_time == fake_clock.now() - 45.0
         # elapsed_at_pause should be cleared
         assert presenter._timer.elapsed_at_pause is None
 
@@ -787,8 +816,7 @@ class TestResumeHandler:
 
         trigger_view_callback(mock_view, "on_run")
 
-        calls = mock_view.set_status.call_args_list
-        assert any("Resum" in str(call) for call in calls)
+        assert "Resum" in status_messages(mock_view)
 
 
 class TestRuntimeTimer:
@@ -803,8 +831,9 @@ class TestRuntimeTimer:
     ) -> None:
         """Timer starts when run is initiated."""
         set_model_state(mock_model_for_presenter, EquipmentState.IDLE)
-        mock_model_for_presenter._test_plan = sample_power_supply_plan
-        mock_model_for_presenter._instrument_type = "power_supply"
+        mock_model_for_presenter.configure_mock(
+            _test_plan=sample_power_supply_plan, _instrument_type="power_supply"
+        )
 
         trigger_view_callback(mock_view, "on_run")
 
@@ -820,8 +849,9 @@ class TestRuntimeTimer:
     ) -> None:
         """Timer updates both runtime and remaining time displays."""
         set_model_state(mock_model_for_presenter, EquipmentState.IDLE)
-        mock_model_for_presenter._test_plan = sample_power_supply_plan
-        mock_model_for_presenter._instrument_type = "power_supply"
+        mock_model_for_presenter.configure_mock(
+            _test_plan=sample_power_supply_plan, _instrument_type="power_supply"
+        )
 
         trigger_view_callback(mock_view, "on_run")
 
@@ -844,7 +874,6 @@ class TestRuntimeTimer:
         trigger_state_change(
             mock_model_for_presenter, EquipmentState.RUNNING, EquipmentState.IDLE
         )
-        execute_scheduled_callbacks(mock_view)
 
         assert presenter._timer.run_start_time is None
 
@@ -854,6 +883,7 @@ class TestRuntimeTimer:
         mock_model_for_presenter: Mock,
         mock_view: Mock,
         sample_power_supply_plan,
+        fake_clock: FakeClock,
     ) -> None:
         """Pausing timer preserves display values."""
         set_model_state(mock_model_for_presenter, EquipmentState.RUNNING)
@@ -866,12 +896,12 @@ class TestRuntimeTimer:
         trigger_state_change(
             mock_model_for_presenter, EquipmentState.RUNNING, EquipmentState.PAUSED
         )
-        execute_scheduled_callbacks(mock_view)
 
         # Timer stopped but display not reset
         assert presenter._timer.runtime_timer_id is None
         # run_start_time preserved (not cleared like normal stop)
-        assert presenter._timer.run_start_time is not None
+        assert presenter._timer.run_start_time == fake_clock.now() - 30.0
+        assert presenter._timer.elapsed_at_pause == 30.0
 
     def test_multiple_pause_resume_cycles(
         self,
@@ -879,148 +909,142 @@ class TestRuntimeTimer:
         mock_model_for_presenter: Mock,
         mock_view: Mock,
         sample_power_supply_plan,
+        fake_clock: FakeClock,
     ) -> None:
         """Multiple pause/resume cycles accumulate time correctly."""
         set_model_state(mock_model_for_presenter, EquipmentState.IDLE)
         mock_model_for_presenter._test_plan = sample_power_supply_plan
 
+        on_run = get_view_callback(mock_view, "on_run")
+
         # Start run
-        trigger_view_callback(mock_view, "on_run")
-        initial_start = presenter._timer.run_start_time
+        on_run()
+        assert presenter._timer.run_start_time == fake_clock.now()
 
         # Simulate 10 seconds passing, then pause
-        setup_timer_running(presenter, elapsed_seconds=10.0)
+        fake_clock.advance(10.0)
         set_model_state(mock_model_for_presenter, EquipmentState.RUNNING)
         trigger_state_change(
             mock_model_for_presenter, EquipmentState.RUNNING, EquipmentState.PAUSED
         )
-        execute_scheduled_callbacks(mock_view)
 
-        first_pause_elapsed = presenter._timer.elapsed_at_pause
-        assert first_pause_elapsed is not None
-        assert 9.0 <= first_pause_elapsed <= 11.0
+        assert presenter._timer.elapsed_at_pause == 10.0
 
-        # Resume
+        # Time spent paused is not counted; resume
+        fake_clock.advance(60.0)
         set_model_state(mock_model_for_presenter, EquipmentState.PAUSED)
-        trigger_view_callback(mock_view, "on_run")
+        on_run()
 
         # elapsed_at_pause should be cleared
         assert presenter._timer.elapsed_at_pause is None
         # run_start_time should be adjusted
-        assert presenter._timer.run_start_time is not None
-
-
-class TestProgressCallback:
-    """Tests for test progress updates."""
+        assert presenter._timer.get_elapsed() == 10.0
 
-    def test_progress_updates_status_for_power_supply(
-        self,
-        presenter: EquipmentPresenter,
-        mock_model_for_presenter: Mock,
-        mock_view: Mock,
-    ) -> None:
-        """Progress callback updates status with power supply values."""
-        step = PowerSupplyTestStep(
-            step_number=3, duration_seconds=5.0, voltage=12.5, current=2.0
+        # Second cycle picks up where the first left off
+        fake_clock.advance(5.0)
+        set_model_state(mock_model_for_presenter, EquipmentState.RUNNING)
+        trigger_state_change(
+            mock_model_for_presenter, EquipmentState.RUNNING, EquipmentState.PAUSED
         )
 
-        trigger_progress(mock_model_for_presenter, current=3, total=5, step=step)
-        execute_scheduled_callbacks(mock_view)
+        assert presenter._timer.elapsed_at_pause == 15.0
 
-        status_call = mock_view.set_status.call_args[0][0]
-        assert "3/5" in status_call
-        assert "12.5" in status_call or "12.50" in status_call
-
-    def test_progress_updates_status_for_signal_generator(
-        self,
-        presenter: EquipmentPresenter,
-        mock_model_for_presenter: Mock,
-        mock_view: Mock,
-    ) -> None:
-        """Progress callback updates status with signal generator values."""
-        step = SignalGeneratorTestStep(
-            step_number=2, duration_seconds=5.0, frequency=1e6, power=-10.0
-        )
-
-        trigger_progress(mock_model_for_presenter, current=2, total=4, step=step)
-        execute_scheduled_callbacks(mock_view)
 
-        status_call = mock_view.set_status.call_args[0][0]
-        assert "2/4" in status_call
-        assert "MHz" in status_call
-        assert "dBm" in status_call
-
-    def test_progress_updates_power_supply_plot_position(
-        self,
-        presenter: EquipmentPresenter,
-        mock_model_for_presenter: Mock,
-        mock_view: Mock,
-    ) -> None:
-        """Progress updates position indicator on power supply plot."""
-        step = PowerSupplyTestStep(
-            step_number=1,
-            duration_seconds=5.0,
-            voltage=10.0,
-            current=1.0,
-            absolute_time_seconds=5.0,
-        )
+# Progress steps shared by TestProgressCallback; the presenter only reads them
+_PS_PROGRESS_STEP = PowerSupplyTestStep(
+    step_number=3,
+    duration_seconds=5.0,
+    voltage=12.5,
+    current=2.0,
+    absolute_time_seconds=5.0,
+)
+_SG_PROGRESS_STEP = SignalGeneratorTestStep(
+    step_number=2,
+    duration_seconds=7.5,
+    frequency=1e6,
+    power=-10.0,
+    absolute_time_seconds=7.5,
+)
 
-        trigger_progress(mock_model_for_presenter, current=1, total=3, step=step)
-        execute_scheduled_callbacks(mock_view)
 
-        mock_view.power_supply_plot_panel.set_current_position.assert_called_with(5.0)
+class TestProgressCallback:
+    """Tests for test progress updates."""
 
-    def test_progress_updates_signal_generator_plot_position(
+    @pytest.mark.parametrize(
+        "step, expected_fragments",
+        [
+            pytest.param(_PS_PROGRESS_STEP, ("3/5", "12.5"), id="power_supply"),
+            pytest.param(
+                _SG_PROGRESS_STEP, ("2/5", "MHz", "dBm"), id="signal_generator"
+            ),
+        ],
+    )
+    def test_progress_updates_status(
         self,
         presenter: EquipmentPresenter,
         mock_model_for_presenter: Mock,
         mock_view: Mock,
+        step: TestStep,
+        expected_fragments: tuple[str, ...],
     ) -> None:
-        """Progress updates position indicator on signal generator plot."""
-        step = SignalGeneratorTestStep(
-            step_number=1,
-            duration_seconds=7.5,
-            frequency=2e6,
-            power=-5.0,
-            absolute_time_seconds=7.5,
+        """Progress callback updates status with the step's values."""
+        trigger_progress(
+            mock_model_for_presenter, current=step.step_number, total=5, step=step
         )
 
-        trigger_progress(mock_model_for_presenter, current=1, total=2, step=step)
-        execute_scheduled_callbacks(mock_view)
-
-        mock_view.signal_gen_plot_panel.set_current_position.assert_called_with(7.5)
-
-    def test_progress_highlights_power_supply_table_row(
+        status_call = mock_view.set_status.call_args[0][0]
+        for fragment in expected_fragments:
+            assert fragment in status_call
+
+    @pytest.mark.parametrize(
+        "step, panel_name",
+        [
+            pytest.param(
+                _PS_PROGRESS_STEP, "power_supply_plot_panel", id="power_supply"
+            ),
+            pytest.param(
+                _SG_PROGRESS_STEP, "signal_gen_plot_panel", id="signal_generator"
+            ),
+        ],
+    )
+    def test_progress_updates_plot_position(
         self,
         presenter: EquipmentPresenter,
         mock_model_for_presenter: Mock,
         mock_view: Mock,
+        step: TestStep,
+        panel_name: str,
     ) -> None:
-        """Progress highlights current row in power supply table."""
-        step = PowerSupplyTestStep(
-            step_number=4, duration_seconds=5.0, voltage=20.0, current=3.0
+        """Progress updates position indicator on the matching plot."""
+        trigger_progress(
+            mock_model_for_presenter, current=step.step_number, total=5, step=step
         )
 
-        trigger_progress(mock_model_for_presenter, current=4, total=5, step=step)
-        execute_scheduled_callbacks(mock_view)
-
-        mock_view.ps_table.highlight_step.assert_called_with(4)
+        panel = getattr(mock_view, panel_name)
+        panel.set_current_position.assert_called_with(step.absolute_time_seconds)
 
-    def test_progress_highlights_signal_generator_table_row(
+    @pytest.mark.parametrize(
+        "step, table_name",
+        [
+            pytest.param(_PS_PROGRESS_STEP, "ps_table", id="power_supply"),
+            pytest.param(_SG_PROGRESS_STEP, "sg_table", id="signal_generator"),
+        ],
+    )
+    def test_progress_highlights_table_row(
         self,
         presenter: EquipmentPresenter,
         mock_model_for_presenter: Mock,
         mock_view: Mock,
+        step: TestStep,
+        table_name: str,
     ) -> None:
-        """Progress highlights current row in signal generator table."""
-        step = SignalGeneratorTestStep(
-            step_number=2, duration_seconds=5.0, frequency=3e6, power=-15.0
+        """Progress highlights the current row in the matching table."""
+        trigger_progress(
+            mock_model_for_presenter, current=step.step_number, total=5, step=step
         )
 
-        trigger_progress(mock_model_for_presenter, current=2, total=3, step=step)
-        execute_scheduled_callbacks(mock_view)
-
-        mock_view.sg_table.highlight_step.assert_called_with(2)
+        table = getattr(mock_view, table_name)
+        table.highlight_step.assert_called_with(step.step_number)
 
 
 class TestCompleteCallback:
@@ -1041,7 +1065,6 @@ class TestCompleteCallback:
             success=True,
             message="Test completed successfully",
         )
-        execute_scheduled_callbacks(mock_view)
 
         mock_view.show_info.assert_called_once()
 
@@ -1058,71 +1081,57 @@ class TestCompleteCallback:
         trigger_complete(
             mock_model_for_presenter, success=False, message="Connection lost"
         )
-        execute_scheduled_callbacks(mock_view)
 
         mock_view.show_error.assert_called_once()
 
-    def test_complete_clears_power_supply_plot_position(
-        self,
-        presenter: EquipmentPresenter,
-        mock_model_for_presenter: Mock,
-        mock_view: Mock,
-        sample_power_supply_plan,
-    ) -> None:
-        """Completion clears position indicator on power supply plot."""
-        mock_model_for_presenter._test_plan = sample_power_supply_plan
-
-        trigger_complete(mock_model_for_presenter, success=True, message="Done")
-        execute_scheduled_callbacks(mock_view)
-
-        mock_view.power_supply_plot_panel.clear_position.assert_called()
-
-    def test_complete_clears_signal_generator_plot_position(
-        self,
-        presenter: EquipmentPresenter,
-        mock_model_for_presenter: Mock,
-        mock_view: Mock,
-        sample_signal_generator_plan,
-    ) -> None:
-        """Completion clears position indicator on signal generator plot."""
-        mock_model_for_presenter._test_plan = sample_signal_generator_plan
-
-        trigger_complete(mock_model_for_presenter, success=True, message="Done")
-        execute_scheduled_callbacks(mock_view)
-
-        mock_view.signal_gen_plot_panel.clear_position.assert_called()
-
-    def test_complete_clears_power_supply_table_highlight(
-        self,
-        presenter: EquipmentPresenter,
-        mock_model_for_presenter: Mock,
-        mock_view: Mock,
-        sample_power_supply_plan,
-    ) -> None:
-        """Completion clears table row highlighting for power supply."""
-        mock_model_for_presenter._test_plan = sample_power_supply_plan
-
-        trigger_complete(mock_model_for_presenter, success=True, message="Done")
-        execute_scheduled_callbacks(mock_view)
-
-        mock_view.ps_table.clear_highlight.assert_called()
-
-    def test_complete_clears_signal_generator_table_highlight(
+    @pytest.mark.parametrize(
+        "plan_fixture, target_name, method_name",
+        [
+            pytest.param(
+                "sample_power_supply_plan",
+                "power_supply_plot_panel",
+                "clear_position",
+                id="power_supply_plot_position",
+            ),
+            pytest.param(
+                "sample_signal_generator_plan",
+                "signal_gen_plot_panel",
+                "clear_position",
+                id="signal_generator_plot_position",
+            ),
+            pytest.param(
+                "sample_power_supply_plan",
+                "ps_table",
+                "clear_highlight",
+                id="power_supply_table_highlight",
+            ),
+            pytest.param(
+                "sample_signal_generator_plan",
+                "sg_table",
+                "clear_highlight",
+                id="signal_generator_table_highlight",
+            ),
+        ],
+    )
+    def test_complete_clears_progress_indicators(
         self,
+        request: pytest.FixtureRequest,
         presenter: EquipmentPresenter,
         mock_model_for_presenter: Mock,
         mock_view: Mock,
-        sample_signal_generator_plan,
+        plan_fixture: str,
+        target_name: str,
+        method_name: str,
     ) -> None:
-        """Completion clears table row highlighting for signal generator."""
-        mock_model_for_presenter._test_plan = sample_signal_generator_plan
+        """Completion clears the plot position and table highlight for the plan."""
+        mock_model_for_presenter._test_plan = request.getfixturevalue(plan_fixture)
 
         trigger_complete(mock_model_for_presenter, success=True, message="Done")
-        execute_scheduled_callbacks(mock_view)
 
-        mock_view.sg_table.clear_highlight.assert_called()
+        getattr(getattr(mock_view, target_name), method_name).assert_called()
 
 
+@pytest.mark.usefixtures("idle_model")
 class TestInstrumentDisplay:
     """Tests for single-instrument identification display."""
 
@@ -1133,7 +1142,6 @@ class TestInstrumentDisplay:
         mock_view: Mock,
     ) -> None:
         """Connected instrument info is shown."""
-        set_model_state(mock_model_for_presenter, EquipmentState.IDLE)
         mock_model_for_presenter.get_instrument_identification.return_value = (
             "PS Model",
             "PS Tooltip",
@@ -1176,6 +1184,7 @@ class TestInstrumentDisplay:
         mock_model_for_presenter.get_instrument_identification.assert_called()
 
 
+@pytest.mark.usefixtures("idle_model")
 class TestShutdown:
     """Tests for clean shutdown sequence."""
 
@@ -1193,67 +1202,43 @@ class TestShutdown:
         assert presenter._timer.run_start_time is None
         mock_view.cancel_schedule.assert_called()
 
-    def test_shutdown_disconnects_if_connected(
-        self,
-        presenter: EquipmentPresenter,
-        mock_model_for_presenter: Mock,
-        mock_view: Mock,
-    ) -> None:
-        """Shutdown disconnects if in connected state."""
-        set_model_state(mock_model_for_presenter, EquipmentState.IDLE)
-
-        presenter.shutdown()
-
-        mock_model_for_presenter.disconnect.assert_called()
-
-    def test_shutdown_disconnects_if_running(
-        self,
-        presenter: EquipmentPresenter,
-        mock_model_for_presenter: Mock,
-        mock_view: Mock,
-    ) -> None:
-        """Shutdown disconnects if in RUNNING state."""
-        set_model_state(mock_model_for_presenter, EquipmentState.RUNNING)
-
-        presenter.shutdown()
-
-        mock_model_for_presenter.disconnect.assert_called()
-
-    def test_shutdown_skips_disconnect_if_not_connected(
+    @pytest.mark.parametrize(
+        "state,expect_disconnect,side_effect",
+        [
+            (EquipmentState.IDLE, True, None),
+            (EquipmentState.RUNNING, True, None),
+            (EquipmentState.UNKNOWN, False, None),
+            (EquipmentState.IDLE, True, Exception("Network error")),
+        ],
+        ids=["idle", "running", "not_connected", "disconnect_error"],
+    )
+    def test_shutdown_disconnect(
         self,
         presenter: EquipmentPresenter,
         mock_model_for_presenter: Mock,
-        mock_view: Mock,
+        state: EquipmentState,
+        expect_disconnect: bool,
+        side_effect: Exception | None,
     ) -> None:
-        """Shutdown skips disconnect if in UNKNOWN state."""
-        set_model_state(mock_model_for_presenter, EquipmentState.UNKNOWN)
-
-        presenter.shutdown()
-
-        mock_model_for_presenter.disconnect.assert_not_called()
-
-    def test_shutdown_handles_disconnect_error(
-        self,
-        presenter: EquipmentPresenter,
-        mock_model_for_presenter: Mock,
-        mock_view: Mock,
-    ) -> None:
-        """Shutdown handles disconnect errors gracefully."""
-        set_model_state(mock_model_for_presenter, EquipmentState.IDLE)
-        mock_model_for_presenter.disconnect.side_effect = Exception("Network error")
+        """Shutdown disconnects only when connected and swallows disconnect errors."""
+        set_model_state(mock_model_for_presenter, state)
+        mock_model_for_presenter.disconnect.side_effect = side_effect
 
         # Should not raise
         presenter.shutdown()
 
+        assert mock_model_for_presenter.disconnect.called is expect_disconnect
+
 
+@pytest.mark.usefixtures("idle_model")
 class TestStartFromHandler:
     """Tests for Start from / Resume from button handling."""
 
     def test_wires_callback(
         self, presenter: EquipmentPresenter, mock_view: Mock
     ) -> None:
-        """Presenter registers start_from callback on view."""
-        assert mock_view._callbacks["on_start_from"] is not None
+        """Presenter registers its start_from handler on view."""
+        assert mock_view._callbacks["on_start_from"] == presenter._handle_start_from
 
     def test_no_selection_shows_error(
         self,
@@ -1262,9 +1247,8 @@ class TestStartFromHandler:
         mock_view: Mock,
     ) -> None:
         """Start from with no selected step shows error."""
-        set_model_state(mock_model_for_presenter, EquipmentState.IDLE)
         mock_view.get_active_table_selected_step.return_value = None
-        trigger_view_callback(mock_view, "on_start_from")
+        presenter._handle_start_from()
         mock_view.show_error.assert_called()
 
     def test_no_plan_shows_error(
@@ -1274,10 +1258,9 @@ class TestStartFromHandler:
         mock_view: Mock,
     ) -> None:
         """Start from with no test plan shows error."""
-        set_model_state(mock_model_for_presenter, EquipmentState.IDLE)
         mock_view.get_active_table_selected_step.return_value = 3
         mock_model_for_presenter._test_plan = None
-        trigger_view_callback(mock_view, "on_start_from")
+        presenter._handle_start_from()
         mock_view.show_error.assert_called()
 
     def test_shows_confirmation(
@@ -1288,11 +1271,10 @@ class TestStartFromHandler:
         sample_power_supply_plan: TestPlan,
     ) -> None:
         """Start from shows confirmation dialog with step details."""
-        set_model_state(mock_model_for_presenter, EquipmentState.IDLE)
         mock_view.get_active_table_selected_step.return_value = 2
         mock_model_for_presenter._test_plan = sample_power_supply_plan
         mock_view.show_confirmation.return_value = False
-        trigger_view_callback(mock_view, "on_start_from")
+        presenter._handle_start_from()
         mock_view.show_confirmation.assert_called_once()
 
     def test_cancelled_does_nothing(
@@ -1303,12 +1285,11 @@ class TestStartFromHandler:
         sample_power_supply_plan: TestPlan,
     ) -> None:
         """Cancelling confirmation does not start test."""
-        set_model_state(mock_model_for_presenter, EquipmentState.IDLE)
         mock_view.get_active_table_selected_step.return_value = 2
         mock_model_for_presenter._test_plan = sample_power_supply_plan
         mock_view.show_confirmation.return_value = False
-        trigger_view_callback(mock_view, "on_start_from")
-        mock_model_for_presenter.run_test_from_step.assert_not_called()
+        presenter._handle_start_from()
+        mock_model_for_presenter.run_test.assert_not_called()
 
     def test_confirmed_runs_from_step(
         self,
@@ -1318,11 +1299,10 @@ class TestStartFromHandler:
         sample_power_supply_plan: TestPlan,
     ) -> None:
         """Confirming starts test from selected step."""
-        set_model_state(mock_model_for_presenter, EquipmentState.IDLE)
         mock_view.get_active_table_selected_step.return_value = 2
         mock_model_for_presenter._test_plan = sample_power_supply_plan
         mock_view.show_confirmation.return_value = True
-        trigger_view_callback(mock_view, "on_start_from")
+        presenter._handle_start_from()
         mock_model_for_presenter.run_test.assert_called_once_with(2)
 
     def test_paused_stops_first(
@@ -1337,7 +1317,7 @@ class TestStartFromHandler:
         mock_view.get_active_table_selected_step.return_value = 2
         mock_model_for_presenter._test_plan = sample_power_supply_plan
         mock_view.show_confirmation.return_value = True
-        trigger_view_callback(mock_view, "on_start_from")
+        presenter._handle_start_from()
         mock_model_for_presenter.stop_test.assert_called_once()
         assert presenter._pending_start_from is not None
 
@@ -1355,7 +1335,7 @@ class TestStartFromHandler:
         mock_model_for_presenter._test_plan = sample_power_supply_plan
         mock_view.show_confirmation.return_value = True
 
-        trigger_view_callback(mock_view, "on_start_from")
+        presenter._handle_start_from()
 
         # Simulate the callback order that happens in the model:
         # State change fires first (clears pending, sets suppress flag)
@@ -1370,7 +1350,7 @@ class TestStartFromHandler:
         # Verify suppress flag was cleared
         assert presenter._suppress_next_completion is False
 
-        # Execute any scheduled callbacks and verify no error dialog was shown
+        # Execute the delayed start-from callback and verify no error dialog was shown
         execute_scheduled_callbacks(mock_view)
         mock_view.show_error.assert_not_called()
 
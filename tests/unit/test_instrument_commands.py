@@ -11,6 +11,23 @@ import pytest
 
 from visa_vulture.instruments.power_supply import PowerSupply
 from visa_vulture.instruments.signal_generator import SignalGenerator
+from visa_vulture.model.test_plan import (
+    AMModulationConfig,
+    FMModulationConfig,
+    ModulationConfig,
+    ModulationType,
+)
+
+_AM_CONFIG = AMModulationConfig(
+    modulation_type=ModulationType.AM,
+    modulation_frequency=1000.0,
+    depth=50.0,
+)
+_FM_CONFIG = FMModulationConfig(
+    modulation_type=ModulationType.FM,
+    modulation_frequency=500.0,
+    deviation=10000.0,
+)
 
 
 def _make_connected_power_supply(mock_resource: Mock) -> PowerSupply:
@@ -27,62 +44,93 @@ def _make_connected_signal_generator(mock_resource: Mock) -> SignalGenerator:
     return sg
 
 
+@pytest.fixture(scope="module")
+def _module_power_supply(_module_visa_resource: Mock) -> PowerSupply:
+    """Power supply connected once per module to the shared resource mock."""
+    return _make_connected_power_supply(_module_visa_resource)
+
+
+@pytest.fixture(scope="module")
+def _module_signal_generator(_module_visa_resource: Mock) -> SignalGenerator:
+    """Signal generator connected once per module to the shared resource mock."""
+    return _make_connected_signal_generator(_module_visa_resource)
+
+
+@pytest.fixture
+def power_supply(
+    _module_power_supply: PowerSupply, mock_visa_resource: Mock
+) -> PowerSupply:
+    """Connected power supply whose resource mock starts each test reset.
+
+    The instrument keeps no state beyond its resource and IDN string, so
+    one connected instance serves every test; connect()'s *IDN? query is
+    not in the per-test call history.
+    """
+    return _module_power_supply
+
+
+@pytest.fixture
+def signal_generator(
+    _module_signal_generator: SignalGenerator, mock_visa_resource: Mock
+) -> SignalGenerator:
+    """Connected signal generator whose resource mock starts each test reset."""
+    return _module_signal_generator
+
+
 class TestPowerSupplyMeasurements:
     """Tests for power supply measurement and query methods."""
 
     def test_measure_voltage_sends_correct_query(
-        self, mock_visa_resource: Mock
+        self, mock_visa_resource: Mock, power_supply: PowerSupply
     ) -> None:
         """measure_voltage sends MEAS:VOLT? and returns parsed float."""
         mock_visa_resource.query.return_value = "5.123456\n"
-        ps = _make_connected_power_supply(mock_visa_resource)
 
-        result = ps.measure_voltage()
+        result = power_supply.measure_voltage()
 
         mock_visa_resource.query.assert_called_with("MEAS:VOLT?")
         assert result == pytest.approx(5.123456)
 
     def test_measure_current_sends_correct_query(
-        self, mock_visa_resource: Mock
+        self, mock_visa_resource: Mock, power_supply: PowerSupply
     ) -> None:
         """measure_current sends MEAS:CURR? and returns parsed float."""
         mock_visa_resource.query.return_value = "1.500000\n"
-        ps = _make_connected_power_supply(mock_visa_resource)
 
-        result = ps.measure_current()
+        result = power_supply.measure_current()
 
         mock_visa_resource.query.assert_called_with("MEAS:CURR?")
-        assert result == pytest.approx(1.5)
+        assert result == 1.5
 
     def test_measure_power_returns_voltage_times_current(
-        self, mock_visa_resource: Mock
+        self, mock_visa_resource: Mock, power_supply: PowerSupply
     ) -> None:
         """measure_power returns measured voltage * measured current."""
-        mock_visa_resource.query.side_effect = lambda cmd: {
-            "MEAS:VOLT?": "5.0\n",
-            "MEAS:CURR?": "2.0\n",
-        }[cmd]
-        ps = _make_connected_power_supply(mock_visa_resource)
+        mock_visa_resource.query.side_effect = ["5.0\n", "2.0\n"]
 
-        result = ps.measure_power()
+        result = power_supply.measure_power()
 
-        assert result == pytest.approx(10.0)
+        assert mock_visa_resource.query.call_args_list == [
+            call("MEAS:VOLT?"),
+            call("MEAS:CURR?"),
+        ]
+        assert result == 10.0
 
     def test_get_status_returns_complete_dict(
-        self, mock_visa_resource: Mock
+        self, mock_visa_resource: Mock, power_supply: PowerSupply
     ) -> None:
         """get_status returns dict with voltage, current, and output state."""
-        mock_visa_resource.query.side_effect = lambda cmd: {
-            "VOLT?": "12.0\n",
-            "CURR?": "3.0\n",
-            "OUTP?": "1\n",
-        }[cmd]
-        ps = _make_connected_power_supply(mock_visa_resource)
+        mock_visa_resource.query.side_effect = ["12.0\n", "3.0\n", "1\n"]
 
-        status = ps.get_status()
+        status = power_supply.get_status()
 
-        assert status["voltage"] == pytest.approx(12.0)
-        assert status["current"] == pytest.approx(3.0)
+        assert mock_visa_resource.query.call_args_list == [
+            call("VOLT?"),
+            call("CURR?"),
+            call("OUTP?"),
+        ]
+        assert status["voltage"] == 12.0
+        assert status["current"] == 3.0
         assert status["output_enabled"] is True
 
 
@@ -90,240 +138,147 @@ class TestSignalGeneratorAMModulation:
     """Tests for AM modulation SCPI commands."""
 
     def test_configure_am_modulation_sends_correct_commands(
-        self, mock_visa_resource: Mock
+        self, mock_visa_resource: Mock, signal_generator: SignalGenerator
     ) -> None:
         """configure_am_modulation sends source, frequency, and depth commands."""
-        sg = _make_connected_signal_generator(mock_visa_resource)
-
-        sg.configure_am_modulation(modulation_frequency=1000.0, depth=50.0)
+        signal_generator.configure_am_modulation(
+            modulation_frequency=1000.0, depth=50.0
+        )
 
-        write_calls = mock_visa_resource.write.call_args_list
-        # Filter to only AM-related writes (skip *IDN? etc from connect)
-        am_calls = [c for c in write_calls if "AM:" in str(c)]
-        assert call("AM:SOUR INT") in am_calls
-        assert call("AM:INT:FREQ 1000.0") in am_calls
-        assert call("AM:DEPT 50.0") in am_calls
+        assert mock_visa_resource.write.call_args_list == [
+            call("AM:SOUR INT"),
+            call("AM:INT:FREQ 1000.0"),
+            call("AM:DEPT 50.0"),
+        ]
 
     def test_enable_am_modulation_sends_command(
-        self, mock_visa_resource: Mock
+        self, mock_visa_resource: Mock, signal_generator: SignalGenerator
     ) -> None:
         """enable_am_modulation sends AM:STAT 1."""
-        sg = _make_connected_signal_generator(mock_visa_resource)
-
-        sg.enable_am_modulation()
+        signal_generator.enable_am_modulation()
 
         mock_visa_resource.write.assert_called_with("AM:STAT 1")
 
     def test_disable_am_modulation_sends_command(
-        self, mock_visa_resource: Mock
+        self, mock_visa_resource: Mock, signal_generator: SignalGenerator
     ) -> None:
         """disable_am_modulation sends AM:STAT 0."""
-        sg = _make_connected_signal_generator(mock_visa_resource)
-
-        sg.disable_am_modulation()
+        signal_generator.disable_am_modulation()
 
         mock_visa_resource.write.assert_called_with("AM:STAT 0")
 
-    def test_is_am_enabled_returns_true_for_1(
-        self, mock_visa_resource: Mock
-    ) -> None:
-        """is_am_enabled returns True when response is '1'."""
-        mock_visa_resource.query.return_value = "1\n"
-        sg = _make_connected_signal_generator(mock_visa_resource)
-
-        assert sg.is_am_enabled() is True
-
-    def test_is_am_enabled_returns_true_for_on(
-        self, mock_visa_resource: Mock
-    ) -> None:
-        """is_am_enabled returns True when response is 'ON'."""
-        mock_visa_resource.query.return_value = "ON\n"
-        sg = _make_connected_signal_generator(mock_visa_resource)
-
-        assert sg.is_am_enabled() is True
-
-    def test_is_am_enabled_returns_false_for_0(
-        self, mock_visa_resource: Mock
-    ) -> None:
-        """is_am_enabled returns False when response is '0'."""
-        mock_visa_resource.query.return_value = "0\n"
-        sg = _make_connected_signal_generator(mock_visa_resource)
-
-        assert sg.is_am_enabled() is False
-
 
 class TestSignalGeneratorFMModulation:
     """Tests for FM modulation SCPI commands."""
 
     def test_configure_fm_modulation_sends_correct_commands(
-        self, mock_visa_resource: Mock
+        self, mock_visa_resource: Mock, signal_generator: SignalGenerator
     ) -> None:
         """configure_fm_modulation sends source, frequency, and deviation commands."""
-        sg = _make_connected_signal_generator(mock_visa_resource)
-
-        sg.configure_fm_modulation(modulation_frequency=500.0, deviation=10000.0)
+        signal_generator.configure_fm_modulation(
+            modulation_frequency=500.0, deviation=10000.0
+        )
 
-        write_calls = mock_visa_resource.write.call_args_list
-        fm_calls = [c for c in write_calls if "FM:" in str(c)]
-        assert call("FM:SOUR INT") in fm_calls
-        assert call("FM:INT:FREQ 500.0") in fm_calls
-        assert call("FM:DEV 10000.0") in fm_calls
+        assert mock_visa_resource.write.call_args_list == [
+            call("FM:SOUR INT"),
+            call("FM:INT:FREQ 500.0"),
+            call("FM:DEV 10000.0"),
+        ]
 
     def test_enable_fm_modulation_sends_command(
-        self, mock_visa_resource: Mock
+        self, mock_visa_resource: Mock, signal_generator: SignalGenerator
     ) -> None:
         """enable_fm_modulation sends FM:STAT 1."""
-        sg = _make_connected_signal_generator(mock_visa_resource)
-
-        sg.enable_fm_modulation()
+        signal_generator.enable_fm_modulation()
 
         mock_visa_resource.write.assert_called_with("FM:STAT 1")
 
     def test_disable_fm_modulation_sends_command(
-        self, mock_visa_resource: Mock
+        self, mock_visa_resource: Mock, signal_generator: SignalGenerator
     ) -> None:
         """disable_fm_modulation sends FM:STAT 0."""
-        sg = _make_connected_signal_generator(mock_visa_resource)
-
-        sg.disable_fm_modulation()
+        signal_generator.disable_fm_modulation()
 
         mock_visa_resource.write.assert_called_with("FM:STAT 0")
 
-    def test_is_fm_enabled_returns_true_for_1(
-        self, mock_visa_resource: Mock
-    ) -> None:
-        """is_fm_enabled returns True when response is '1'."""
-        mock_visa_resource.query.return_value = "1\n"
-        sg = _make_connected_signal_generator(mock_visa_resource)
-
-        assert sg.is_fm_enabled() is True
 
-    def test_is_fm_enabled_returns_false_for_0(
-        self, mock_visa_resource: Mock
+class TestSignalGeneratorModulationState:
+    """Tests for AM/FM modulation state queries."""
+
+    @pytest.mark.parametrize(
+        "method_name, response, expected",
+        [
+            ("is_am_enabled", "1\n", True),
+            ("is_am_enabled", "ON\n", True),
+            ("is_am_enabled", "0\n", False),
+            ("is_fm_enabled", "1\n", True),
+            ("is_fm_enabled", "0\n", False),
+        ],
+    )
+    def test_modulation_state_query_parses_response(
+        self,
+        mock_visa_resource: Mock,
+        signal_generator: SignalGenerator,
+        method_name: str,
+        response: str,
+        expected: bool,
     ) -> None:
-        """is_fm_enabled returns False when response is '0'."""
-        mock_visa_resource.query.return_value = "0\n"
-        sg = _make_connected_signal_generator(mock_visa_resource)
+        """is_am_enabled/is_fm_enabled treat '1' and 'ON' as enabled."""
+        mock_visa_resource.query.return_value = response
 
-        assert sg.is_fm_enabled() is False
+        assert getattr(signal_generator, method_name)() is expected
 
 
 class TestSignalGeneratorModulationDispatch:
     """Tests for generic modulation dispatch methods."""
 
     def test_configure_modulation_dispatches_am(
-        self, mock_visa_resource: Mock
+        self, mock_visa_resource: Mock, signal_generator: SignalGenerator
     ) -> None:
         """configure_modulation calls configure_am_modulation for AM config."""
-        from visa_vulture.model.test_plan import AMModulationConfig, ModulationType
+        signal_generator.configure_modulation(_AM_CONFIG)
 
-        sg = _make_connected_signal_generator(mock_visa_resource)
-        config = AMModulationConfig(
-            modulation_type=ModulationType.AM,
-            modulation_frequency=1000.0,
-            depth=50.0,
-        )
-
-        sg.configure_modulation(config)
-
-        write_calls = [str(c) for c in mock_visa_resource.write.call_args_list]
-        assert any("AM:SOUR INT" in c for c in write_calls)
-        assert any("AM:DEPT 50.0" in c for c in write_calls)
+        write_calls = mock_visa_resource.write.call_args_list
+        assert call("AM:SOUR INT") in write_calls
+        assert call("AM:DEPT 50.0") in write_calls
 
     def test_configure_modulation_dispatches_fm(
-        self, mock_visa_resource: Mock
+        self, mock_visa_resource: Mock, signal_generator: SignalGenerator
     ) -> None:
         """configure_modulation calls configure_fm_modulation for FM config."""
-        from visa_vulture.model.test_plan import FMModulationConfig, ModulationType
-
-        sg = _make_connected_signal_generator(mock_visa_resource)
-        config = FMModulationConfig(
-            modulation_type=ModulationType.FM,
-            modulation_frequency=500.0,
-            deviation=10000.0,
-        )
-
-        sg.configure_modulation(config)
-
-        write_calls = [str(c) for c in mock_visa_resource.write.call_args_list]
-        assert any("FM:SOUR INT" in c for c in write_calls)
-        assert any("FM:DEV 10000.0" in c for c in write_calls)
-
-    def test_set_modulation_enabled_am_enable(
-        self, mock_visa_resource: Mock
-    ) -> None:
-        """set_modulation_enabled enables AM modulation."""
-        from visa_vulture.model.test_plan import AMModulationConfig, ModulationType
-
-        sg = _make_connected_signal_generator(mock_visa_resource)
-        config = AMModulationConfig(
-            modulation_type=ModulationType.AM,
-            modulation_frequency=1000.0,
-            depth=50.0,
-        )
-
-        sg.set_modulation_enabled(config, True)
-
-        mock_visa_resource.write.assert_called_with("AM:STAT 1")
-
-    def test_set_modulation_enabled_am_disable(
-        self, mock_visa_resource: Mock
-    ) -> None:
-        """set_modulation_enabled disables AM modulation."""
-        from visa_vulture.model.test_plan import AMModulationConfig, ModulationType
-
-        sg = _make_connected_signal_generator(mock_visa_resource)
-        config = AMModulationConfig(
-            modulation_type=ModulationType.AM,
-            modulation_frequency=1000.0,
-            depth=50.0,
-        )
-
-        sg.set_modulation_enabled(config, False)
-
-        mock_visa_resource.write.assert_called_with("AM:STAT 0")
-
-    def test_set_modulation_enabled_fm_enable(
-        self, mock_visa_resource: Mock
-    ) -> None:
-        """set_modulation_enabled enables FM modulation."""
-        from visa_vulture.model.test_plan import FMModulationConfig, ModulationType
-
-        sg = _make_connected_signal_generator(mock_visa_resource)
-        config = FMModulationConfig(
-            modulation_type=ModulationType.FM,
-            modulation_frequency=500.0,
-            deviation=10000.0,
-        )
-
-        sg.set_modulation_enabled(config, True)
+        signal_generator.configure_modulation(_FM_CONFIG)
 
-        mock_visa_resource.write.assert_called_with("FM:STAT 1")
-
-    def test_set_modulation_enabled_fm_disable(
-        self, mock_visa_resource: Mock
+        write_calls = mock_visa_resource.write.call_args_list
+        assert call("FM:SOUR INT") in write_calls
+        assert call("FM:DEV 10000.0") in write_calls
+
+    @pytest.mark.parametrize(
+        "config, enabled, expected_command",
+        [
+            pytest.param(_AM_CONFIG, True, "AM:STAT 1", id="am_enable"),
+            pytest.param(_AM_CONFIG, False, "AM:STAT 0", id="am_disable"),
+            pytest.param(_FM_CONFIG, True, "FM:STAT 1", id="fm_enable"),
+            pytest.param(_FM_CONFIG, False, "FM:STAT 0", id="fm_disable"),
+        ],
+    )
+    def test_set_modulation_enabled(
+        self,
+        mock_visa_resource: Mock,
+        signal_generator: SignalGenerator,
+        config: ModulationConfig,
+        enabled: bool,
+        expected_command: str,
     ) -> None:
-        """set_modulation_enabled disables FM modulation."""
-        from visa_vulture.model.test_plan import FMModulationConfig, ModulationType
-
-        sg = _make_connected_signal_generator(mock_visa_resource)
-        config = FMModulationConfig(
-            modulation_type=ModulationType.FM,
-            modulation_frequency=500.0,
-            deviation=10000.0,
-        )
+        """set_modulation_enabled toggles the state of the config's modulation."""
+        signal_generator.set_modulation_enabled(config, enabled)
 
-        sg.set_modulation_enabled(config, False)
-
-        mock_visa_resource.write.assert_called_with("FM:STAT 0")
+        mock_visa_resource.write.assert_called_with(expected_command)
 
     def test_disable_all_modulation_disables_both(
-        self, mock_visa_resource: Mock
+        self, mock_visa_resource: Mock, signal_generator: SignalGenerator
     ) -> None:
         """disable_all_modulation sends AM:STAT 0 and FM:STAT 0."""
-        sg = _make_connected_signal_generator(mock_visa_resource)
-
-        sg.disable_all_modulation()
+        signal_generator.disable_all_modulation()
 
         write_calls = mock_visa_resource.write.call_args_list
         assert call("AM:STAT 0") in write_calls
@@ -334,22 +289,28 @@ class TestSignalGeneratorGetStatus:
     """Tests for signal generator get_status method."""
 
     def test_get_status_returns_complete_dict(
-        self, mock_visa_resource: Mock
+        self, mock_visa_resource: Mock, signal_generator: SignalGenerator
     ) -> None:
         """get_status returns dict with frequency, power, output, and modulation state."""
-        mock_visa_resource.query.side_effect = lambda cmd: {
-            "FREQ?": "1000000.0\n",
-            "POW?": "-10.00\n",
-            "OUTP?": "0\n",
-            "AM:STAT?": "0\n",
-            "FM:STAT?": "0\n",
-        }[cmd]
-        sg = _make_connected_signal_generator(mock_visa_resource)
-
-        status = sg.get_status()
-
-        assert status["frequency"] == pytest.approx(1e6)
-        assert status["power"] == pytest.approx(-10.0)
+        mock_visa_resource.query.side_effect = [
+            "1000000.0\n",
+            "-10.00\n",
+            "0\n",
+            "0\n",
+            "0\n",
+        ]
+
+        status = signal_generator.get_status()
+
+        assert mock_visa_resource.query.call_args_list == [
+            call("FREQ?"),
+            call("POW?"),
+            call("OUTP?"),
+            call("AM:STAT?"),
+            call("FM:STAT?"),
+        ]
+        assert status["frequency"] == 1e6
+        assert status["power"] == -10.0
         assert status["output_enabled"] is False
         assert status["am_enabled"] is False
         assert status["fm_enabled"] is False
@@ -50,6 +50,17 @@ class DirectBaseSubclass(BaseInstrument):
         return {}
 
 
+# Read-only: neither build_instrument_registry() nor create_instrument()
+# mutates the mappings passed to them.
+_FAKE_CUSTOM = {
+    "Fake Signal Gen": InstrumentEntry(
+        cls=FakeSignalGen,
+        display_name="Fake Signal Gen",
+        base_type="signal_generator",
+    )
+}
+
+
 # === Tests for _get_base_type ===
 
 
@@ -76,242 +87,226 @@ class TestGetBaseType:
 # === Tests for build_instrument_registry ===
 
 
+@pytest.fixture(scope="session")
+def default_registry() -> dict[str, InstrumentEntry]:
+    """Built-in instrument registry (session-scoped; treat as read-only)."""
+    return build_instrument_registry()
+
+
+@pytest.fixture(scope="session")
+def fake_registry() -> dict[str, InstrumentEntry]:
+    """Registry including the fake custom instrument (session-scoped; read-only)."""
+    return build_instrument_registry(_FAKE_CUSTOM)
+
+
 class TestBuildInstrumentRegistry:
-    def test_built_in_types_included(self):
-        registry = build_instrument_registry()
-        assert "Power Supply" in registry
-        assert "Signal Generator" in registry
-        assert registry["Power Supply"].cls is PowerSupply
-        assert registry["Signal Generator"].cls is SignalGenerator
+    def test_built_in_types_included(self, default_registry):
+        assert "Power Supply" in default_registry
+        assert "Signal Generator" in default_registry
+        assert default_registry["Power Supply"].cls is PowerSupply
+        assert default_registry["Signal Generator"].cls is SignalGenerator
 
-    def test_built_in_base_types(self):
-        registry = build_instrument_registry()
-        assert registry["Power Supply"].base_type == "power_supply"
-        assert registry["Signal Generator"].base_type == "signal_generator"
+    def test_built_in_base_types(self, default_registry):
+        assert default_registry["Power Supply"].base_type == "power_supply"
+        assert default_registry["Signal Generator"].base_type == "signal_generator"
 
     def test_custom_instruments_merged(self):
-        custom = {
-            "Fake Signal Gen": InstrumentEntry(
-                cls=FakeSignalGen,
-                display_name="Fake Signal Gen",
-                base_type="signal_generator",
-            )
-        }
-        registry = build_instrument_registry(custom)
+        registry = build_instrument_registry(_FAKE_CUSTOM)
         assert "Fake Signal Gen" in registry
         assert "Power Supply" in registry
         assert "Signal Generator" in registry
 
-    def test_empty_custom_dict(self):
-        registry = build_instrument_registry({})
-        assert len(registry) == 2
-
-    def test_none_custom_dict(self):
-        registry = build_instrument_registry(None)
-        assert len(registry) == 2
+    @pytest.mark.parametrize("custom", [{}, None], ids=["empty", "none"])
+    def test_no_custom_instruments(self, custom):
+        registry = build_instrument_registry(custom)
+        assert set(registry) == {"Power Supply", "Signal Generator"}
 
 
 # === Tests for create_instrument ===
 
 
 class TestCreateInstrument:
-    def test_create_built_in_power_supply(self):
-        registry = build_instrument_registry()
+    def test_create_built_in_power_supply(self, default_registry):
         instrument = create_instrument(
-            registry, "Power Supply", "TCPIP::1.2.3.4::INSTR", 5000
+            default_registry, "Power Supply", "TCPIP::1.2.3.4::INSTR", 5000
         )
         assert isinstance(instrument, PowerSupply)
         assert instrument.name == "Power Supply"
 
-    def test_create_built_in_signal_generator(self):
-        registry = build_instrument_registry()
+    def test_create_built_in_signal_generator(self, default_registry):
         instrument = create_instrument(
-            registry, "Signal Generator", "TCPIP::1.2.3.4::INSTR", 5000
+            default_registry, "Signal Generator", "TCPIP::1.2.3.4::INSTR", 5000
         )
         assert isinstance(instrument, SignalGenerator)
 
-    def test_create_custom_instrument(self):
-        custom = {
-            "Fake Signal Gen": InstrumentEntry(
-                cls=FakeSignalGen,
-                display_name="Fake Signal Gen",
-                base_type="signal_generator",
-            )
-        }
-        registry = build_instrument_registry(custom)
+    def test_create_custom_instrument(self, fake_registry):
         instrument = create_instrument(
-            registry, "Fake Signal Gen", "TCPIP::1.2.3.4::INSTR", 5000
+            fake_registry, "Fake Signal Gen", "TCPIP::1.2.3.4::INSTR", 5000
         )
         assert isinstance(instrument, FakeSignalGen)
         assert isinstance(instrument, SignalGenerator)
 
-    def test_custom_instrument_passes_isinstance_check(self):
+    def test_custom_instrument_passes_isinstance_check(self, fake_registry):
         """Custom instrument must pass isinstance for parent type."""
-        custom = {
-            "Fake Signal Gen": InstrumentEntry(
-                cls=FakeSignalGen,
-                display_name="Fake Signal Gen",
-                base_type="signal_generator",
-            )
-        }
-        registry = build_instrument_registry(custom)
         instrument = create_instrument(
-            registry, "Fake Signal Gen", "TCPIP::1.2.3.4::INSTR", 5000
+            fake_registry, "Fake Signal Gen", "TCPIP::1.2.3.4::INSTR", 5000
         )
         assert isinstance(instrument, SignalGenerator)
         assert isinstance(instrument, BaseInstrument)
 
-    def test_unknown_display_name_raises(self):
-        registry = build_instrument_registry()
+    def test_unknown_display_name_raises(self, default_registry):
         with pytest.raises(ValueError, match="Unknown instrument"):
             create_instrument(
-                registry, "Nonexistent", "TCPIP::1.2.3.4::INSTR", 5000
+                default_registry, "Nonexistent", "TCPIP::1.2.3.4::INSTR", 5000
             )
 
 
 # === Tests for scan_custom_instruments ===
 
 
-class TestScanCustomInstruments:
-    def test_nonexistent_directory_returns_empty(self, tmp_path):
-        result = scan_custom_instruments(tmp_path / "does_not_exist")
-        assert result == {}
-
-    def test_empty_directory_returns_empty(self, tmp_path):
-        instruments_dir = tmp_path / "instruments"
-        instruments_dir.mkdir()
-        (instruments_dir / "__init__.py").write_text("")
-        result = scan_custom_instruments(instruments_dir)
-        assert result == {}
-
-    def test_discovers_valid_custom_instrument(self, tmp_path):
-        instruments_dir = tmp_path / "instruments"
-        instruments_dir.mkdir()
-        (instruments_dir / "__init__.py").write_text("")
-        (instruments_dir / "my_sig_gen.py").write_text(
+# Custom instrument directories keyed by variant name; each maps the files
+# written into that directory to their source.
+_INSTRUMENT_DIR_VARIANTS: dict[str, dict[str, str]] = {
+    "empty": {"__init__.py": ""},
+    "signal_generator": {
+        "__init__.py": "",
+        "my_sig_gen.py": (
             "from visa_vulture.instruments import SignalGenerator\n"
             "\n"
             "class MySigGen(SignalGenerator):\n"
             '    display_name = "My Sig Gen"\n'
-        )
-
-        result = scan_custom_instruments(instruments_dir)
-        assert "My Sig Gen" in result
-        assert result["My Sig Gen"].base_type == "signal_generator"
-        assert result["My Sig Gen"].display_name == "My Sig Gen"
-
-    def test_discovers_power_supply_extension(self, tmp_path):
-        instruments_dir = tmp_path / "instruments"
-        instruments_dir.mkdir()
-        (instruments_dir / "__init__.py").write_text("")
-        (instruments_dir / "my_ps.py").write_text(
+        ),
+    },
+    "power_supply": {
+        "__init__.py": "",
+        "my_ps.py": (
             "from visa_vulture.instruments import PowerSupply\n"
             "\n"
             "class MyPS(PowerSupply):\n"
             '    display_name = "My Power Supply"\n'
-        )
-
-        result = scan_custom_instruments(instruments_dir)
-        assert "My Power Supply" in result
-        assert result["My Power Supply"].base_type == "power_supply"
-
-    def test_skips_class_without_display_name(self, tmp_path):
-        instruments_dir = tmp_path / "instruments"
-        instruments_dir.mkdir()
-        (instruments_dir / "__init__.py").write_text("")
-        (instruments_dir / "no_name.py").write_text(
+        ),
+    },
+    "no_display_name": {
+        "__init__.py": "",
+        "no_name.py": (
             "from visa_vulture.instruments import SignalGenerator\n"
             "\n"
             "class NoName(SignalGenerator):\n"
             "    pass\n"
-        )
-
-        result = scan_custom_instruments(instruments_dir)
-        assert result == {}
-
-    def test_rejects_direct_base_instrument_subclass(self, tmp_path):
-        instruments_dir = tmp_path / "instruments"
-        instruments_dir.mkdir()
-        (instruments_dir / "__init__.py").write_text("")
-        (instruments_dir / "bad_instr.py").write_text(
+        ),
+    },
+    "direct_base": {
+        "__init__.py": "",
+        "bad_instr.py": (
             "from visa_vulture.instruments import BaseInstrument\n"
             "\n"
             "class BadInstrument(BaseInstrument):\n"
             '    display_name = "Bad"\n'
             "    def get_status(self):\n"
             "        return {}\n"
-        )
-
-        result = scan_custom_instruments(instruments_dir)
-        assert result == {}
-
-    def test_skips_modules_with_import_errors(self, tmp_path):
-        instruments_dir = tmp_path / "instruments"
-        instruments_dir.mkdir()
-        (instruments_dir / "__init__.py").write_text("")
-        (instruments_dir / "broken.py").write_text("import nonexistent_module\n")
-
-        result = scan_custom_instruments(instruments_dir)
-        assert result == {}
-
-    def test_skips_dunder_files(self, tmp_path):
-        instruments_dir = tmp_path / "instruments"
-        instruments_dir.mkdir()
-        (instruments_dir / "__init__.py").write_text(
+        ),
+    },
+    "import_error": {
+        "__init__.py": "",
+        "broken.py": "import nonexistent_module\n",
+    },
+    "dunder_only": {
+        "__init__.py": (
             "from visa_vulture.instruments import SignalGenerator\n"
             "\n"
             "class InitSigGen(SignalGenerator):\n"
             '    display_name = "Init Sig Gen"\n'
-        )
-
-        result = scan_custom_instruments(instruments_dir)
-        assert result == {}
-
-    def test_multiple_instruments_in_directory(self, tmp_path):
-        instruments_dir = tmp_path / "instruments"
-        instruments_dir.mkdir()
-        (instruments_dir / "__init__.py").write_text("")
-        (instruments_dir / "sig_gen_a.py").write_text(
+        ),
+    },
+    "multiple": {
+        "__init__.py": "",
+        "sig_gen_a.py": (
             "from visa_vulture.instruments import SignalGenerator\n"
             "\n"
             "class SigGenA(SignalGenerator):\n"
             '    display_name = "Sig Gen A"\n'
-        )
-        (instruments_dir / "ps_b.py").write_text(
+        ),
+        "ps_b.py": (
             "from visa_vulture.instruments import PowerSupply\n"
             "\n"
             "class PSB(PowerSupply):\n"
             '    display_name = "PS B"\n'
-        )
+        ),
+    },
+}
+
 
-        result = scan_custom_instruments(instruments_dir)
-        assert len(result) == 2
-        assert "Sig Gen A" in result
-        assert "PS B" in result
+@pytest.fixture(scope="session")
+def custom_instruments_tree(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Directory with one subdirectory per instrument variant, built once.
+
+    Tests only read from this tree; the scanner never writes to it.
+    """
+    tree = tmp_path_factory.mktemp("instruments")
+    for variant, files in _INSTRUMENT_DIR_VARIANTS.items():
+        variant_dir = tree / variant
+        variant_dir.mkdir()
+        for filename, source in files.items():
+            (variant_dir / filename).write_text(source)
+    return tree
+
+
+class TestScanCustomInstruments:
+    @pytest.fixture(autouse=True)
+    def _no_bytecode(self, monkeypatch):
+        """Keep the scanner from writing __pycache__ into the shared tree."""
+        monkeypatch.setattr(sys, "dont_write_bytecode", True)
+
+    @pytest.fixture(autouse=True)
+    def _purge_scanned_modules(self):
+        """Drop modules the scanner registered so they do not outlive the test."""
+        yield
+        for name in [n for n in sys.modules if n.startswith("_custom_instruments.")]:
+            del sys.modules[name]
+
+    @pytest.mark.parametrize(
+        "variant,expected",
+        [
+            ("does_not_exist", {}),
+            ("empty", {}),
+            ("signal_generator", {"My Sig Gen": "signal_generator"}),
+            ("power_supply", {"My Power Supply": "power_supply"}),
+            ("no_display_name", {}),
+            ("direct_base", {}),
+            ("import_error", {}),
+            ("dunder_only", {}),
+            ("multiple", {"Sig Gen A": "signal_generator", "PS B": "power_supply"}),
+        ],
+    )
+    def test_scan_variant(self, custom_instruments_tree, variant, expected):
+        """Scanner returns exactly the expected display names and base types."""
+        result = scan_custom_instruments(custom_instruments_tree / variant)
+
+        assert {name: entry.base_type for name, entry in result.items()} == expected
+        assert all(name == entry.display_name for name, entry in result.items())
 
 
 # === Tests for equipment model integration ===
 
 
 class TestEquipmentModelCustomClass:
-    def test_connect_with_custom_class(self, equipment_model, mock_visa_connection):
-        """Custom class parameter creates the custom instrument."""
-        equipment_model.connect_instrument(
-            "TCPIP::1.2.3.4::INSTR",
-            "signal_generator",
-            instrument_class=FakeSignalGen,
-        )
-        assert isinstance(equipment_model.instrument, FakeSignalGen)
-        assert isinstance(equipment_model.instrument, SignalGenerator)
-        assert equipment_model.instrument_type == "signal_generator"
-
-    def test_connect_without_custom_class_uses_default(
-        self, equipment_model, mock_visa_connection
+    @pytest.mark.parametrize(
+        "kwargs,expected_type",
+        [
+            ({"instrument_class": FakeSignalGen}, FakeSignalGen),
+            ({}, SignalGenerator),
+        ],
+        ids=["custom_class", "default_class"],
+    )
+    def test_connect_instrument_class(
+        self, equipment_model, mock_visa_connection, kwargs, expected_type
     ):
-        """Without custom class, default instrument is used."""
+        """Custom class parameter selects the instrument class; default otherwise."""
         equipment_model.connect_instrument(
             "TCPIP::1.2.3.4::INSTR",
             "signal_generator",
+            **kwargs,
         )
-        assert type(equipment_model.instrument) is SignalGenerator
+        assert type(equipment_model.instrument) is expected_type
+        assert isinstance(equipment_model.instrument, SignalGenerator)
         assert equipment_model.instrument_type == "signal_generator"
@@ -1,6 +1,7 @@
 """Tests for the logging configuration module."""
 
 import logging
+import os
 from pathlib import Path
 from unittest.mock import patch
 
@@ -9,59 +10,98 @@ import pytest
 from visa_vulture.logging_config.setup import GUILogHandler, setup_logging
 
 
-@pytest.fixture(autouse=True)
-def reset_loggers():
-    """Reset root logger and third-party loggers after each test."""
-    yield
-    root = logging.getLogger()
-    root.handlers.clear()
-    root.setLevel(logging.WARNING)
-    # Reset third-party logger levels
-    for name in [
+# setup_logging() always attaches a file handler; point it at the null device
+# so tests exercise the real handler without writing log files to disk.
+_NULL_LOG_FILE = Path(os.devnull)
+
+# Third-party loggers whose levels setup_logging() may override
+_TRACKED_LOGGERS = frozenset(
+    {
         "matplotlib",
         "matplotlib.font_manager",
         "matplotlib.backends",
         "pyvisa",
         "PIL",
-    ]:
-        logging.getLogger(name).setLevel(logging.NOTSET)
+    }
+)
+
+# GUILogHandler.emit() does not modify the record, so tests can share one
+_SAMPLE_RECORD = logging.LogRecord(
+    name="test",
+    level=logging.INFO,
+    pathname="",
+    lineno=0,
+    msg="test message",
+    args=(),
+    exc_info=None,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_loggers():
+    """Restore root handlers and any changed logger levels after each test."""
+    root = logging.getLogger()
+    saved_handlers = root.handlers[:]
+    saved_levels = {
+        logger: logger.level
+        for logger in [root, *map(logging.getLogger, _TRACKED_LOGGERS)]
+    }
+    yield
+    if root.handlers != saved_handlers:
+        for handler in root.handlers:
+            if handler not in saved_handlers:
+                handler.close()
+        root.handlers[:] = saved_handlers
+    for logger, level in saved_levels.items():
+        if logger.level != level:
+            logger.setLevel(level)
+
+
+@pytest.fixture
+def debug_logging() -> None:
+    """Configure logging at DEBUG level."""
+    setup_logging(log_file=_NULL_LOG_FILE, log_level="DEBUG")
+
+
+@pytest.fixture
+def info_logging() -> None:
+    """Configure logging at INFO level."""
+    setup_logging(log_file=_NULL_LOG_FILE, log_level="INFO")
 
 
 class TestThirdPartyLoggerSuppression:
     """Tests for third-party logger suppression in debug mode."""
 
-    def test_debug_mode_suppresses_matplotlib(self, tmp_path: Path) -> None:
+    @pytest.mark.usefixtures("debug_logging")
+    def test_debug_mode_suppresses_matplotlib(self) -> None:
         """Matplotlib logger is set to WARNING when app is in DEBUG mode."""
-        setup_logging(log_file=tmp_path / "test.log", log_level="DEBUG")
         assert logging.getLogger("matplotlib").level == logging.WARNING
 
-    def test_debug_mode_suppresses_matplotlib_font_manager(
-        self, tmp_path: Path
-    ) -> None:
+    @pytest.mark.usefixtures("debug_logging")
+    def test_debug_mode_suppresses_matplotlib_font_manager(self) -> None:
         """Matplotlib font_manager logger is suppressed in DEBUG mode."""
-        setup_logging(log_file=tmp_path / "test.log", log_level="DEBUG")
         assert logging.getLogger("matplotlib.font_manager").level == logging.WARNING
 
-    def test_debug_mode_suppresses_pyvisa(self, tmp_path: Path) -> None:
+    @pytest.mark.usefixtures("debug_logging")
+    def test_debug_mode_suppresses_pyvisa(self) -> None:
         """PyVISA logger is set to WARNING when app is in DEBUG mode."""
-        setup_logging(log_file=tmp_path / "test.log", log_level="DEBUG")
         assert logging.getLogger("pyvisa").level == logging.WARNING
 
-    def test_debug_mode_suppresses_pil(self, tmp_path: Path) -> None:
+    @pytest.mark.usefixtures("debug_logging")
+    def test_debug_mode_suppresses_pil(self) -> None:
         """PIL logger is set to WARNING when app is in DEBUG mode."""
-        setup_logging(log_file=tmp_path / "test.log", log_level="DEBUG")
         assert logging.getLogger("PIL").level == logging.WARNING
 
-    def test_info_mode_does_not_suppress_third_party(self, tmp_path: Path) -> None:
+    @pytest.mark.usefixtures("info_logging")
+    def test_info_mode_does_not_suppress_third_party(self) -> None:
         """Third-party loggers are not explicitly overridden in INFO mode."""
-        setup_logging(log_file=tmp_path / "test.log", log_level="INFO")
         # NOTSET means the logger inherits from root (which is INFO)
         assert logging.getLogger("matplotlib").level == logging.NOTSET
         assert logging.getLogger("pyvisa").level == logging.NOTSET
 
-    def test_app_loggers_remain_at_debug(self, tmp_path: Path) -> None:
+    @pytest.mark.usefixtures("debug_logging")
+    def test_app_loggers_remain_at_debug(self) -> None:
         """Application loggers stay at DEBUG level in debug mode."""
-        setup_logging(log_file=tmp_path / "test.log", log_level="DEBUG")
         app_logger = logging.getLogger("visa_vulture.model.equipment")
         assert app_logger.getEffectiveLevel() == logging.DEBUG
 
@@ -73,53 +113,39 @@ class TestGUILogHandler:
         """GUILogHandler calls the callback with log records."""
         records = []
         handler = GUILogHandler(callback=records.append)
-        record = logging.LogRecord(
-            name="test", level=logging.INFO, pathname="", lineno=0,
-            msg="test message", args=(), exc_info=None,
-        )
-        handler.emit(record)
+        handler.emit(_SAMPLE_RECORD)
         assert len(records) == 1
         assert records[0].msg == "test message"
 
     def test_handler_without_callback_does_not_error(self) -> None:
         """GUILogHandler with no callback does not raise on emit."""
         handler = GUILogHandler()
-        record = logging.LogRecord(
-            name="test", level=logging.INFO, pathname="", lineno=0,
-            msg="test message", args=(), exc_info=None,
-        )
-        handler.emit(record)  # Should not raise
+        handler.emit(_SAMPLE_RECORD)  # Should not raise
 
     def test_set_callback_updates_handler(self) -> None:
         """set_callback updates the callback used by emit."""
         records = []
         handler = GUILogHandler()
         handler.set_callback(records.append)
-        record = logging.LogRecord(
-            name="test", level=logging.INFO, pathname="", lineno=0,
-            msg="test message", args=(), exc_info=None,
-        )
-        handler.emit(record)
+        handler.emit(_SAMPLE_RECORD)
         assert len(records) == 1
 
 
 class TestSetupLogging:
     """Tests for the setup_logging function."""
 
-    def test_returns_gui_handler(self, tmp_path: Path) -> None:
+    def test_returns_gui_handler(self) -> None:
         """setup_logging returns a GUILogHandler instance."""
-        handler = setup_logging(log_file=tmp_path / "test.log")
+        handler = setup_logging(log_file=_NULL_LOG_FILE)
         assert isinstance(handler, GUILogHandler)
 
-    def test_uses_provided_gui_handler(self, tmp_path: Path) -> None:
+    def test_uses_provided_gui_handler(self) -> None:
         """setup_logging uses an existing GUILogHandler if provided."""
         existing = GUILogHandler()
-        result = setup_logging(
-            log_file=tmp_path / "test.log", gui_handler=existing
-        )
+        result = setup_logging(log_file=_NULL_LOG_FILE, gui_handler=existing)
         assert result is existing
 
-    def test_root_logger_level_set(self, tmp_path: Path) -> None:
+    def test_root_logger_level_set(self) -> None:
         """Root logger level is set to the configured level."""
-        setup_logging(log_file=tmp_path / "test.log", log_level="WARNING")
+        setup_logging(log_file=_NULL_LOG_FILE, log_level="WARNING")
         assert logging.getLogger().level == logging.WARNING
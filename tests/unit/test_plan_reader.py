@@ -1,5 +1,7 @@
 """Tests for the test plan reader module."""
 
+import io
+import os
 from pathlib import Path
 from typing import Any
 
@@ -44,13 +46,44 @@ def _make_sg_csv(
     )
 
 
-def _parse_plan_csv(
-    tmp_path: Path, content: str, **kwargs: Any
-) -> TestPlanResult:
-    """Write CSV content to a temp file and parse it."""
-    csv_path = tmp_path / "test.csv"
-    csv_path.write_text(content)
-    return read_test_plan(csv_path, **kwargs)
+# Power supply plan whose only row fails to parse
+_PS_INVALID_ROW_CSV = (
+    "# instrument_type: power_supply\n"
+    "duration,voltage,current\n"
+    "invalid,5.0,1.0\n"
+)
+
+
+def _parse_plan_csv(content: str, **kwargs: Any) -> TestPlanResult:
+    """Parse CSV content from memory, without touching the filesystem."""
+    return read_test_plan(io.StringIO(content), **kwargs)
+
+
+def _mentions(messages: list[str], *fragments: str) -> bool:
+    """Return True if any message contains every fragment, ignoring case.
+
+    Fragments and messages are each lower-cased once, however many are checked.
+    """
+    lowered = [f.lower() for f in fragments]
+    return any(all(f in m for f in lowered) for m in map(str.lower, messages))
+
+
+def _assert_rejected(
+    result: TestPlanResult, *fragments: str, ignore_case: bool = True
+) -> None:
+    """Assert no plan was produced and one error contains every fragment."""
+    assert result.plan is None
+    if ignore_case:
+        found = _mentions(result.errors, *fragments)
+    else:
+        found = any(all(f in e for f in fragments) for e in result.errors)
+    assert found, result.errors
+
+
+@pytest.fixture(scope="module")
+def bad_values_result(test_plan_fixtures_path: Path) -> TestPlanResult:
+    """Parsed invalid_bad_values.csv, shared by the module; treat as read-only."""
+    return read_test_plan(test_plan_fixtures_path / "invalid_bad_values.csv")
 
 
 class TestReadTestPlanFileHandling:
@@ -72,29 +105,44 @@ class TestReadTestPlanFileHandling:
 
         assert result.plan is None
         assert len(result.errors) >= 1
-        assert any("missing required metadata" in e.lower() for e in result.errors)
+        assert _mentions(result.errors, "missing required metadata")
 
-    def test_no_data_rows_returns_error(self, tmp_path: Path) -> None:
+    def test_no_data_rows_returns_error(self) -> None:
         """File with only header returns error."""
-        csv_path = tmp_path / "header_only.csv"
-        csv_path.write_text("# instrument_type: power_supply\nduration,voltage,current\n")
+        result = _parse_plan_csv(
+            "# instrument_type: power_supply\nduration,voltage,current\n"
+        )
 
-        result = read_test_plan(csv_path)
+        _assert_rejected(result, "no data rows")
 
-        assert result.plan is None
-        assert any("no data rows" in e.lower() for e in result.errors)
+    def test_stream_read_error_returns_error(self) -> None:
+        """OSError while reading a stream returns an error result."""
+
+        class _FailingStream(io.StringIO):
+            def read(self, size: int | None = -1) -> str:
+                raise OSError("device not ready")
+
+        result = read_test_plan(_FailingStream())
+
+        _assert_rejected(result, "error reading file", "device not ready")
+
+    def test_stream_decode_error_returns_error(self) -> None:
+        """Undecodable stream content returns an error result."""
+        stream = io.TextIOWrapper(io.BytesIO(b"\xff\xfe\xfa"), encoding="utf-8")
+
+        result = read_test_plan(stream)
+
+        _assert_rejected(result, "error reading file")
 
 
 class TestReadPowerSupplyPlan:
     """Tests for power supply plan parsing."""
 
     def test_valid_power_supply_plan(
-        self, test_plan_fixtures_path: Path
+        self, valid_power_supply_result: TestPlanResult
     ) -> None:
         """Valid power supply CSV is parsed correctly."""
-        result = read_test_plan(
-            test_plan_fixtures_path / "valid_power_supply.csv"
-        )
+        result = valid_power_supply_result
 
         assert result.errors == []
         assert result.plan is not None
@@ -103,19 +151,16 @@ class TestReadPowerSupplyPlan:
         assert isinstance(result.plan.steps[0], PowerSupplyTestStep)
 
     def test_power_supply_step_values(
-        self, test_plan_fixtures_path: Path
+        self, valid_power_supply_result: TestPlanResult
     ) -> None:
         """Power supply step values are parsed correctly."""
-        result = read_test_plan(
-            test_plan_fixtures_path / "valid_power_supply.csv"
-        )
+        result = valid_power_supply_result
 
         assert result.errors == []
         assert result.plan is not None
 
-        step1 = result.plan.get_step(1)
+        step1 = result.plan.get_power_supply_step(1)
         assert step1 is not None
-        assert isinstance(step1, PowerSupplyTestStep)
         assert step1.duration_seconds == 1.0
         assert step1.absolute_time_seconds == 0.0
         assert step1.voltage == 5.0
@@ -130,20 +175,17 @@ class TestReadPowerSupplyPlan:
             test_plan_fixtures_path / "invalid_missing_columns.csv"
         )
 
-        assert result.plan is None
-        assert any("missing required columns" in e.lower() for e in result.errors)
+        _assert_rejected(result, "missing required columns")
 
 
 class TestReadSignalGeneratorPlan:
     """Tests for signal generator plan parsing."""
 
     def test_valid_signal_generator_plan(
-        self, test_plan_fixtures_path: Path
+        self, valid_signal_generator_result: TestPlanResult
     ) -> None:
         """Valid signal generator CSV is parsed correctly."""
-        result = read_test_plan(
-            test_plan_fixtures_path / "valid_signal_generator.csv"
-        )
+        result = valid_signal_generator_result
 
         assert result.errors == []
         assert result.plan is not None
@@ -152,19 +194,16 @@ class TestReadSignalGeneratorPlan:
         assert isinstance(result.plan.steps[0], SignalGeneratorTestStep)
 
     def test_signal_generator_step_values(
-        self, test_plan_fixtures_path: Path
+        self, valid_signal_generator_result: TestPlanResult
     ) -> None:
         """Signal generator step values are parsed correctly."""
-        result = read_test_plan(
-            test_plan_fixtures_path / "valid_signal_generator.csv"
-        )
+        result = valid_signal_generator_result
 
         assert result.errors == []
         assert result.plan is not None
 
-        step1 = result.plan.get_step(1)
+        step1 = result.plan.get_signal_generator_step(1)
         assert step1 is not None
-        assert isinstance(step1, SignalGeneratorTestStep)
         assert step1.duration_seconds == 1.0
         assert step1.absolute_time_seconds == 0.0
         assert step1.frequency == 1000000
@@ -172,148 +211,99 @@ class TestReadSignalGeneratorPlan:
         assert step1.description == "Start at 1MHz"
 
     def test_signal_generator_negative_power_is_valid(
-        self, test_plan_fixtures_path: Path
+        self, valid_signal_generator_result: TestPlanResult
     ) -> None:
         """Negative power (dBm) values are valid."""
-        result = read_test_plan(
-            test_plan_fixtures_path / "valid_signal_generator.csv"
-        )
+        result = valid_signal_generator_result
 
         assert result.errors == []
         assert result.plan is not None
 
-        step2 = result.plan.get_step(2)
+        step2 = result.plan.get_signal_generator_step(2)
         assert step2 is not None
-        assert isinstance(step2, SignalGeneratorTestStep)
         assert step2.power == -10
 
 
 class TestReadTestPlanValueValidation:
     """Tests for value validation during parsing."""
 
-    def test_invalid_duration_value_returns_error(
-        self, test_plan_fixtures_path: Path
-    ) -> None:
-        """Invalid duration value returns error."""
-        result = read_test_plan(
-            test_plan_fixtures_path / "invalid_bad_values.csv"
-        )
-
-        assert result.plan is None
-        assert any("invalid duration value" in e.lower() for e in result.errors)
-
-    def test_invalid_voltage_value_returns_error(
-        self, test_plan_fixtures_path: Path
-    ) -> None:
-        """Invalid voltage value returns error."""
-        result = read_test_plan(
-            test_plan_fixtures_path / "invalid_bad_values.csv"
-        )
-
-        assert result.plan is None
-        assert any("invalid voltage value" in e.lower() for e in result.errors)
-
-    def test_invalid_current_value_returns_error(
-        self, test_plan_fixtures_path: Path
+    @pytest.mark.parametrize(
+        "needle",
+        ["invalid duration value", "invalid voltage value", "invalid current value"],
+    )
+    def test_invalid_value_returns_error(
+        self, bad_values_result: TestPlanResult, needle: str
     ) -> None:
-        """Invalid current value returns error."""
-        result = read_test_plan(
-            test_plan_fixtures_path / "invalid_bad_values.csv"
-        )
-
-        assert result.plan is None
-        assert any("invalid current value" in e.lower() for e in result.errors)
+        """Each unparseable column value is reported."""
+        _assert_rejected(bad_values_result, needle)
 
-    def test_negative_duration_returns_error(self, tmp_path: Path) -> None:
+    def test_negative_duration_returns_error(self) -> None:
         """Negative duration value returns error."""
-        result = _parse_plan_csv(tmp_path, _make_ps_csv(duration=-1.0))
+        result = _parse_plan_csv(_make_ps_csv(duration=-1.0))
 
-        assert result.plan is None
-        assert any("must be >= 0" in e for e in result.errors)
+        _assert_rejected(result, "must be >= 0", ignore_case=False)
 
-    def test_negative_voltage_returns_error(self, tmp_path: Path) -> None:
+    def test_negative_voltage_returns_error(self) -> None:
         """Negative voltage value returns error."""
-        result = _parse_plan_csv(tmp_path, _make_ps_csv(voltage=-5.0))
+        result = _parse_plan_csv(_make_ps_csv(voltage=-5.0))
 
-        assert result.plan is None
-        assert any("voltage" in e.lower() and ">= 0" in e for e in result.errors)
+        _assert_rejected(result, "voltage", ">= 0")
 
-    def test_negative_current_returns_error(self, tmp_path: Path) -> None:
+    def test_negative_current_returns_error(self) -> None:
         """Negative current value returns error."""
-        result = _parse_plan_csv(tmp_path, _make_ps_csv(current=-1.0))
+        result = _parse_plan_csv(_make_ps_csv(current=-1.0))
 
-        assert result.plan is None
-        assert any("current" in e.lower() and ">= 0" in e for e in result.errors)
+        _assert_rejected(result, "current", ">= 0")
 
-    def test_negative_frequency_returns_error(self, tmp_path: Path) -> None:
+    def test_negative_frequency_returns_error(self) -> None:
         """Negative frequency value returns error."""
-        result = _parse_plan_csv(tmp_path, _make_sg_csv(frequency=-1000))
+        result = _parse_plan_csv(_make_sg_csv(frequency=-1000))
 
-        assert result.plan is None
-        assert any("frequency" in e.lower() and ">= 0" in e for e in result.errors)
+        _assert_rejected(result, "frequency", ">= 0")
 
 
 class TestReadTestPlanTypeDetection:
     """Tests for plan type detection via metadata."""
 
-    def test_type_detected_from_metadata(self, tmp_path: Path) -> None:
+    def test_type_detected_from_metadata(self) -> None:
         """Type is detected from instrument_type metadata."""
-        result = _parse_plan_csv(tmp_path, _make_sg_csv())
+        result = _parse_plan_csv(_make_sg_csv())
 
         assert result.errors == []
         assert result.plan is not None
         assert result.plan.plan_type == PLAN_TYPE_SIGNAL_GENERATOR
 
-    def test_missing_metadata_returns_error(self, tmp_path: Path) -> None:
+    def test_missing_metadata_returns_error(self) -> None:
         """CSV with no metadata comment lines returns error."""
-        csv_path = tmp_path / "no_metadata.csv"
-        csv_path.write_text("duration,voltage,current\n0.0,5.0,1.0\n")
-
-        result = read_test_plan(csv_path)
+        result = _parse_plan_csv("duration,voltage,current\n0.0,5.0,1.0\n")
 
-        assert result.plan is None
-        assert any("missing required metadata" in e.lower() for e in result.errors)
+        _assert_rejected(result, "missing required metadata")
 
-    def test_missing_instrument_type_metadata_returns_error(
-        self, tmp_path: Path
-    ) -> None:
+    def test_missing_instrument_type_metadata_returns_error(self) -> None:
         """Metadata present but missing instrument_type returns error."""
-        csv_path = tmp_path / "wrong_metadata.csv"
-        csv_path.write_text(
+        result = _parse_plan_csv(
             "# description: some test plan\n"
             "duration,voltage,current\n0.0,5.0,1.0\n"
         )
 
-        result = read_test_plan(csv_path)
-
-        assert result.plan is None
-        assert any("missing required metadata field" in e.lower() for e in result.errors)
+        _assert_rejected(result, "missing required metadata field")
 
-    def test_invalid_instrument_type_returns_error(
-        self, tmp_path: Path
-    ) -> None:
+    def test_invalid_instrument_type_returns_error(self) -> None:
         """Invalid instrument_type value returns error with no fallback."""
-        csv_path = tmp_path / "bad_type.csv"
-        csv_path.write_text(
+        result = _parse_plan_csv(
             "# instrument_type: unknown_type\n"
             "duration,voltage,current\n0.0,5.0,1.0\n"
         )
 
-        result = read_test_plan(csv_path)
-
-        assert result.plan is None
-        assert any("invalid instrument_type" in e.lower() for e in result.errors)
+        _assert_rejected(result, "invalid instrument_type")
 
-    def test_metadata_whitespace_handling(self, tmp_path: Path) -> None:
+    def test_metadata_whitespace_handling(self) -> None:
         """Metadata with extra whitespace is parsed correctly."""
-        csv_path = tmp_path / "whitespace_metadata.csv"
-        csv_path.write_text(
+        result = _parse_plan_csv(
             "#  instrument_type :  power_supply \n"
             "duration,voltage,current\n0.0,5.0,1.0\n"
         )
 
-        result = read_test_plan(csv_path)
-
         assert result.errors == []
         assert result.plan is not None
         assert result.plan.plan_type == PLAN_TYPE_POWER_SUPPLY
@@ -322,27 +312,21 @@ class TestReadTestPlanTypeDetection:
 class TestReadTestPlanColumnNormalization:
     """Tests for column name normalization."""
 
-    def test_column_names_case_insensitive(self, tmp_path: Path) -> None:
+    def test_column_names_case_insensitive(self) -> None:
         """Column names are case insensitive."""
-        csv_path = tmp_path / "uppercase.csv"
-        csv_path.write_text(
+        result = _parse_plan_csv(
             "# instrument_type: power_supply\nDURATION,VOLTAGE,CURRENT\n0.0,5.0,1.0\n"
         )
 
-        result = read_test_plan(csv_path)
-
         assert result.errors == []
         assert result.plan is not None
 
-    def test_column_names_trimmed(self, tmp_path: Path) -> None:
+    def test_column_names_trimmed(self) -> None:
         """Column names with whitespace are trimmed."""
-        csv_path = tmp_path / "whitespace.csv"
-        csv_path.write_text(
+        result = _parse_plan_csv(
             "# instrument_type: power_supply\n duration , voltage , current \n0.0,5.0,1.0\n"
         )
 
-        result = read_test_plan(csv_path)
-
         assert result.errors == []
         assert result.plan is not None
 
@@ -351,12 +335,10 @@ class TestReadTestPlanStepNumbering:
     """Tests for step numbering."""
 
     def test_step_numbers_are_1_based(
-        self, test_plan_fixtures_path: Path
+        self, valid_power_supply_result: TestPlanResult
     ) -> None:
         """Step numbers start at 1."""
-        result = read_test_plan(
-            test_plan_fixtures_path / "valid_power_supply.csv"
-        )
+        result = valid_power_supply_result
 
         assert result.errors == []
         assert result.plan is not None
@@ -364,12 +346,10 @@ class TestReadTestPlanStepNumbering:
         assert result.plan.get_step(0) is None
 
     def test_step_numbers_follow_row_order(
-        self, test_plan_fixtures_path: Path
+        self, valid_power_supply_result: TestPlanResult
     ) -> None:
         """Step numbers follow CSV row order."""
-        result = read_test_plan(
-            test_plan_fixtures_path / "valid_power_supply.csv"
-        )
+        result = valid_power_supply_result
 
         assert result.errors == []
         assert result.plan is not None
@@ -382,28 +362,50 @@ class TestReadTestPlanName:
     """Tests for plan name derivation."""
 
     def test_plan_name_from_filename(
-        self, test_plan_fixtures_path: Path
+        self, valid_power_supply_result: TestPlanResult
     ) -> None:
         """Plan name is derived from filename."""
-        result = read_test_plan(
-            test_plan_fixtures_path / "valid_power_supply.csv"
-        )
+        result = valid_power_supply_result
 
         assert result.errors == []
         assert result.plan is not None
         assert result.plan.name == "valid_power_supply"
 
+    def test_stream_plan_name_defaults_to_untitled(self) -> None:
+        """A stream without a name attribute gives an 'untitled' plan."""
+        result = _parse_plan_csv(_make_ps_csv())
+
+        assert result.plan is not None
+        assert result.plan.name == "untitled"
+
+    def test_fd_stream_plan_name_defaults_to_untitled(
+        self, test_plan_fixtures_path: Path
+    ) -> None:
+        """A stream opened from a file descriptor (int name) gives 'untitled'."""
+        fd = os.open(test_plan_fixtures_path / "valid_power_supply.csv", os.O_RDONLY)
+        with open(fd, encoding="utf-8") as f:
+            result = read_test_plan(f)
+
+        assert result.errors == []
+        assert result.plan is not None
+        assert result.plan.name == "untitled"
+
+    def test_explicit_name_overrides_default(self) -> None:
+        """The name argument sets the plan name."""
+        result = _parse_plan_csv(_make_ps_csv(), name="sweep")
+
+        assert result.plan is not None
+        assert result.plan.name == "sweep"
+
 
 class TestReadTestPlanErrorAccumulation:
     """Tests for error accumulation."""
 
     def test_multiple_row_errors_accumulated(
-        self, test_plan_fixtures_path: Path
+        self, bad_values_result: TestPlanResult
     ) -> None:
         """Multiple row errors are all reported."""
-        result = read_test_plan(
-            test_plan_fixtures_path / "invalid_bad_values.csv"
-        )
+        result = bad_values_result
 
         assert result.plan is None
         # Should have errors for multiple rows with bad values
@@ -413,32 +415,36 @@ class TestReadTestPlanErrorAccumulation:
 class TestReadTestPlanPathTypes:
     """Tests for different path types."""
 
-    def test_string_path_works(self, test_plan_fixtures_path: Path) -> None:
-        """String path is accepted."""
+    @pytest.mark.parametrize("path_type", [str, Path], ids=["str", "Path"])
+    def test_path_type_accepted(
+        self, test_plan_fixtures_path: Path, path_type: type[str] | type[Path]
+    ) -> None:
+        """String and Path object paths are both accepted."""
         result = read_test_plan(
-            str(test_plan_fixtures_path / "valid_power_supply.csv")
+            path_type(test_plan_fixtures_path / "valid_power_supply.csv")
         )
 
         assert result.errors == []
         assert result.plan is not None
 
-    def test_path_object_works(self, test_plan_fixtures_path: Path) -> None:
-        """Path object is accepted."""
-        result = read_test_plan(
-            test_plan_fixtures_path / "valid_power_supply.csv"
-        )
+    def test_text_stream_works(self, test_plan_fixtures_path: Path) -> None:
+        """Open text stream is accepted and named after the file it wraps."""
+        with open(
+            test_plan_fixtures_path / "valid_power_supply.csv", encoding="utf-8"
+        ) as f:
+            result = read_test_plan(f)
 
         assert result.errors == []
         assert result.plan is not None
+        assert result.plan.name == "valid_power_supply"
 
 
 class TestReadSignalGeneratorPlanWithModulation:
     """Tests for signal generator plan parsing with modulation metadata."""
 
-    def test_am_modulation_metadata_parsed(self, tmp_path: Path) -> None:
+    def test_am_modulation_metadata_parsed(self) -> None:
         """AM modulation metadata is parsed correctly."""
-        csv_path = tmp_path / "am_test.csv"
-        csv_path.write_text(
+        result = _parse_plan_csv(
             "# instrument_type: signal_generator\n"
             "# modulation_type: am\n"
             "# modulation_frequency: 1000\n"
@@ -447,8 +453,6 @@ class TestReadSignalGeneratorPlanWithModulation:
             "1.0,1000000,0,true\n"
         )
 
-        result = read_test_plan(csv_path)
-
         assert result.errors == []
         assert result.plan is not None
         assert result.plan.modulation_config is not None
@@ -457,10 +461,9 @@ class TestReadSignalGeneratorPlanWithModulation:
         assert result.plan.modulation_config.modulation_frequency == 1000.0
         assert result.plan.modulation_config.depth == 50.0
 
-    def test_fm_modulation_metadata_parsed(self, tmp_path: Path) -> None:
+    def test_fm_modulation_metadata_parsed(self) -> None:
         """FM modulation metadata is parsed correctly."""
-        csv_path = tmp_path / "fm_test.csv"
-        csv_path.write_text(
+        result = _parse_plan_csv(
             "# instrument_type: signal_generator\n"
             "# modulation_type: fm\n"
             "# modulation_frequency: 1000\n"
@@ -469,8 +472,6 @@ class TestReadSignalGeneratorPlanWithModulation:
             "1.0,1000000,0\n"
         )
 
-        result = read_test_plan(csv_path)
-
         assert result.errors == []
         assert result.plan is not None
         assert isinstance(result.plan.modulation_config, FMModulationConfig)
@@ -478,25 +479,17 @@ class TestReadSignalGeneratorPlanWithModulation:
         assert result.plan.modulation_config.modulation_frequency == 1000.0
         assert result.plan.modulation_config.deviation == 5000.0
 
-    def test_no_modulation_type_results_in_none_config(self, tmp_path: Path) -> None:
+    def test_no_modulation_type_results_in_none_config(self) -> None:
         """Without modulation_type, modulation_config is None."""
-        csv_path = tmp_path / "no_mod.csv"
-        csv_path.write_text(
-            "# instrument_type: signal_generator\n"
-            "duration,frequency,power\n"
-            "1.0,1000000,0\n"
-        )
-
-        result = read_test_plan(csv_path)
+        result = _parse_plan_csv(_make_sg_csv())
 
         assert result.errors == []
         assert result.plan is not None
         assert result.plan.modulation_config is None
 
-    def test_missing_modulation_frequency_returns_error(self, tmp_path: Path) -> None:
+    def test_missing_modulation_frequency_returns_error(self) -> None:
         """Missing modulation_frequency with modulation_type returns error."""
-        csv_path = tmp_path / "missing_freq.csv"
-        csv_path.write_text(
+        result = _parse_plan_csv(
             "# instrument_type: signal_generator\n"
             "# modulation_type: am\n"
             "# am_depth: 50\n"
@@ -504,15 +497,11 @@ class TestReadSignalGeneratorPlanWithModulation:
             "1.0,1000000,0\n"
         )
 
-        result = read_test_plan(csv_path)
-
-        assert result.plan is None
-        assert any("modulation_frequency" in e for e in result.errors)
+        _assert_rejected(result, "modulation_frequency", ignore_case=False)
 
-    def test_missing_am_depth_returns_error(self, tmp_path: Path) -> None:
+    def test_missing_am_depth_returns_error(self) -> None:
         """Missing am_depth for AM modulation returns error."""
-        csv_path = tmp_path / "missing_depth.csv"
-        csv_path.write_text(
+        result = _parse_plan_csv(
             "# instrument_type: signal_generator\n"
             "# modulation_type: am\n"
             "# modulation_frequency: 1000\n"
@@ -520,15 +509,11 @@ class TestReadSignalGeneratorPlanWithModulation:
             "1.0,1000000,0\n"
         )
 
-        result = read_test_plan(csv_path)
-
-        assert result.plan is None
-        assert any("am_depth" in e for e in result.errors)
+        _assert_rejected(result, "am_depth", ignore_case=False)
 
-    def test_missing_fm_deviation_returns_error(self, tmp_path: Path) -> None:
+    def test_missing_fm_deviation_returns_error(self) -> None:
         """Missing fm_deviation for FM modulation returns error."""
-        csv_path = tmp_path / "missing_dev.csv"
-        csv_path.write_text(
+        result = _parse_plan_csv(
             "# instrument_type: signal_generator\n"
             "# modulation_type: fm\n"
             "# modulation_frequency: 1000\n"
@@ -536,32 +521,22 @@ class TestReadSignalGeneratorPlanWithModulation:
             "1.0,1000000,0\n"
         )
 
-        result = read_test_plan(csv_path)
+        _assert_rejected(result, "fm_deviation", ignore_case=False)
 
-        assert result.plan is None
-        assert any("fm_deviation" in e for e in result.errors)
-
-    def test_invalid_modulation_type_returns_error(self, tmp_path: Path) -> None:
+    def test_invalid_modulation_type_returns_error(self) -> None:
         """Invalid modulation_type returns error."""
-        csv_path = tmp_path / "bad_mod_type.csv"
-        csv_path.write_text(
+        result = _parse_plan_csv(
             "# instrument_type: signal_generator\n"
             "# modulation_type: invalid\n"
             "duration,frequency,power\n"
             "1.0,1000000,0\n"
         )
 
-        result = read_test_plan(csv_path)
+        _assert_rejected(result, "invalid modulation_type")
 
-        assert result.plan is None
-        assert any("invalid modulation_type" in e.lower() for e in result.errors)
-
-    def test_modulation_enabled_column_parsed_true_values(
-        self, tmp_path: Path
-    ) -> None:
+    def test_modulation_enabled_column_parsed_true_values(self) -> None:
         """modulation_enabled column parses true values correctly."""
-        csv_path = tmp_path / "mod_enabled.csv"
-        csv_path.write_text(
+        result = _parse_plan_csv(
             "# instrument_type: signal_generator\n"
             "# modulation_type: am\n"
             "# modulation_frequency: 1000\n"
@@ -572,20 +547,15 @@ class TestReadSignalGeneratorPlanWithModulation:
             "1.0,3000000,-5,yes\n"
         )
 
-        result = read_test_plan(csv_path)
-
         assert result.errors == []
         assert result.plan is not None
         assert result.plan.steps[0].modulation_enabled is True
         assert result.plan.steps[1].modulation_enabled is True
         assert result.plan.steps[2].modulation_enabled is True
 
-    def test_modulation_enabled_column_parsed_false_values(
-        self, tmp_path: Path
-    ) -> None:
+    def test_modulation_enabled_column_parsed_false_values(self) -> None:
         """modulation_enabled column parses false values correctly."""
-        csv_path = tmp_path / "mod_disabled.csv"
-        csv_path.write_text(
+        result = _parse_plan_csv(
             "# instrument_type: signal_generator\n"
             "duration,frequency,power,modulation_enabled\n"
             "1.0,1000000,0,false\n"
@@ -593,49 +563,33 @@ class TestReadSignalGeneratorPlanWithModulation:
             "1.0,3000000,-5,no\n"
         )
 
-        result = read_test_plan(csv_path)
-
         assert result.errors == []
         assert result.plan is not None
         assert result.plan.steps[0].modulation_enabled is False
         assert result.plan.steps[1].modulation_enabled is False
         assert result.plan.steps[2].modulation_enabled is False
 
-    def test_modulation_enabled_defaults_to_false(self, tmp_path: Path) -> None:
+    def test_modulation_enabled_defaults_to_false(self) -> None:
         """Missing modulation_enabled column defaults to False."""
-        csv_path = tmp_path / "no_mod_col.csv"
-        csv_path.write_text(
-            "# instrument_type: signal_generator\n"
-            "duration,frequency,power\n"
-            "1.0,1000000,0\n"
-        )
-
-        result = read_test_plan(csv_path)
+        result = _parse_plan_csv(_make_sg_csv())
 
         assert result.errors == []
         assert result.plan is not None
         assert result.plan.steps[0].modulation_enabled is False
 
-    def test_invalid_modulation_enabled_value_returns_error(
-        self, tmp_path: Path
-    ) -> None:
+    def test_invalid_modulation_enabled_value_returns_error(self) -> None:
         """Invalid modulation_enabled value returns error."""
-        csv_path = tmp_path / "bad_mod_enabled.csv"
-        csv_path.write_text(
+        result = _parse_plan_csv(
             "# instrument_type: signal_generator\n"
             "duration,frequency,power,modulation_enabled\n"
             "1.0,1000000,0,maybe\n"
         )
 
-        result = read_test_plan(csv_path)
+        _assert_rejected(result, "modulation_enabled", ignore_case=False)
 
-        assert result.plan is None
-        assert any("modulation_enabled" in e for e in result.errors)
-
-    def test_invalid_am_depth_value_returns_error(self, tmp_path: Path) -> None:
+    def test_invalid_am_depth_value_returns_error(self) -> None:
         """Invalid am_depth value returns error."""
-        csv_path = tmp_path / "bad_depth.csv"
-        csv_path.write_text(
+        result = _parse_plan_csv(
             "# instrument_type: signal_generator\n"
             "# modulation_type: am\n"
             "# modulation_frequency: 1000\n"
@@ -644,15 +598,11 @@ class TestReadSignalGeneratorPlanWithModulation:
             "1.0,1000000,0\n"
         )
 
-        result = read_test_plan(csv_path)
+        _assert_rejected(result, "am_depth", ignore_case=False)
 
-        assert result.plan is None
-        assert any("am_depth" in e for e in result.errors)
-
-    def test_am_depth_out_of_range_returns_error(self, tmp_path: Path) -> None:
+    def test_am_depth_out_of_range_returns_error(self) -> None:
         """AM depth outside 0-100 range returns error."""
-        csv_path = tmp_path / "depth_over.csv"
-        csv_path.write_text(
+        result = _parse_plan_csv(
             "# instrument_type: signal_generator\n"
             "# modulation_type: am\n"
             "# modulation_frequency: 1000\n"
@@ -661,15 +611,11 @@ class TestReadSignalGeneratorPlanWithModulation:
             "1.0,1000000,0\n"
         )
 
-        result = read_test_plan(csv_path)
-
-        assert result.plan is None
-        assert any("0-100" in e for e in result.errors)
+        _assert_rejected(result, "0-100", ignore_case=False)
 
-    def test_invalid_modulation_frequency_returns_error(self, tmp_path: Path) -> None:
+    def test_invalid_modulation_frequency_returns_error(self) -> None:
         """Invalid modulation_frequency value returns error."""
-        csv_path = tmp_path / "bad_freq.csv"
-        csv_path.write_text(
+        result = _parse_plan_csv(
             "# instrument_type: signal_generator\n"
             "# modulation_type: am\n"
             "# modulation_frequency: notanumber\n"
@@ -678,15 +624,11 @@ class TestReadSignalGeneratorPlanWithModulation:
             "1.0,1000000,0\n"
         )
 
-        result = read_test_plan(csv_path)
-
-        assert result.plan is None
-        assert any("modulation_frequency" in e for e in result.errors)
+        _assert_rejected(result, "modulation_frequency", ignore_case=False)
 
-    def test_zero_modulation_frequency_returns_error(self, tmp_path: Path) -> None:
+    def test_zero_modulation_frequency_returns_error(self) -> None:
         """Zero modulation_frequency returns error."""
-        csv_path = tmp_path / "zero_freq.csv"
-        csv_path.write_text(
+        result = _parse_plan_csv(
             "# instrument_type: signal_generator\n"
             "# modulation_type: am\n"
             "# modulation_frequency: 0\n"
@@ -695,113 +637,35 @@ class TestReadSignalGeneratorPlanWithModulation:
             "1.0,1000000,0\n"
         )
 
-        result = read_test_plan(csv_path)
-
-        assert result.plan is None
-        assert any("modulation_frequency must be > 0" in e for e in result.errors)
+        _assert_rejected(
+            result, "modulation_frequency must be > 0", ignore_case=False
+        )
 
 
 class TestReadSignalGeneratorPlanModulationValidationFixtures:
     """Tests for signal generator modulation validation using fixture files."""
 
-    def test_missing_am_depth_fixture_returns_error(
-        self, test_plan_fixtures_path: Path
-    ) -> None:
-        """Missing am_depth in fixture file returns error."""
-        result = read_test_plan(
-            test_plan_fixtures_path / "invalid_sg_missing_am_depth.csv"
-        )
-
-        assert result.plan is None
-        assert any("am_depth" in e for e in result.errors)
-
-    def test_missing_fm_deviation_fixture_returns_error(
-        self, test_plan_fixtures_path: Path
-    ) -> None:
-        """Missing fm_deviation in fixture file returns error."""
-        result = read_test_plan(
-            test_plan_fixtures_path / "invalid_sg_missing_fm_deviation.csv"
-        )
-
-        assert result.plan is None
-        assert any("fm_deviation" in e for e in result.errors)
-
-    def test_missing_modulation_frequency_fixture_returns_error(
-        self, test_plan_fixtures_path: Path
-    ) -> None:
-        """Missing modulation_frequency in fixture file returns error."""
-        result = read_test_plan(
-            test_plan_fixtures_path / "invalid_sg_missing_mod_freq.csv"
-        )
-
-        assert result.plan is None
-        assert any("modulation_frequency" in e for e in result.errors)
-
-    def test_bad_modulation_type_fixture_returns_error(
-        self, test_plan_fixtures_path: Path
-    ) -> None:
-        """Invalid modulation_type in fixture file returns error."""
-        result = read_test_plan(
-            test_plan_fixtures_path / "invalid_sg_bad_modulation_type.csv"
-        )
-
-        assert result.plan is None
-        assert any("invalid modulation_type" in e.lower() for e in result.errors)
-
-    def test_am_depth_over_100_fixture_returns_error(
-        self, test_plan_fixtures_path: Path
-    ) -> None:
-        """AM depth over 100% in fixture file returns error."""
-        result = read_test_plan(
-            test_plan_fixtures_path / "invalid_sg_am_depth_over_100.csv"
-        )
-
-        assert result.plan is None
-        assert any("0-100" in e for e in result.errors)
-
-    def test_negative_am_depth_fixture_returns_error(
-        self, test_plan_fixtures_path: Path
-    ) -> None:
-        """Negative AM depth in fixture file returns error."""
-        result = read_test_plan(
-            test_plan_fixtures_path / "invalid_sg_negative_am_depth.csv"
-        )
-
-        assert result.plan is None
-        assert any("0-100" in e for e in result.errors)
-
-    def test_zero_modulation_frequency_fixture_returns_error(
-        self, test_plan_fixtures_path: Path
-    ) -> None:
-        """Zero modulation_frequency in fixture file returns error."""
-        result = read_test_plan(
-            test_plan_fixtures_path / "invalid_sg_zero_mod_freq.csv"
-        )
-
-        assert result.plan is None
-        assert any("modulation_frequency must be > 0" in e for e in result.errors)
-
-    def test_negative_fm_deviation_fixture_returns_error(
-        self, test_plan_fixtures_path: Path
-    ) -> None:
-        """Negative FM deviation in fixture file returns error."""
-        result = read_test_plan(
-            test_plan_fixtures_path / "invalid_sg_negative_fm_deviation.csv"
-        )
-
-        assert result.plan is None
-        assert any("fm_deviation must be > 0" in e for e in result.errors)
-
-    def test_bad_modulation_enabled_value_fixture_returns_error(
-        self, test_plan_fixtures_path: Path
+    @pytest.mark.parametrize(
+        "filename,needle",
+        [
+            ("invalid_sg_missing_am_depth.csv", "am_depth"),
+            ("invalid_sg_missing_fm_deviation.csv", "fm_deviation"),
+            ("invalid_sg_missing_mod_freq.csv", "modulation_frequency"),
+            ("invalid_sg_bad_modulation_type.csv", "Invalid modulation_type"),
+            ("invalid_sg_am_depth_over_100.csv", "0-100"),
+            ("invalid_sg_negative_am_depth.csv", "0-100"),
+            ("invalid_sg_zero_mod_freq.csv", "modulation_frequency must be > 0"),
+            ("invalid_sg_negative_fm_deviation.csv", "fm_deviation must be > 0"),
+            ("invalid_sg_bad_mod_enabled_value.csv", "modulation_enabled"),
+        ],
+    )
+    def test_invalid_fixture_returns_error(
+        self, test_plan_fixtures_path: Path, filename: str, needle: str
     ) -> None:
-        """Invalid modulation_enabled value in fixture file returns error."""
-        result = read_test_plan(
-            test_plan_fixtures_path / "invalid_sg_bad_mod_enabled_value.csv"
-        )
+        """Each invalid modulation fixture file is rejected with its error."""
+        result = read_test_plan(test_plan_fixtures_path / filename)
 
-        assert result.plan is None
-        assert any("modulation_enabled" in e for e in result.errors)
+        _assert_rejected(result, needle, ignore_case=False)
 
     def test_valid_am_fixture_loads_correctly(
         self, test_plan_fixtures_path: Path
@@ -839,51 +703,46 @@ class TestReadSignalGeneratorPlanModulationValidationFixtures:
 class TestHardLimitValidation:
     """Tests for hard limit validation during parsing (errors that block loading)."""
 
-    def test_power_below_hard_minimum_returns_error(self, tmp_path: Path) -> None:
+    def test_power_below_hard_minimum_returns_error(self) -> None:
         """Power below -200 dBm returns error."""
-        result = _parse_plan_csv(tmp_path, _make_sg_csv(power=-250))
+        result = _parse_plan_csv(_make_sg_csv(power=-250))
 
-        assert result.plan is None
-        assert any("power" in e.lower() and "-200" in e for e in result.errors)
+        _assert_rejected(result, "power", "-200")
 
-    def test_power_above_hard_maximum_returns_error(self, tmp_path: Path) -> None:
+    def test_power_above_hard_maximum_returns_error(self) -> None:
         """Power above +60 dBm returns error."""
-        result = _parse_plan_csv(tmp_path, _make_sg_csv(power=100))
+        result = _parse_plan_csv(_make_sg_csv(power=100))
 
-        assert result.plan is None
-        assert any("power" in e.lower() and "60" in e for e in result.errors)
+        _assert_rejected(result, "power", "60")
 
-    def test_frequency_above_hard_maximum_returns_error(self, tmp_path: Path) -> None:
+    def test_frequency_above_hard_maximum_returns_error(self) -> None:
         """Frequency above 100 THz returns error."""
-        result = _parse_plan_csv(tmp_path, _make_sg_csv(frequency=200000000000000))
+        result = _parse_plan_csv(_make_sg_csv(frequency=200000000000000))
 
-        assert result.plan is None
-        assert any("frequency" in e.lower() and "exceeds" in e.lower() for e in result.errors)
+        _assert_rejected(result, "frequency", "exceeds")
 
-    def test_voltage_above_hard_maximum_returns_error(self, tmp_path: Path) -> None:
+    def test_voltage_above_hard_maximum_returns_error(self) -> None:
         """Voltage above 10kV returns error."""
-        result = _parse_plan_csv(tmp_path, _make_ps_csv(voltage=15000))
+        result = _parse_plan_csv(_make_ps_csv(voltage=15000))
 
-        assert result.plan is None
-        assert any("voltage" in e.lower() and "exceeds" in e.lower() for e in result.errors)
+        _assert_rejected(result, "voltage", "exceeds")
 
-    def test_current_above_hard_maximum_returns_error(self, tmp_path: Path) -> None:
+    def test_current_above_hard_maximum_returns_error(self) -> None:
         """Current above 1000A returns error."""
-        result = _parse_plan_csv(tmp_path, _make_ps_csv(current=1500))
+        result = _parse_plan_csv(_make_ps_csv(current=1500))
 
-        assert result.plan is None
-        assert any("current" in e.lower() and "exceeds" in e.lower() for e in result.errors)
+        _assert_rejected(result, "current", "exceeds")
 
-    def test_power_at_hard_minimum_is_valid(self, tmp_path: Path) -> None:
+    def test_power_at_hard_minimum_is_valid(self) -> None:
         """Power exactly at -200 dBm is valid."""
-        result = _parse_plan_csv(tmp_path, _make_sg_csv(power=-200))
+        result = _parse_plan_csv(_make_sg_csv(power=-200))
 
         assert result.errors == []
         assert result.plan is not None
 
-    def test_power_at_hard_maximum_is_valid(self, tmp_path: Path) -> None:
+    def test_power_at_hard_maximum_is_valid(self) -> None:
         """Power exactly at +60 dBm is valid."""
-        result = _parse_plan_csv(tmp_path, _make_sg_csv(power=60))
+        result = _parse_plan_csv(_make_sg_csv(power=60))
 
         assert result.errors == []
         assert result.plan is not None
@@ -892,108 +751,106 @@ class TestHardLimitValidation:
 class TestSoftLimitValidation:
     """Tests for soft limit validation (warnings that allow loading)."""
 
-    def test_power_below_soft_minimum_returns_warning(self, tmp_path: Path) -> None:
+    def test_power_below_soft_minimum_returns_warning(self) -> None:
         """Power below soft limit generates warning but plan loads."""
         limits = ValidationLimits()
         result = _parse_plan_csv(
-            tmp_path, _make_sg_csv(power=-150), soft_limits=limits
+            _make_sg_csv(power=-150), soft_limits=limits
         )
 
         assert result.errors == []
         assert result.plan is not None
         assert len(result.warnings) >= 1
-        assert any("power" in w.lower() and "noise floor" in w.lower() for w in result.warnings)
+        assert _mentions(result.warnings, "power", "noise floor")
 
-    def test_power_above_soft_maximum_returns_warning(self, tmp_path: Path) -> None:
+    def test_power_above_soft_maximum_returns_warning(self) -> None:
         """Power above soft limit generates warning but plan loads."""
         limits = ValidationLimits()
         result = _parse_plan_csv(
-            tmp_path, _make_sg_csv(power=50), soft_limits=limits
+            _make_sg_csv(power=50), soft_limits=limits
         )
 
         assert result.errors == []
         assert result.plan is not None
         assert len(result.warnings) >= 1
-        assert any("power" in w.lower() and "exceeds" in w.lower() for w in result.warnings)
+        assert _mentions(result.warnings, "power", "exceeds")
 
-    def test_frequency_below_soft_minimum_returns_warning(self, tmp_path: Path) -> None:
+    def test_frequency_below_soft_minimum_returns_warning(self) -> None:
         """Frequency below soft limit generates warning but plan loads."""
         limits = ValidationLimits()
         result = _parse_plan_csv(
-            tmp_path, _make_sg_csv(frequency=0.5), soft_limits=limits
+            _make_sg_csv(frequency=0.5), soft_limits=limits
         )
 
         assert result.errors == []
         assert result.plan is not None
         assert len(result.warnings) >= 1
-        assert any("frequency" in w.lower() and "low" in w.lower() for w in result.warnings)
+        assert _mentions(result.warnings, "frequency", "low")
 
-    def test_voltage_above_soft_maximum_returns_warning(self, tmp_path: Path) -> None:
+    def test_voltage_above_soft_maximum_returns_warning(self) -> None:
         """Voltage above soft limit generates warning but plan loads."""
         limits = ValidationLimits()
         result = _parse_plan_csv(
-            tmp_path, _make_ps_csv(voltage=200), soft_limits=limits
+            _make_ps_csv(voltage=200), soft_limits=limits
         )
 
         assert result.errors == []
         assert result.plan is not None
         assert len(result.warnings) >= 1
-        assert any("voltage" in w.lower() and "exceeds" in w.lower() for w in result.warnings)
+        assert _mentions(result.warnings, "voltage", "exceeds")
 
-    def test_duration_above_soft_maximum_returns_warning(self, tmp_path: Path) -> None:
+    def test_duration_above_soft_maximum_returns_warning(self) -> None:
         """Duration above soft limit generates warning but plan loads."""
         limits = ValidationLimits()
         result = _parse_plan_csv(
-            tmp_path, _make_ps_csv(duration=100000), soft_limits=limits
+            _make_ps_csv(duration=100000), soft_limits=limits
         )
 
         assert result.errors == []
         assert result.plan is not None
         assert len(result.warnings) >= 1
-        assert any("duration" in w.lower() for w in result.warnings)
+        assert _mentions(result.warnings, "duration")
 
-    def test_custom_soft_limits_respected(self, tmp_path: Path) -> None:
+    def test_custom_soft_limits_respected(self) -> None:
         """Custom soft limits from config are used."""
         custom_sg_limits = SignalGeneratorSoftLimits(power_max_dbm=10.0)
         limits = ValidationLimits(signal_generator=custom_sg_limits)
         result = _parse_plan_csv(
-            tmp_path, _make_sg_csv(power=15), soft_limits=limits
+            _make_sg_csv(power=15), soft_limits=limits
         )
 
         assert result.errors == []
         assert result.plan is not None
         assert len(result.warnings) >= 1
-        assert any("power" in w.lower() for w in result.warnings)
+        assert _mentions(result.warnings, "power")
 
-    def test_no_warnings_for_valid_values(self, tmp_path: Path) -> None:
+    def test_no_warnings_for_valid_values(self) -> None:
         """Values within soft limits generate no warnings."""
         limits = ValidationLimits()
-        result = _parse_plan_csv(tmp_path, _make_sg_csv(), soft_limits=limits)
+        result = _parse_plan_csv(_make_sg_csv(), soft_limits=limits)
 
         assert result.errors == []
         assert result.plan is not None
         assert result.warnings == []
 
-    def test_multiple_warnings_accumulated(self, tmp_path: Path) -> None:
+    def test_multiple_warnings_accumulated(self) -> None:
         """Multiple soft limit violations generate multiple warnings."""
-        csv_path = tmp_path / "multiple_warnings.csv"
-        csv_path.write_text(
+        limits = ValidationLimits()
+        result = _parse_plan_csv(
             "# instrument_type: signal_generator\n"
             "duration,frequency,power\n"
             "1.0,1000000,-150\n"  # Power below soft limit
-            "1.0,1000000,50\n"  # Power above soft limit
+            "1.0,1000000,50\n",  # Power above soft limit
+            soft_limits=limits,
         )
 
-        limits = ValidationLimits()
-        result = read_test_plan(csv_path, soft_limits=limits)
-
         assert result.errors == []
         assert result.plan is not None
         assert len(result.warnings) >= 2
 
-    def test_soft_limit_validation_skipped_without_limits(self, tmp_path: Path) -> None:
+    def test_soft_limit_validation_skipped_without_limits(self) -> None:
         """Without soft_limits parameter, no warnings are generated."""
-        result = _parse_plan_csv(tmp_path, _make_sg_csv(power=-150))
+        result = _parse_plan_csv(_make_sg_csv(power=-150))
 
         assert result.errors == []
         assert result.plan is not None
@@ -1003,33 +860,26 @@ class TestSoftLimitValidation:
 class TestTestPlanResult:
     """Tests for TestPlanResult dataclass."""
 
-    def test_result_with_successful_parse(self, tmp_path: Path) -> None:
+    def test_result_with_successful_parse(self) -> None:
         """Result with successful parse has plan and empty error list."""
-        result = _parse_plan_csv(tmp_path, _make_ps_csv())
+        result = _parse_plan_csv(_make_ps_csv())
 
         assert result.plan is not None
         assert result.errors == []
         assert result.warnings == []
 
-    def test_result_with_errors_has_no_plan(self, tmp_path: Path) -> None:
+    def test_result_with_errors_has_no_plan(self) -> None:
         """Result with errors has None plan."""
-        csv_path = tmp_path / "invalid.csv"
-        csv_path.write_text(
-            "# instrument_type: power_supply\n"
-            "duration,voltage,current\n"
-            "invalid,5.0,1.0\n"
-        )
-
-        result = read_test_plan(csv_path)
+        result = _parse_plan_csv(_PS_INVALID_ROW_CSV)
 
         assert result.plan is None
         assert len(result.errors) >= 1
 
-    def test_result_with_warnings_has_plan(self, tmp_path: Path) -> None:
+    def test_result_with_warnings_has_plan(self) -> None:
         """Result with warnings still has valid plan."""
         limits = ValidationLimits()
         result = _parse_plan_csv(
-            tmp_path, _make_sg_csv(power=-150), soft_limits=limits
+            _make_sg_csv(power=-150), soft_limits=limits
         )
 
         assert result.plan is not None
@@ -1045,18 +895,16 @@ class TestFileIOEdgeCases:
         from unittest.mock import patch
 
         csv_path = tmp_path / "readable.csv"
-        csv_path.write_text("# instrument_type: power_supply\n")
+        csv_path.write_bytes(b"# instrument_type: power_supply\n")
 
         with patch("builtins.open", side_effect=OSError("Permission denied")):
             result = read_test_plan(csv_path)
 
-        assert result.plan is None
-        assert any("error reading file" in e.lower() for e in result.errors)
+        _assert_rejected(result, "error reading file")
 
-    def test_non_numeric_fm_deviation_returns_error(self, tmp_path: Path) -> None:
+    def test_non_numeric_fm_deviation_returns_error(self) -> None:
         """Non-numeric fm_deviation value returns parse error."""
-        csv_path = tmp_path / "bad_fm_dev.csv"
-        csv_path.write_text(
+        result = _parse_plan_csv(
             "# instrument_type: signal_generator\n"
             "# modulation_type: fm\n"
             "# modulation_frequency: 1000\n"
@@ -1065,43 +913,33 @@ class TestFileIOEdgeCases:
             "1.0,1000000,0\n"
         )
 
-        result = read_test_plan(csv_path)
+        _assert_rejected(result, "invalid fm_deviation")
 
-        assert result.plan is None
-        assert any("invalid fm_deviation" in e.lower() for e in result.errors)
-
-    def test_frequency_above_soft_max_returns_warning(self, tmp_path: Path) -> None:
+    def test_frequency_above_soft_max_returns_warning(self) -> None:
         """Frequency above soft limit maximum generates warning."""
         limits = ValidationLimits()
         result = _parse_plan_csv(
-            tmp_path, _make_sg_csv(frequency=60e9), soft_limits=limits
+            _make_sg_csv(frequency=60e9), soft_limits=limits
         )
 
         assert result.errors == []
         assert result.plan is not None
-        assert any("frequency" in w.lower() and "exceeds" in w.lower() for w in result.warnings)
+        assert _mentions(result.warnings, "frequency", "exceeds")
 
-    def test_current_above_soft_max_returns_warning(self, tmp_path: Path) -> None:
+    def test_current_above_soft_max_returns_warning(self) -> None:
         """Current above soft limit generates warning."""
         limits = ValidationLimits()
         result = _parse_plan_csv(
-            tmp_path, _make_ps_csv(current=100), soft_limits=limits
+            _make_ps_csv(current=100), soft_limits=limits
         )
 
         assert result.errors == []
         assert result.plan is not None
-        assert any("current" in w.lower() and "exceeds" in w.lower() for w in result.warnings)
+        assert _mentions(result.warnings, "current", "exceeds")
 
-    def test_all_rows_invalid_returns_no_steps_error(self, tmp_path: Path) -> None:
+    def test_all_rows_invalid_returns_no_steps_error(self) -> None:
         """CSV with all invalid rows returns 'no valid steps' error."""
-        csv_path = tmp_path / "all_invalid.csv"
-        csv_path.write_text(
-            "# instrument_type: power_supply\n"
-            "duration,voltage,current\n"
-            "invalid,5.0,1.0\n"
-        )
-
-        result = read_test_plan(csv_path)
+        result = _parse_plan_csv(_PS_INVALID_ROW_CSV)
 
         assert result.plan is None
         assert len(result.errors) >= 1
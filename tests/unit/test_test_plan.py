@@ -458,6 +458,50 @@ class TestTestPlanGetStep:
         assert plan.get_step(1) is None
 
 
+class TestTestPlanTypedGetStep:
+    """Tests for TestPlan.get_power_supply_step and get_signal_generator_step."""
+
+    def test_get_power_supply_step(self) -> None:
+        """get_power_supply_step returns the power supply step by number."""
+        step = PowerSupplyTestStep(step_number=1, duration_seconds=1.0, voltage=5.0)
+        plan = TestPlan(name="Test", plan_type=PLAN_TYPE_POWER_SUPPLY, steps=[step])
+        assert plan.get_power_supply_step(1) is step
+
+    def test_get_signal_generator_step(self) -> None:
+        """get_signal_generator_step returns the signal generator step by number."""
+        step = SignalGeneratorTestStep(
+            step_number=1, duration_seconds=1.0, frequency=1e6
+        )
+        plan = TestPlan(name="Test", plan_type=PLAN_TYPE_SIGNAL_GENERATOR, steps=[step])
+        assert plan.get_signal_generator_step(1) is step
+
+    def test_typed_get_step_returns_none_for_invalid_number(self) -> None:
+        """Typed accessors return None for non-existent step numbers."""
+        plan = TestPlan(name="Test", plan_type=PLAN_TYPE_POWER_SUPPLY)
+        assert plan.get_power_supply_step(1) is None
+        assert plan.get_signal_generator_step(1) is None
+
+    def test_get_power_supply_step_wrong_type_raises(self) -> None:
+        """get_power_supply_step raises TypeError for a signal generator step."""
+        plan = TestPlan(
+            name="Test",
+            plan_type=PLAN_TYPE_SIGNAL_GENERATOR,
+            steps=[SignalGeneratorTestStep(step_number=1, duration_seconds=1.0)],
+        )
+        with pytest.raises(TypeError, match="not a PowerSupplyTestStep"):
+            plan.get_power_supply_step(1)
+
+    def test_get_signal_generator_step_wrong_type_raises(self) -> None:
+        """get_signal_generator_step raises TypeError for a power supply step."""
+        plan = TestPlan(
+            name="Test",
+            plan_type=PLAN_TYPE_POWER_SUPPLY,
+            steps=[PowerSupplyTestStep(step_number=1, duration_seconds=1.0)],
+        )
+        with pytest.raises(TypeError, match="not a SignalGeneratorTestStep"):
+            plan.get_signal_generator_step(1)
+
+
 class TestTestPlanValidation:
     """Tests for TestPlan.validate method."""
 
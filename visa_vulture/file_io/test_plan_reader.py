@@ -13,6 +13,7 @@ import io
 import logging
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import TextIO
 
 from ..config.schema import ValidationLimits
 from ..model.test_plan import (
@@ -74,11 +75,13 @@ VALID_MODULATION_TYPES = {"am", "fm"}
 
 
 def read_test_plan(
-    file_path: str | Path,
+    file_path: str | Path | TextIO,
     soft_limits: ValidationLimits | None = None,
+    *,
+    name: str | None = None,
 ) -> TestPlanResult:
     """
-    Read a test plan from a CSV file.
+    Read a test plan from a CSV file or an open text stream.
 
     The plan type is determined by required '# instrument_type' metadata
     at the top of the CSV file. Step numbers are automatically calculated
@@ -97,24 +100,41 @@ def read_test_plan(
         ...
 
     Args:
-        file_path: Path to CSV file
+        file_path: Path to CSV file, or a text stream (e.g. io.StringIO)
+            already positioned at the start of the CSV content
         soft_limits: Optional ValidationLimits for soft limit checking.
             If provided, values exceeding soft limits generate warnings.
             If None, soft limit validation is skipped.
+        name: Plan name. Defaults to the file name stem, or to the
+            stream's ``name`` stem (falling back to "untitled") for streams.
 
     Returns:
         TestPlanResult with plan (or None if errors), errors list, and warnings list
     """
-    file_path = Path(file_path)
-
-    if not file_path.exists():
-        return TestPlanResult(plan=None, errors=[f"File not found: {file_path}"])
-
-    try:
-        with open(file_path, "r", encoding="utf-8", newline="") as f:
-            file_content = f.read()
-    except OSError as e:
-        return TestPlanResult(plan=None, errors=[f"Error reading file: {e}"])
+    if isinstance(file_path, (str, Path)):
+        file_path = Path(file_path)
+
+        if not file_path.exists():
+            return TestPlanResult(plan=None, errors=[f"File not found: {file_path}"])
+
+        try:
+            with open(file_path, "r", encoding="utf-8", newline="") as f:
+                file_content = f.read()
+        except (OSError, UnicodeDecodeError) as e:
+            return TestPlanResult(plan=None, errors=[f"Error reading file: {e}"])
+        source = str(file_path)
+        plan_name = name or file_path.stem
+    else:
+        try:
+            file_content = file_path.read()
+        except (OSError, UnicodeDecodeError) as e:
+            return TestPlanResult(plan=None, errors=[f"Error reading file: {e}"])
+        # Streams opened from a file descriptor have an int name
+        stream_name = getattr(file_path, "name", None)
+        if not isinstance(stream_name, str):
+            stream_name = None
+        source = stream_name or "<stream>"
+        plan_name = name or Path(stream_name or "untitled").stem
 
     metadata, csv_content = _parse_metadata(file_content)
 
@@ -145,7 +165,7 @@ def read_test_plan(
 
     try:
         return _parse_csv_content(
-            csv_content, metadata, file_path, plan_type, soft_limits
+            csv_content, metadata, source, plan_name, plan_type, soft_limits
         )
     except csv.Error as e:
         return TestPlanResult(plan=None, errors=[f"CSV parsing error: {e}"])
@@ -154,7 +174,8 @@ def read_test_plan(
 def _parse_csv_content(
     csv_content: str,
     metadata: dict[str, str],
-    file_path: Path,
+    source: str,
+    plan_name: str,
     plan_type: str,
     soft_limits: ValidationLimits | None,
 ) -> TestPlanResult:
@@ -196,7 +217,7 @@ def _parse_csv_content(
 
     # Parse rows into steps
     plan, parse_errors = _parse_test_plan(
-        file_path, rows, column_map, errors, plan_type
+        source, plan_name, rows, column_map, errors, plan_type
     )
     if parse_errors:
         return TestPlanResult(plan=None, errors=parse_errors)
@@ -254,7 +275,8 @@ def _parse_metadata(file_content: str) -> tuple[dict[str, str], str]:
 
 
 def _parse_test_plan(
-    file_path: Path,
+    source: str,
+    plan_name: str,
     rows: list[dict[str, str]],
     column_map: dict[str, str],
     errors: list[str],
@@ -291,7 +313,6 @@ def _parse_test_plan(
         errors.append("No valid steps found in CSV")
         return None, errors
 
-    plan_name = file_path.stem
     test_plan = TestPlan(name=plan_name, steps=steps, plan_type=plan_type)
 
     validation_errors = test_plan.validate()
@@ -303,7 +324,7 @@ def _parse_test_plan(
         "Loaded %s test plan '%s' from %s: %d steps",
         plan_type,
         plan_name,
-        file_path,
+        source,
         len(steps),
     )
     return test_plan, []
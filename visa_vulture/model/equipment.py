@@ -1,6 +1,7 @@
 """Equipment model - core business logic."""
 
 import logging
+import threading
 import time
 from typing import Callable, Sequence
 
@@ -21,6 +22,12 @@ logger = logging.getLogger(__name__)
 TestProgressCallback = Callable[[int, int, TestStep], None]
 TestCompleteCallback = Callable[[bool, str], None]
 
+# Instrument type required by each known plan type
+_PLAN_TYPE_TO_INSTRUMENT_TYPE: dict[str, str] = {
+    PLAN_TYPE_POWER_SUPPLY: "power_supply",
+    PLAN_TYPE_SIGNAL_GENERATOR: "signal_generator",
+}
+
 
 class EquipmentModel:
     """
@@ -45,6 +52,8 @@ class EquipmentModel:
         self._stop_requested = False
         self._pause_requested = False
         self._time_remaining_in_step: float | None = None
+        # Set whenever a stop/pause/resume request arrives to wake the sleeper
+        self._wake_event = threading.Event()
 
         # Callbacks for test execution
         self._progress_callbacks: list[TestProgressCallback] = []
@@ -73,15 +82,13 @@ class EquipmentModel:
     def is_plan_type_compatible(self, plan_type: str) -> bool:
         """Check if a plan type is compatible with the connected instrument.
 
-        Returns True if compatible or if no instrument is connected.
+        Returns True if compatible, if no instrument is connected, or if the
+        plan type is not one this model knows about.
         """
-        if self._instrument_type is None:
+        required_type = _PLAN_TYPE_TO_INSTRUMENT_TYPE.get(plan_type)
+        if required_type is None or self._instrument_type is None:
             return True
-        if plan_type == PLAN_TYPE_POWER_SUPPLY:
-            return self._instrument_type == "power_supply"
-        if plan_type == PLAN_TYPE_SIGNAL_GENERATOR:
-            return self._instrument_type == "signal_generator"
-        return True
+        return self._instrument_type == required_type
 
     def register_state_callback(
         self, callback: Callable[[EquipmentState, EquipmentState], None]
@@ -90,12 +97,34 @@ class EquipmentModel:
         self._state_machine.register_callback(callback)
 
     def register_progress_callback(self, callback: TestProgressCallback) -> None:
-        """Register callback for test progress updates."""
-        self._progress_callbacks.append(callback)
+        """Register callback for test progress updates.
+
+        The callback is wrapped once here so that exceptions it raises are
+        logged rather than propagated into test execution.
+        """
+
+        def guarded(current: int, total: int, step: TestStep) -> None:
+            try:
+                callback(current, total, step)
+            except Exception as e:
+                logger.error("Error in progress callback: %s", e)
+
+        self._progress_callbacks.append(guarded)
 
     def register_complete_callback(self, callback: TestCompleteCallback) -> None:
-        """Register callback for test completion."""
-        self._complete_callbacks.append(callback)
+        """Register callback for test completion.
+
+        The callback is wrapped once here so that exceptions it raises are
+        logged rather than propagated to the caller of run_test.
+        """
+
+        def guarded(success: bool, message: str) -> None:
+            try:
+                callback(success, message)
+            except Exception as e:
+                logger.error("Error in complete callback: %s", e)
+
+        self._complete_callbacks.append(guarded)
 
     def scan_resources(self) -> list[str]:
         """
@@ -286,6 +315,7 @@ class EquipmentModel:
 
         self._stop_requested = False
         self._pause_requested = False
+        self._wake_event.clear()
         self._state_machine.to_running()
 
         try:
@@ -322,18 +352,21 @@ class EquipmentModel:
             logger.info("Stop requested")
             self._stop_requested = True
             self._pause_requested = False  # Clear pause flag so loop can exit
+            self._wake_event.set()
 
     def pause_test(self) -> None:
         """Request test execution to pause."""
         if self._state_machine.state == EquipmentState.RUNNING:
             logger.info("Pause requested")
             self._pause_requested = True
+            self._wake_event.set()
 
     def resume_test(self) -> None:
         """Request test execution to resume."""
         if self._state_machine.state == EquipmentState.PAUSED:
             logger.info("Resume requested")
             self._pause_requested = False
+            self._wake_event.set()
 
     def _execute_plan_loop(
         self,
@@ -486,44 +519,57 @@ class EquipmentModel:
             signal_gen.disable_output()
 
     def _interruptible_sleep(self, duration: float) -> None:
-        """Sleep that can be interrupted by stop or pause request."""
-        remaining = duration
+        """Sleep that can be interrupted by stop or pause request.
+
+        Waits on _wake_event against a monotonic deadline, so stop, pause
+        and resume requests take effect immediately instead of on the next
+        polling tick.
+        """
+        if duration <= 0.0 or self._stop_requested:
+            return
+
+        deadline = time.monotonic() + duration
+
+        while True:
+            # Clear before checking the flags so a request made after the
+            # check still wakes the wait below
+            self._wake_event.clear()
+
+            if self._stop_requested:
+                break
 
-        while remaining > 0 and not self._stop_requested:
             if self._pause_requested:
                 # Store remaining time for this step
-                self._time_remaining_in_step = remaining
+                self._time_remaining_in_step = max(deadline - time.monotonic(), 0.0)
 
                 # Transition to PAUSED state
                 self._state_machine.to_paused()
 
                 # Wait until resumed or stopped
                 while self._pause_requested and not self._stop_requested:
-                    time.sleep(0.1)
+                    self._wake_event.wait()
+                    self._wake_event.clear()
 
-                if not self._stop_requested:
-                    # Resumed - continue with remaining time
-                    remaining = self._time_remaining_in_step or remaining
-                    self._time_remaining_in_step = None
-                    self._state_machine.to_running()
-            else:
-                # Normal sleep chunk
-                sleep_chunk = min(0.1, remaining)
-                time.sleep(sleep_chunk)
-                remaining -= sleep_chunk
+                if self._stop_requested:
+                    break
+
+                # Resumed - continue with remaining time
+                deadline = time.monotonic() + (self._time_remaining_in_step or 0.0)
+                self._time_remaining_in_step = None
+                self._state_machine.to_running()
+                continue
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            self._wake_event.wait(remaining)
 
     def _notify_progress(self, current: int, total: int, step: TestStep) -> None:
-        """Notify progress callbacks."""
+        """Notify progress callbacks (already guarded at registration)."""
         for callback in self._progress_callbacks:
-            try:
-                callback(current, total, step)
-            except Exception as e:
-                logger.error("Error in progress callback: %s", e)
+            callback(current, total, step)
 
     def _notify_complete(self, success: bool, message: str) -> None:
-        """Notify completion callbacks."""
+        """Notify completion callbacks (already guarded at registration)."""
         for callback in self._complete_callbacks:
-            try:
-                callback(success, message)
-            except Exception as e:
-                logger.error("Error in complete callback: %s", e)
+            callback(success, message)
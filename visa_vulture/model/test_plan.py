@@ -197,6 +197,50 @@ class TestPlan:
                 return step
         return None
 
+    def get_power_supply_step(self, step_number: int) -> PowerSupplyTestStep | None:
+        """
+        Get a power supply step by number.
+
+        Args:
+            step_number: 1-based step number
+
+        Returns:
+            PowerSupplyTestStep or None if not found
+
+        Raises:
+            TypeError: If the step exists but is not a PowerSupplyTestStep
+        """
+        step = self.get_step(step_number)
+        if step is not None and not isinstance(step, PowerSupplyTestStep):
+            raise TypeError(
+                f"Step {step_number} is a {type(step).__name__}, "
+                "not a PowerSupplyTestStep"
+            )
+        return step
+
+    def get_signal_generator_step(
+        self, step_number: int
+    ) -> SignalGeneratorTestStep | None:
+        """
+        Get a signal generator step by number.
+
+        Args:
+            step_number: 1-based step number
+
+        Returns:
+            SignalGeneratorTestStep or None if not found
+
+        Raises:
+            TypeError: If the step exists but is not a SignalGeneratorTestStep
+        """
+        step = self.get_step(step_number)
+        if step is not None and not isinstance(step, SignalGeneratorTestStep):
+            raise TypeError(
+                f"Step {step_number} is a {type(step).__name__}, "
+                "not a SignalGeneratorTestStep"
+            )
+        return step
+
     def validate(self) -> list[str]:
         """
         Validate the test plan.
@@ -75,7 +75,7 @@ class TimerManager:
     ) -> None:
         """Start timers for a fresh run (from step 1)."""
         self._partial_total_duration = None
-        self._run_start_time = time.time()
+        self._run_start_time = time.monotonic()
         runtime_tick()
         plot_tick()
 
@@ -87,7 +87,7 @@ class TimerManager:
     ) -> None:
         """Start timers for a partial run (from a specific step)."""
         self._partial_total_duration = remaining_duration
-        self._run_start_time = time.time()
+        self._run_start_time = time.monotonic()
         runtime_tick()
         plot_tick()
 
@@ -103,7 +103,7 @@ class TimerManager:
         """
         if self._elapsed_at_pause is None:
             return False
-        self._run_start_time = time.time() - self._elapsed_at_pause
+        self._run_start_time = time.monotonic() - self._elapsed_at_pause
         self._elapsed_at_pause = None
         runtime_tick()
         plot_tick()
@@ -112,7 +112,7 @@ class TimerManager:
     def save_pause_state(self) -> None:
         """Save elapsed time when transitioning to PAUSED. Thread-safe."""
         if self._run_start_time is not None:
-            self._elapsed_at_pause = time.time() - self._run_start_time
+            self._elapsed_at_pause = time.monotonic() - self._run_start_time
 
     def cancel_runtime_timer(self) -> None:
         """Cancel the runtime timer scheduling. Must call from main thread."""
@@ -144,7 +144,7 @@ class TimerManager:
         """Get current elapsed seconds, or None if not running."""
         if self._run_start_time is None:
             return None
-        return time.time() - self._run_start_time
+        return time.monotonic() - self._run_start_time
 
     # --- Recurring schedule helpers (called by presenter tick callbacks) ---
 